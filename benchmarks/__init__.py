@@ -0,0 +1,5 @@
+"""Benchmark suite for the battle engine's hot paths
+
+Run with `python -m benchmarks`, see benchmarks.__main__ for the options. Only
+the standard library is used.
+"""
@@ -0,0 +1,67 @@
+"""Runs the benchmark suite
+
+Results are printed (or written with --output) as JSON. Given a --baseline from
+an earlier run, exits with status 1 if any benchmark is more than --threshold
+percent slower than its baseline. Baselines are machine specific, so store one
+per machine, e.g. with `python -m benchmarks --output baseline.json`.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks.suite import BENCHMARKS, compare, run
+
+RESULTS_VERSION = 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="substrings of benchmarks to run")
+    parser.add_argument("--output", help="file to write the results JSON to")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed slowdown percentage"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.names or any(part in name for part in args.names)
+    ]
+    results = run(names, args.repeat, args.min_time)
+    document = json.dumps(
+        {
+            "version": RESULTS_VERSION,
+            "python": platform.python_version(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(document + "\n")
+    else:
+        print(document)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("version") != RESULTS_VERSION:
+            print("Baseline results version is not supported", file=sys.stderr)
+            return 2
+        regressions = compare(results, baseline["results"], args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
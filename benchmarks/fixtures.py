@@ -0,0 +1,61 @@
+"""Canonical teams and abilities benchmarked by the suite, as in tests/conftest"""
+from __future__ import annotations
+
+from superautosim.abilities import Ability
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+SNIPE = {
+    "trigger": {"event": "START_OF_BATTLE"},
+    "action": {
+        "action": "DEAL_DAMAGE",
+        "target_generator": {
+            "target_generator": "BATTLEFIELD",
+            "filter": {"op": "SINGLE", "filter": "ENEMY"},
+            "selector": {"selector": "RANDOM"},
+        },
+        "damage": 1,
+    },
+}
+BUFF_BEHIND = {
+    "trigger": {"event": "FAINT", "modifiers": [{"type": "self"}]},
+    "action": {
+        "action": "ADD_STATS",
+        "target_generator": {
+            "target_generator": "BATTLEFIELD",
+            "filter": {
+                "op": "ALL",
+                "filters": [
+                    {"op": "SINGLE", "filter": "FRIENDLY"},
+                    {"op": "SINGLE", "filter": "BEHIND"},
+                ],
+            },
+            "selector": {"selector": "HEALTH", "highest": True},
+        },
+        "max_targets": 2,
+        "attack": 1,
+        "health": 1,
+    },
+}
+SUMMON = {
+    "trigger": {"event": "FAINT", "modifiers": [{"type": "self"}]},
+    "action": {"action": "SUMMON", "pet": "zombie", "count": 2},
+}
+
+
+def friendly_team() -> Team:
+    return Team([Pet(f"friend{i}", (i, i)) for i in range(1, 6)])
+
+
+def enemy_team() -> Team:
+    return Team([Pet(f"enemy{i}", (i, i)) for i in range(1, 6)])
+
+
+def ability_team(name: str) -> Team:
+    """A full team whose pets snipe, buff and summon"""
+    pets = []
+    for i, ability_dict in enumerate((SNIPE, BUFF_BEHIND, SUMMON, SNIPE, SUMMON)):
+        pet = Pet(f"{name}{i + 1}", (i + 2, i + 3))
+        pet.ability = Ability.from_dict(ability_dict)
+        pets.append(pet)
+    return Team(pets)
@@ -0,0 +1,235 @@
+"""Module defining the benchmarks and the functions to time and compare them"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable, Iterable
+
+from benchmarks import fixtures
+from superautosim.abilities import Ability
+from superautosim.battle import Battle
+from superautosim.encoding import decode_team, encode_team
+from superautosim.events import Event, EventType
+from superautosim.pets import Pet
+from superautosim.targets.filters import Filter
+from superautosim.targets.selectors import Selector
+from superautosim.teams import Team
+from superautosim.triggers import Trigger
+from superautosim.utils import nth_combination
+
+# Name: setup function returning the operation to time
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Decorator registering a benchmark's setup function"""
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def run(
+    names: Iterable[str] | None = None, repeat: int = 5, min_time: float = 0.2
+) -> dict[str, float]:
+    """Time benchmarks, returning the best seconds per call of each
+
+    Args:
+        names (Iterable[str], optional): Benchmarks to run, defaults to all.
+        repeat (int): Timing runs of each benchmark, the fastest is kept.
+        min_time (float): Minimum seconds of each timing run.
+    """
+    results = {}
+    for name in BENCHMARKS if names is None else names:
+        timer = timeit.Timer(BENCHMARKS[name]())
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        results[name] = min(timer.repeat(repeat, number)) / number
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Returns a message for each benchmark slower than its baseline
+
+    Args:
+        results (dict[str, float]): Seconds per call of each benchmark.
+        baseline (dict[str, float]): Stored seconds per call, benchmarks missing
+            from either are ignored.
+        threshold (float): Percentage slowdown allowed before a regression.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base and seconds > base * (1 + threshold / 100):
+            regressions.append(
+                f"{name}: {seconds * 1e6:.3f}us vs baseline {base * 1e6:.3f}us "
+                f"(+{(seconds / base - 1) * 100:.1f}%)"
+            )
+    return regressions
+
+
+def _battlefield_event() -> Event:
+    return Event(
+        EventType.NONE, teams=(fixtures.friendly_team(), fixtures.enemy_team())
+    )
+
+
+@benchmark("selectors.first")
+def _first_selector():
+    selector = Selector.from_dict({"selector": "FIRST"})
+    pets = fixtures.friendly_team().pets
+    return lambda: selector.select(pets, 2, 0.5)
+
+
+@benchmark("selectors.random")
+def _random_selector():
+    selector = Selector.from_dict({"selector": "RANDOM"})
+    pets = fixtures.friendly_team().pets
+    return lambda: selector.select(pets, 2, 0.5)
+
+
+@benchmark("selectors.health")
+def _health_selector():
+    selector = Selector.from_dict({"selector": "HEALTH", "highest": True})
+    pets = fixtures.friendly_team().pets + fixtures.enemy_team().pets
+    return lambda: selector.select(pets, 3, 0.5)
+
+
+def _filter_benchmark(filter_dict: dict, memo: str = "cold"):
+    """Time a filter on the battlefield
+
+    memo is "cold" to clear the event's filter memo before each call, "warm" to
+    reuse it like repeated filtering while one event resolves, or "off" to skip
+    memoisation entirely.
+    """
+    event = _battlefield_event()
+    owner = event.teams[0][2]
+    filter_ = Filter.from_dict(filter_dict)
+    pets = [pet for team in event.teams for pet in team]
+    if memo == "off":
+        unmemoised = getattr(type(filter_).filter, "__wrapped__", type(filter_).filter)
+        return lambda: unmemoised(filter_, pets, event, owner)
+    if memo == "warm":
+        return lambda: filter_.filter(pets, event, owner)
+    filter_memo = event._filter_memo
+
+    def run_filter():
+        filter_memo.clear()
+        return filter_.filter(pets, event, owner)
+
+    return run_filter
+
+
+_ALL_FILTER = {
+    "op": "ALL",
+    "filters": [
+        {"op": "SINGLE", "filter": "FRIENDLY"},
+        {"op": "SINGLE", "filter": "NOT_SELF"},
+        {"op": "SINGLE", "filter": "BEHIND"},
+    ],
+}
+
+
+@benchmark("filters.enemy")
+def _enemy_filter():
+    return _filter_benchmark({"op": "SINGLE", "filter": "ENEMY"})
+
+
+@benchmark("filters.adjacent")
+def _adjacent_filter():
+    return _filter_benchmark({"op": "SINGLE", "filter": "ADJACENT"})
+
+
+@benchmark("filters.all")
+def _all_filter():
+    return _filter_benchmark(_ALL_FILTER)
+
+
+@benchmark("filters.all_memo_hit")
+def _all_filter_memo_hit():
+    return _filter_benchmark(_ALL_FILTER, "warm")
+
+
+@benchmark("filters.all_no_memo")
+def _all_filter_no_memo():
+    return _filter_benchmark(_ALL_FILTER, "off")
+
+
+def _trigger_benchmark(trigger_dict: dict):
+    event = _battlefield_event()
+    event.type = EventType.FAINT
+    event.pet = event.teams[0][0]
+    trigger = Trigger.from_dict(trigger_dict)
+    owner = event.teams[0][1]
+    return lambda: trigger.is_triggered(event, owner)
+
+
+@benchmark("triggers.type")
+def _type_trigger():
+    return _trigger_benchmark({"event": "FAINT"})
+
+
+@benchmark("triggers.friendly_ahead")
+def _modifier_trigger():
+    return _trigger_benchmark(
+        {"event": "FAINT", "modifiers": [{"type": "friendly"}, {"type": "ahead"}]}
+    )
+
+
+@benchmark("team.insert_pet")
+def _insert_pet():
+    pets = fixtures.friendly_team().pets[:4]
+    pet = Pet("inserted", (1, 1))
+
+    def insert():
+        # A fresh team each call, so every insert shifts the pets behind slot 1
+        Team(pets).insert_pet(pet, 1)
+
+    return insert
+
+
+@benchmark("team.summon_pet")
+def _summon_pet():
+    pets = fixtures.friendly_team().pets[:4]
+    pet = Pet("summoned", (1, 1))
+
+    def summon():
+        # A fresh team each call, so every summon shifts the team back
+        Team(pets).summon_pet(pet, 0)
+
+    return summon
+
+
+@benchmark("utils.nth_combination")
+def _nth_combination():
+    pool = range(10)
+    return lambda: nth_combination(pool, 4, 137)
+
+
+@benchmark("dicts.ability")
+def _ability_round_trip():
+    return lambda: Ability.from_dict(fixtures.BUFF_BEHIND).to_dict()
+
+
+@benchmark("dicts.team_encoding")
+def _team_round_trip():
+    team = fixtures.ability_team("pet")
+    return lambda: decode_team(encode_team(team))
+
+
+@benchmark("battles.stat_only")
+def _stat_only_battle():
+    team_a, team_b = fixtures.friendly_team(), fixtures.enemy_team()
+    return lambda: Battle(team_a, team_b).run()
+
+
+@benchmark("battles.abilities")
+def _ability_battle():
+    team_a, team_b = fixtures.ability_team("friend"), fixtures.ability_team("enemy")
+    return lambda: Battle(team_a, team_b, seed=1).run()
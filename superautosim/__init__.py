@@ -0,0 +1,4 @@
+from superautosim import metrics
+
+# Enables hot-path metrics for the process when metrics.ENV_VAR is set
+metrics._enable_from_environment()
@@ -0,0 +1,95 @@
+"""Module defining the Ability class"""
+from __future__ import annotations
+
+from typing import TypedDict
+
+from superautosim.actions import Action, ActionDict
+from superautosim.events import Event
+from superautosim.pets import Pet
+from superautosim.triggers import Trigger
+
+
+class AbilityDict(TypedDict, total=True):
+    trigger: dict
+    action: ActionDict
+
+
+class Ability:
+    """A pet's ability, running an action whenever its trigger is triggered
+
+    Abilities are prototypes: the owner is given when the ability is activated,
+    and the only per-pet state (trigger counters) is kept on the owner. A single
+    ability can therefore be shared by every copy of a pet.
+    """
+
+    def __init__(self, trigger: Trigger, action: Action):
+        self._trigger = trigger
+        self._action = action
+
+    @property
+    def trigger(self) -> Trigger:
+        return self._trigger
+
+    @property
+    def action(self) -> Action:
+        return self._action
+
+    def activate(self, event: Event, owner: Pet, rand: float) -> bool:
+        """Run the ability's action if the event triggers the ability
+
+        Args:
+            event (Event): The event that may trigger the ability
+            owner (Pet): The pet who owns the ability
+            rand (float): Number to determine random effects of the action.
+                Must follow `0 >= rand and rand < 1`.
+
+        Returns:
+            bool: True if the ability was triggered
+        """
+        if not self.is_triggered(event, owner):
+            return False
+        self.run(event, owner, rand)
+        return True
+
+    def is_triggered(self, event: Event, owner: Pet) -> bool:
+        """Whether the event triggers the ability, updating the owner's counters"""
+        return self._trigger.is_triggered(event, owner, owner.ability_counters)
+
+    def run(self, event: Event, owner: Pet, rand: float):
+        """Run the ability's action regardless of its trigger"""
+        self._action.run(owner.level, event, rand, owner)
+
+    def to_dict(self) -> AbilityDict:
+        """Generates a dictionary representation of the ability
+
+        Returns:
+            dict: Ability represented as a "trigger" dict and an "action" dict.
+        """
+        return {"trigger": self._trigger.to_dict(), "action": self._action.to_dict()}
+
+    @staticmethod
+    def from_dict(ability_dict: AbilityDict, owner: Pet | None = None) -> Ability:
+        """Creates an ability from its dictionary representation
+
+        Args:
+            ability_dict (dict): dictionary representation to create from.
+            owner (Pet, optional): Owner to bind the ability's targets to, abilities
+                shared between pets should not have an owner.
+
+        Raises:
+            ValueError: When given an invalid dictionary
+
+        Returns:
+            Ability: Ability instance specified by ability_dict
+        """
+        if not isinstance(ability_dict, dict) or {"trigger", "action"} - set(
+            ability_dict
+        ):
+            raise ValueError("Ability dict must have a trigger and an action")
+        return Ability(
+            Trigger.from_dict(ability_dict["trigger"]),
+            Action.from_dict(ability_dict["action"], owner),
+        )
+
+    def __repr__(self) -> str:
+        return f"Ability<{self.to_dict()}>"
@@ -1,9 +1,32 @@
+"""Module defining Action classes"""
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+from typing import Literal, TypedDict
+
+from superautosim.events import Event, EventType
+from superautosim.pets import Pet, PetPool
+from superautosim.teams import Team
+from superautosim.tracing import TraceKind
+from superautosim.utils import get_member
+
+from .targets.target_generators import TargetGenerator, TargetGeneratorDict
 
-from superautosim.events import Event
 
-from .targets.target_generators import TargetGenerator
+class ActionDict(TypedDict, total=False):
+    action: ActionTypeValue
+    target_generator: TargetGeneratorDict
+    max_targets: int
+    attack: int
+    health: int
+    level_multiply: bool
+    damage: int
+    pet: str
+    count: int
+
+
+ActionTypeValue = Literal["ADD_STATS", "ADD_TEMP_STATS", "SUMMON", "DEAL_DAMAGE"]
 
 
 class ActionType(Enum):
@@ -12,18 +35,96 @@ class ActionType(Enum):
     SUMMON = auto()
     DEAL_DAMAGE = auto()
 
+    name: ActionTypeValue
+
 
 class Action(ABC):
     @abstractmethod
-    def run(self, level: int, event: Event, rand: float):
+    def run(self, level: int, event: Event, rand: float, owner: Pet | None = None):
+        """Run the action
+
+        Args:
+            level (int): Level of the pet running the action.
+            event (Event): The event that triggered the action. Without a
+                scheduler (event.scheduler is None) no follow-up events are
+                scheduled.
+            rand (float): Number to determine random effects.
+                Must follow `0 >= rand and rand < 1`.
+            owner (Pet, optional): The pet running the action, defaults to the owner
+                its target generator was bound to.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def to_dict(self) -> ActionDict:
+        """Generates a dictionary representation of the action
+
+        Returns:
+            dict: Action represented with an "action" key giving the ActionType name
+                and further keys for the parameters of that action type.
+        """
         raise NotImplementedError()
 
+    @staticmethod
+    def from_dict(action_dict: ActionDict, owner: Pet | None = None) -> Action:
+        """Creates an action from its dictionary representation
+
+        Args:
+            action_dict (dict): dictionary representation to create from.
+            owner (Pet, optional): Owner to bind the action's targets to.
+
+        Raises:
+            ValueError: When given an invalid dictionary
+
+        Returns:
+            Action: Action instance specified by action_dict
+        """
+        action_type = get_member(ActionType, action_dict.get("action"))
+        if action_type in (ActionType.ADD_STATS, ActionType.ADD_TEMP_STATS):
+            return AddStatsAction.from_dict(action_dict, owner)
+        if action_type == ActionType.DEAL_DAMAGE:
+            return DealDamageAction.from_dict(action_dict, owner)
+        if action_type == ActionType.SUMMON:
+            return SummonAction.from_dict(action_dict, owner)
+        raise ValueError(f"Unsupported or missing action type: {action_dict}")
+
 
 class TargetedAction(Action):
     def __init__(self, target_generator: TargetGenerator, max_targets: int):
         self._target_generator = target_generator
         self._max_targets = max_targets
 
+    def to_dict(self) -> ActionDict:
+        return {
+            "target_generator": self._target_generator.to_dict(),
+            "max_targets": self._max_targets,
+        }
+
+    def _targets(self, event: Event, rand: float, owner: Pet | None) -> list[Pet]:
+        """Generate the action's targets, tracing them if the event is traced"""
+        targets = self._target_generator.get(event, self._max_targets, rand, owner)
+        # Actions may run without an event, e.g. when used outside a battle
+        trace = event.trace if event is not None else None
+        if trace is not None:
+            for pet in targets:
+                trace.record(TraceKind.TARGET, event.type, pet)
+        return targets
+
+    @staticmethod
+    def _targeted_kwargs(action_dict: ActionDict, owner: Pet | None) -> dict:
+        """Returns the TargetedAction init arguments given by the action dict"""
+        if "target_generator" not in action_dict:
+            raise ValueError("Targeted actions must have a target_generator")
+        max_targets = action_dict.get("max_targets", 1)
+        if not isinstance(max_targets, int) or max_targets < 0:
+            raise ValueError("max_targets must be a non-negative integer")
+        return {
+            "target_generator": TargetGenerator.from_dict(
+                action_dict["target_generator"], owner
+            ),
+            "max_targets": max_targets,
+        }
+
 
 class AddStatsAction(TargetedAction):
     """Add attack/health stats to targeted pets"""
@@ -43,9 +144,173 @@ class AddStatsAction(TargetedAction):
         self._level_multiply = level_multiply
         self._temp_stats = temp_stats
 
-    def run(self, level: int, event: Event, rand: float):
-        targets = self._target_generator.get(event, self._max_targets, rand)
+    def run(self, level: int, event: Event, rand: float, owner: Pet | None = None):
+        targets = self._targets(event, rand, owner)
         health_buff = self._health * (level * self._level_multiply)
         attack_buff = self._attack * (level * self._level_multiply)
         for pet in targets:
-            pet.add_stats(attack_buff, health_buff, self._temp_stats)
+            # Buffs must not revive pets fainted earlier in the same batch
+            if not pet.fainted:
+                pet.add_stats(attack_buff, health_buff, self._temp_stats)
+
+    def to_dict(self) -> ActionDict:
+        result = super().to_dict()
+        result["action"] = "ADD_TEMP_STATS" if self._temp_stats else "ADD_STATS"
+        result["attack"] = self._attack
+        result["health"] = self._health
+        result["level_multiply"] = self._level_multiply
+        return result
+
+    @staticmethod
+    def from_dict(action_dict: ActionDict, owner: Pet | None = None) -> AddStatsAction:
+        kwargs = TargetedAction._targeted_kwargs(action_dict, owner)
+        for key in ("attack", "health"):
+            if not isinstance(action_dict.get(key, 0), int):
+                raise ValueError(f"AddStatsAction {key} must be an integer")
+        if not isinstance(action_dict.get("level_multiply", True), bool):
+            raise ValueError("AddStatsAction level_multiply must be a boolean")
+        return AddStatsAction(
+            **kwargs,
+            attack=action_dict.get("attack", 0),
+            health=action_dict.get("health", 0),
+            level_multiply=action_dict.get("level_multiply", True),
+            temp_stats=action_dict["action"] == "ADD_TEMP_STATS",
+        )
+
+
+class DealDamageAction(TargetedAction):
+    """Deal damage to targeted pets, scheduling HURT or FAINT events for each"""
+
+    def __init__(
+        self,
+        target_generator: TargetGenerator,
+        max_targets: int = 1,
+        damage: int = 0,
+        level_multiply=True,
+    ):
+        super().__init__(target_generator, max_targets)
+        self._damage = damage
+        self._level_multiply = level_multiply
+
+    def run(self, level: int, event: Event, rand: float, owner: Pet | None = None):
+        damage = self._damage * level if self._level_multiply else self._damage
+        scheduler = event.scheduler
+        for pet in self._targets(event, rand, owner):
+            if pet.fainted:
+                continue
+            pet.take_damage(damage)
+            if scheduler is not None:
+                scheduler.schedule(
+                    EventType.FAINT if pet.fainted else EventType.HURT, pet
+                )
+
+    def to_dict(self) -> ActionDict:
+        result = super().to_dict()
+        result["action"] = "DEAL_DAMAGE"
+        result["damage"] = self._damage
+        result["level_multiply"] = self._level_multiply
+        return result
+
+    @staticmethod
+    def from_dict(
+        action_dict: ActionDict, owner: Pet | None = None
+    ) -> DealDamageAction:
+        kwargs = TargetedAction._targeted_kwargs(action_dict, owner)
+        damage = action_dict.get("damage", 0)
+        if not isinstance(damage, int) or damage < 0:
+            raise ValueError("DealDamageAction damage must be a non-negative integer")
+        if not isinstance(action_dict.get("level_multiply", True), bool):
+            raise ValueError("DealDamageAction level_multiply must be a boolean")
+        return DealDamageAction(
+            **kwargs,
+            damage=damage,
+            level_multiply=action_dict.get("level_multiply", True),
+        )
+
+
+class SummonAction(Action):
+    """Summon copies of a pet into the owner's slot, or in front of the owner
+
+    A fainted owner is removed from its team to make space for the summons.
+    Summoned pets are taken from a PetPool and registered with the event's
+    scheduler, a Battle releases them back to the pool once they faint. Nothing
+    is summoned when the owner's side is not a Team.
+    """
+
+    def __init__(
+        self,
+        pet_pool: PetPool,
+        count: int = 1,
+        level_multiply=True,
+        owner: Pet | None = None,
+    ):
+        self._pet_pool = pet_pool
+        self._count = count
+        self._level_multiply = level_multiply
+        self._owner = owner
+
+    @property
+    def pet_pool(self) -> PetPool:
+        return self._pet_pool
+
+    def run(self, level: int, event: Event, rand: float, owner: Pet | None = None):
+        if owner is None:
+            owner = self._owner
+        team, _ = event.get_ordered_teams(owner)
+        if not isinstance(team, Team):
+            return
+        index = next((i for i, pet in enumerate(team) if pet is owner), None)
+        if index is None:
+            return
+        if owner.fainted:
+            team.remove_pet(owner)
+
+        prototype = self._pet_pool.prototype
+        extra_levels = level - 1 if self._level_multiply else 0
+        scheduler = event.scheduler
+        for _ in range(self._count):
+            pet = self._pet_pool.acquire()
+            if extra_levels:
+                pet.add_stats(
+                    prototype.attack * extra_levels, prototype.health * extra_levels
+                )
+            if not team.summon_pet(pet, index):
+                self._pet_pool.release(pet)
+                break
+            if scheduler is not None:
+                scheduler.add_summon(pet, self._pet_pool)
+                scheduler.schedule(EventType.SUMMONED, pet)
+
+    def to_dict(self) -> ActionDict:
+        prototype = self._pet_pool.prototype
+        return {
+            "action": "SUMMON",
+            "pet": prototype.name,
+            "attack": prototype.attack,
+            "health": prototype.health,
+            "count": self._count,
+            "level_multiply": self._level_multiply,
+        }
+
+    @staticmethod
+    def from_dict(action_dict: ActionDict, owner: Pet | None = None) -> SummonAction:
+        if not isinstance(action_dict.get("pet"), str):
+            raise ValueError("SummonAction pet must be a pet name")
+        for key in ("attack", "health", "count"):
+            if (
+                not isinstance(action_dict.get(key, 1), int)
+                or action_dict.get(key, 1) < 1
+            ):
+                raise ValueError(f"SummonAction {key} must be a positive integer")
+        if not isinstance(action_dict.get("level_multiply", True), bool):
+            raise ValueError("SummonAction level_multiply must be a boolean")
+        prototype = Pet(
+            action_dict["pet"],
+            (action_dict.get("attack", 1), action_dict.get("health", 1)),
+        )
+        return SummonAction(
+            PetPool(prototype),
+            count=action_dict.get("count", 1),
+            level_multiply=action_dict.get("level_multiply", True),
+            owner=owner,
+        )
@@ -0,0 +1,31 @@
+"""Backends for batched battles, NumPy accelerated when NumPy is installed"""
+from __future__ import annotations
+
+from .base import Backend, StatBatch
+from .python_backend import PythonBackend
+
+try:
+    from .numpy_backend import NumpyBackend
+except ImportError:  # pragma: no cover - depends on the environment
+    NumpyBackend = None
+
+BACKENDS: dict[str, type[Backend]] = {PythonBackend.name: PythonBackend}
+if NumpyBackend is not None:
+    BACKENDS[NumpyBackend.name] = NumpyBackend
+
+
+def get_backend(name: str | None = None) -> Backend:
+    """Returns the named backend, or the default backend when no name is given
+
+    Raises:
+        ValueError: The named backend is unknown or unavailable.
+    """
+    if name is None:
+        return default_backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unavailable backend {name!r}, choose from {list(BACKENDS)}")
+    return BACKENDS[name]()
+
+
+# Picked once at import time
+default_backend: Backend = (NumpyBackend or PythonBackend)()
@@ -0,0 +1,67 @@
+"""Module defining the Backend interface used by the batch engine"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from superautosim.teams import Team
+
+
+@dataclass
+class StatBatch:
+    """Attack/health of a batch of stat-only battles, packed to the front
+
+    attack and health are indexed [battle][side][slot] and counts [battle][side]
+    gives the number of pets of each side. The container types depend on the
+    backend that packed them.
+    """
+
+    attack: Any
+    health: Any
+    counts: Any
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class Backend(ABC):
+    """Stat storage, selection and random number generation for batched battles
+
+    Every backend must give identical results, see the conformance tests.
+    """
+
+    name: str
+
+    @abstractmethod
+    def pack(self, matchups: Sequence[tuple[Team, Team]]) -> StatBatch:
+        """Store the stats of each matchup's pets, skipping empty slots and
+        pets that have already fainted
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def run_stat_only(self, batch: StatBatch, max_turns: int) -> list[int]:
+        """Run the packed battles in lockstep, mutating the batch's health
+
+        Returns:
+            list[int]: The BattleResult value of each battle.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def argmax(self, values: Any) -> Any:
+        """Returns the index of the first highest value of each row
+
+        values is a list of rows or an array of the backend's container type,
+        the indexes are returned in the same container type.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def uniform(self, seed: int, streams: Sequence[int], counter: int) -> list[float]:
+        """Returns the counter-th random number of each stream, see rand.uniform"""
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.name}>"
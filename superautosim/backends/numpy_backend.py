@@ -0,0 +1,76 @@
+"""Module defining the NumPy backend, importing it requires NumPy"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from superautosim.rand import MASK64
+from superautosim.teams import Team
+
+from .base import Backend, StatBatch
+
+_FLOAT_SCALE = 2.0**-53
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    """Vectorised rand.splitmix64, uint64 arithmetic wraps like the masked ints"""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class NumpyBackend(Backend):
+    """Backend holding stats in (B, 2, 5) arrays, every battle steps together"""
+
+    name = "numpy"
+
+    def pack(self, matchups: Sequence[tuple[Team, Team]]) -> StatBatch:
+        shape = (len(matchups), 2, Team.MAX_TEAM_SIZE)
+        attack = np.zeros(shape, dtype=np.int64)
+        health = np.zeros(shape, dtype=np.int64)
+        counts = np.zeros(shape[:2], dtype=np.int64)
+        for b, teams in enumerate(matchups):
+            for side, team in enumerate(teams):
+                n = 0
+                for pet in team:
+                    if pet is not None and not pet.fainted:
+                        attack[b, side, n] = pet.attack
+                        health[b, side, n] = pet.health
+                        n += 1
+                counts[b, side] = n
+        return StatBatch(attack, health, counts)
+
+    def run_stat_only(self, batch: StatBatch, max_turns: int) -> list[int]:
+        attack, health, counts = batch.attack, batch.health, batch.counts
+        slots = health.shape[2]
+        active = np.arange(len(counts))[(counts > 0).all(axis=1)]
+        for _ in range(max_turns):
+            # The front of a side is its first living pet, or the slot count
+            # (the trailing True) once every pet has fainted
+            alive = health[active] > 0
+            sentinel = np.ones(alive.shape[:2] + (1,), dtype=bool)
+            fronts = self.argmax(np.concatenate((alive, sentinel), axis=2))
+            ongoing = (fronts < slots).all(axis=1)
+            active, fronts = active[ongoing], fronts[ongoing]
+            if not len(active):
+                break
+            front_a, front_b = fronts[:, 0], fronts[:, 1]
+            attack_a = attack[active, 0, front_a]
+            attack_b = attack[active, 1, front_b]
+            health[active, 0, front_a] -= attack_b
+            health[active, 1, front_b] -= attack_a
+
+        alive = (health > 0).any(axis=2)
+        return (alive[:, 0].astype(np.int64) - alive[:, 1]).tolist()
+
+    def argmax(self, values: np.ndarray) -> np.ndarray:
+        return np.argmax(np.asarray(values), axis=-1)
+
+    def uniform(self, seed: int, streams: Sequence[int], counter: int) -> list[float]:
+        streams = np.array([stream & MASK64 for stream in streams], dtype=np.uint64)
+        keys = _splitmix64(streams) ^ np.uint64(seed & MASK64)
+        keys = _splitmix64(keys) + np.uint64(counter & MASK64)
+        values = _splitmix64(keys) >> np.uint64(11)
+        return (values * _FLOAT_SCALE).tolist()
@@ -0,0 +1,59 @@
+"""Module defining the pure-Python reference backend"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from superautosim.rand import uniform
+from superautosim.teams import Team
+
+from .base import Backend, StatBatch
+
+
+class PythonBackend(Backend):
+    """Reference backend using nested lists, always available"""
+
+    name = "python"
+
+    def pack(self, matchups: Sequence[tuple[Team, Team]]) -> StatBatch:
+        attack, health, counts = [], [], []
+        for teams in matchups:
+            sides = [[], []]
+            for side, team in zip(sides, teams):
+                side.extend(pet for pet in team if pet is not None and not pet.fainted)
+            attack.append([[pet.attack for pet in side] for side in sides])
+            health.append([[pet.health for pet in side] for side in sides])
+            counts.append([len(side) for side in sides])
+        return StatBatch(attack, health, counts)
+
+    def run_stat_only(self, batch: StatBatch, max_turns: int) -> list[int]:
+        attack, health = batch.attack, batch.health
+        is_alive = (0).__lt__
+        active = [b for b, counts in enumerate(batch.counts) if all(counts)]
+        for _ in range(max_turns):
+            if not active:
+                break
+            # The front of a side is its first living pet, or its pet count
+            # (the trailing True) once every pet has fainted
+            fronts = self.argmax(
+                [[*map(is_alive, side), True] for b in active for side in health[b]]
+            )
+            ongoing = []
+            for b, front_a, front_b in zip(active, fronts[::2], fronts[1::2]):
+                (attack_a, attack_b), (health_a, health_b) = attack[b], health[b]
+                if front_a == len(health_a) or front_b == len(health_b):
+                    continue
+                health_a[front_a] -= attack_b[front_b]
+                health_b[front_b] -= attack_a[front_a]
+                ongoing.append(b)
+            active = ongoing
+
+        return [
+            any(hp > 0 for hp in health_a) - any(hp > 0 for hp in health_b)
+            for health_a, health_b in health
+        ]
+
+    def argmax(self, values: Sequence[Sequence[int]]) -> list[int]:
+        return [row.index(max(row)) for row in values]
+
+    def uniform(self, seed: int, streams: Sequence[int], counter: int) -> list[float]:
+        return [uniform(seed, stream, counter) for stream in streams]
@@ -0,0 +1,74 @@
+"""Module for running many independent battles in lockstep
+
+Stat-only battles (no pet has an ability) are packed by a backend and every
+active battle advances one attack per step, see superautosim.backends. Battles
+with abilities run through the scalar Battle, drawing the start of their random
+streams from the backend in blocks. Both paths give identical results for every
+battle.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from superautosim.backends import Backend, get_backend
+from superautosim.battle import Battle, BattleResult
+from superautosim.rand import PrefetchedStream
+from superautosim.teams import Team
+
+# Random numbers drawn up front from the backend for each ability battle
+RAND_BLOCK = 4
+_RESULTS = {result.value: result for result in BattleResult}
+
+
+def is_stat_only(team: Team) -> bool:
+    """Whether the battle outcome of a team depends only on its pets' stats"""
+    return all(pet is None or pet.ability is None for pet in team)
+
+
+def run_batch(
+    matchups: Sequence[tuple[Team, Team]],
+    seed: int = 0,
+    first_battle_id: int = 0,
+    max_turns: int | None = None,
+    backend: Backend | None = None,
+) -> list[BattleResult]:
+    """Run a batch of independent battles
+
+    Args:
+        matchups (Sequence[tuple[Team, Team]]): The team pairs to battle.
+        seed (int): Seed of every battle's random stream.
+        first_battle_id (int): Battle id of the first matchup, the battle id of
+            each subsequent matchup is one more than the last.
+        max_turns (int, optional): Turns before a battle is a draw.
+        backend (Backend, optional): Backend for stat-only battles, defaults to
+            the backend picked at import time.
+
+    Returns:
+        list[BattleResult]: Result of each matchup for its first team.
+    """
+    if max_turns is None:
+        max_turns = Battle.MAX_TURNS
+    if backend is None:
+        backend = get_backend()
+    results: list[BattleResult | None] = [None] * len(matchups)
+    stat_only, ability = [], []
+    for i, (team_a, team_b) in enumerate(matchups):
+        if is_stat_only(team_a) and is_stat_only(team_b):
+            stat_only.append(i)
+        else:
+            ability.append(i)
+
+    if ability:
+        streams = [first_battle_id + i for i in ability]
+        block = [backend.uniform(seed, streams, n) for n in range(RAND_BLOCK)]
+        for k, (i, stream) in enumerate(zip(ability, streams)):
+            rand = PrefetchedStream(seed, stream, [row[k] for row in block])
+            battle = Battle(*matchups[i], seed, stream, max_turns, rand=rand)
+            results[i] = battle.run()
+
+    if stat_only:
+        stats = backend.pack([matchups[i] for i in stat_only])
+        outcomes = backend.run_stat_only(stats, max_turns)
+        for i, outcome in zip(stat_only, outcomes):
+            results[i] = _RESULTS[outcome]
+    return results
@@ -0,0 +1,175 @@
+"""Module defining the Battle class, the scalar battle engine"""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Callable
+
+from superautosim.events import EventType
+from superautosim.pets import Pet
+from superautosim.rand import RandStream
+from superautosim.scheduler import EventScheduler
+from superautosim.teams import Team
+from superautosim.tracing import TraceKind, TraceRecorder
+
+
+class BattleResult(Enum):
+    """Result of a battle, from the perspective of the first team"""
+
+    LOSS = -1
+    DRAW = 0
+    WIN = 1
+
+
+class Battle:
+    """A battle between two teams
+
+    The teams are copied so the given pets are left untouched. Each turn the front
+    pets (slot 0 first) attack each other simultaneously, and fainted pets are
+    removed once the abilities their events trigger have resolved, summoned pets
+    are then released back to their PetPool. A battle still undecided after
+    max_turns is a draw.
+    """
+
+    MAX_TURNS = 500
+
+    def __init__(
+        self,
+        team_a: Team,
+        team_b: Team,
+        seed: int = 0,
+        battle_id: int = 0,
+        max_turns: int | None = None,
+        rand: Callable[[], float] | None = None,
+        trace: TraceRecorder | None = None,
+    ) -> None:
+        """Initialises a battle
+
+        Args:
+            team_a (Team): The first team, results are from its perspective.
+            team_b (Team): The opposing team.
+            seed (int): Seed of the battle's random stream.
+            battle_id (int): Identifier of the battle's random stream.
+            max_turns (int, optional): Turns before the battle is a draw.
+            rand (Callable[[], float], optional): Random number source, overrides
+                the stream given by seed and battle_id.
+            trace (TraceRecorder, optional): Records the battle, see tracing.
+        """
+        self.teams = (_copy_team(team_a), _copy_team(team_b))
+        self.rand = RandStream(seed, battle_id) if rand is None else rand
+        self.max_turns = self.MAX_TURNS if max_turns is None else max_turns
+        self.turns = 0
+        # Number of abilities run, and the furthest slot of each given team whose
+        # pet reached the front (Team.MAX_TEAM_SIZE once a summoned pet does)
+        self.activations = 0
+        self.reach = [-1, -1]
+        self._origins = [
+            {pet: slot for slot, pet in enumerate(team) if pet is not None}
+            for team in self.teams
+        ]
+        self.trace = trace
+        self._scheduler = EventScheduler(
+            self.teams, self.rand, in_battle=True, trace=trace
+        )
+
+    def run(self) -> BattleResult:
+        """Run the battle to completion
+
+        Returns:
+            BattleResult: The result for the first team.
+        """
+        scheduler = self._scheduler
+        scheduler.schedule(EventType.START_OF_BATTLE)
+        self._resolve()
+        while self.turns < self.max_turns:
+            fronts = self._fronts()
+            if fronts is None:
+                break
+            self.turns += 1
+            if self.trace is not None:
+                self.trace.turn = self.turns
+                self.trace.record(TraceKind.TURN, value=self.turns)
+            for pet in fronts:
+                scheduler.schedule(EventType.BEFORE_ATTACK, pet)
+            self._resolve()
+
+            fronts = self._fronts()
+            if fronts is None:
+                break
+            pet_a, pet_b = fronts
+            for side, pet in enumerate(fronts):
+                origin = self._origins[side].get(pet, Team.MAX_TEAM_SIZE)
+                self.reach[side] = max(self.reach[side], origin)
+            attack_a, attack_b = pet_a.attack, pet_b.attack
+            scheduler.schedule(EventType.ATTACK, pet_a)
+            scheduler.schedule(EventType.ATTACK, pet_b)
+            self._hit(pet_b, attack_a, pet_a)
+            self._hit(pet_a, attack_b, pet_b)
+            self._resolve()
+        return self.result
+
+    @property
+    def result(self) -> BattleResult:
+        alive_a = any(self.teams[0])
+        alive_b = any(self.teams[1])
+        if alive_a and not alive_b:
+            return BattleResult.WIN
+        if alive_b and not alive_a:
+            return BattleResult.LOSS
+        return BattleResult.DRAW
+
+    def surviving_slots(self, side: int) -> list[int]:
+        """Returns the given team slot of each surviving pet of a side
+
+        Summoned pets have the slot Team.MAX_TEAM_SIZE.
+        """
+        origins = self._origins[side]
+        return [
+            origins.get(pet, Team.MAX_TEAM_SIZE)
+            for pet in self.teams[side]
+            if pet is not None
+        ]
+
+    def _hit(self, pet: Pet, damage: int, attacker: Pet):
+        """Deal attack damage to a pet and schedule the resulting events"""
+        pet.take_damage(damage)
+        if self.trace is not None:
+            self.trace.record(TraceKind.DAMAGE, pet=pet, value=damage)
+        if pet.fainted:
+            self._scheduler.schedule(EventType.FAINT, pet)
+            self._scheduler.schedule(EventType.KNOCKOUT, attacker)
+        else:
+            self._scheduler.schedule(EventType.HURT, pet)
+
+    def _resolve(self):
+        """Resolve scheduled events, then remove fainted pets"""
+        self.activations += self._scheduler.run()
+        for team in self.teams:
+            for pet in team:
+                if pet is not None and pet.fainted:
+                    team.remove_pet(pet)
+                    if self.trace is not None:
+                        self.trace.record(TraceKind.REMOVE, pet=pet)
+                    # Fainted summons are no longer referenced, so can be reused
+                    pool = self._scheduler.summons.pop(pet, None)
+                    if pool is not None:
+                        pool.release(pet)
+
+    def _fronts(self) -> tuple[Pet, Pet] | None:
+        """Returns the front pet of both teams, None if either team is empty"""
+        front_a = next((pet for pet in self.teams[0] if pet is not None), None)
+        front_b = next((pet for pet in self.teams[1] if pet is not None), None)
+        if front_a is None or front_b is None:
+            return None
+        return front_a, front_b
+
+
+def _copy_team(team: Team) -> Team:
+    copies = []
+    for pet in team:
+        if pet is None:
+            copies.append(None)
+        else:
+            copy = Pet()
+            copy.copy_from(pet)
+            copies.append(copy)
+    return Team(copies)
@@ -0,0 +1,110 @@
+"""Module for comparing two teams with paired, variance-reduced battles
+
+Both teams battle each opponent on the same random streams (common random
+numbers), so the difference between their scores mostly reflects the teams
+rather than luck. Optionally each stream is paired with its antithetic stream
+(every rand u replaced by 1 - u), which selects mirrored targets through the
+selectors' combination index.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Sequence
+
+from superautosim.batch import is_stat_only
+from superautosim.battle import Battle, BattleResult
+from superautosim.rand import RandStream
+from superautosim.teams import Team
+
+
+@dataclass
+class Comparison:
+    """Paired score differences of team A minus team B
+
+    Each sample is the score difference over one battle id against one opponent,
+    averaged with its antithetic battle when enabled. Scores count a win as 1, a
+    draw as 0.5 and a loss as 0.
+    """
+
+    samples: int
+    mean: float
+    variance: float
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean difference"""
+        if self.samples < 2:
+            return math.inf if self.variance else 0.0
+        return math.sqrt(self.variance / self.samples)
+
+    def significant(self, z: float = 1.96) -> bool:
+        """Whether the mean difference is more than z standard errors from 0"""
+        if self.mean == 0:
+            return False
+        return abs(self.mean) > z * self.std_error
+
+
+def compare(
+    team_a: Team,
+    team_b: Team,
+    opponents: Sequence[Team],
+    battles: int,
+    seed: int = 0,
+    antithetic: bool = False,
+) -> Comparison:
+    """Compare two teams against the same opponents on common random numbers
+
+    Args:
+        team_a (Team): The first team, differences are its score minus team_b's.
+        team_b (Team): The second team.
+        opponents (Sequence[Team]): Teams both teams battle.
+        battles (int): Battle ids played against each opponent.
+        seed (int): Seed of every battle's random stream.
+        antithetic (bool): Also play each battle id on its antithetic stream.
+
+    Returns:
+        Comparison: Mean and sample variance of the paired differences.
+    """
+    differences = []
+    for opponent in opponents:
+        deterministic = all(map(is_stat_only, (team_a, team_b, opponent)))
+        for battle_id in range(battles):
+            if deterministic and battle_id:
+                # No random numbers are used, every battle id gives the same sample
+                differences.append(differences[-1])
+                continue
+            difference = _difference(team_a, team_b, opponent, seed, battle_id)
+            if antithetic:
+                mirrored = _difference(team_a, team_b, opponent, seed, battle_id, True)
+                difference = (difference + mirrored) / 2
+            differences.append(difference)
+
+    samples = len(differences)
+    mean = sum(differences) / samples if samples else 0.0
+    variance = (
+        sum((d - mean) ** 2 for d in differences) / (samples - 1)
+        if samples > 1
+        else 0.0
+    )
+    return Comparison(samples, mean, variance)
+
+
+def _score(result: BattleResult) -> float:
+    return (result.value + 1) / 2
+
+
+def _difference(
+    team_a: Team,
+    team_b: Team,
+    opponent: Team,
+    seed: int,
+    battle_id: int,
+    antithetic: bool = False,
+) -> float:
+    """Score difference of the teams on one (possibly antithetic) random stream"""
+    scores = []
+    for team in (team_a, team_b):
+        rand = RandStream(seed, battle_id, antithetic=antithetic)
+        scores.append(_score(Battle(team, opponent, rand=rand).run()))
+    return scores[0] - scores[1]
@@ -0,0 +1,115 @@
+"""Module for compact, canonical team encodings
+
+A team is encoded as the marshalled tuple of its slots, each empty slot as None
+and each pet as (name, tier, level, experience, stats, ability). Abilities are
+stored as canonical JSON so equal teams always encode to equal bytes, which
+makes the encoding usable for sending teams between processes. The marshal
+format may change between Python versions, so team_hash digests the same slots
+as compact JSON instead, giving hashes that are stable wherever they are stored.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+from functools import lru_cache
+
+from superautosim.abilities import Ability
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+# Bump when the encoding changes, so hashes of different layouts never collide
+ENCODING_VERSION = 2
+# Versions 3+ write back-references that depend on object identity, so equal
+# teams could encode differently
+_MARSHAL_VERSION = 2
+
+
+def encode_team(team: Team) -> bytes:
+    """Returns the canonical byte encoding of a team"""
+    return marshal.dumps((ENCODING_VERSION, team_slots(team)), _MARSHAL_VERSION)
+
+
+def team_slots(team: Team) -> tuple:
+    """Returns the canonical tuple of a team's slots, as stored by encode_team"""
+    slots = []
+    for pet in team:
+        if pet is None:
+            slots.append(None)
+            continue
+        ability = "" if pet.ability is None else _ability_json(pet.ability)
+        slots.append(
+            (pet.name, pet.tier, pet.level, pet.experience, pet.stats, ability)
+        )
+    return tuple(slots)
+
+
+def decode_team(data: bytes) -> Team:
+    """Creates a team from its byte encoding
+
+    Pets with equal abilities share one ability prototype.
+
+    Raises:
+        ValueError: data is not a team encoding of this version.
+    """
+    try:
+        version, slots = marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as exc:
+        raise ValueError("Invalid team encoding") from exc
+    if version != ENCODING_VERSION:
+        raise ValueError(f"Unsupported team encoding version {version}")
+    if not isinstance(slots, tuple) or len(slots) > Team.MAX_TEAM_SIZE:
+        raise ValueError("Invalid team encoding slots")
+    for slot in slots:
+        if slot is not None and not _valid_slot(slot):
+            raise ValueError(f"Invalid team encoding slot {slot!r}")
+
+    pets: list[Pet | None] = []
+    for slot in slots:
+        if slot is None:
+            pets.append(None)
+            continue
+        name, tier, level, experience, stats, ability = slot
+        pet = Pet(name, stats)
+        pet.tier = tier
+        pet.level = level
+        pet.experience = experience
+        if ability:
+            pet.ability = _ability_prototype(ability)
+        pets.append(pet)
+    return Team(pets)
+
+
+def team_hash(team: Team) -> str:
+    """Returns a hex digest identifying the team, equal for equal teams"""
+    return team_digest(team).hex()
+
+
+def team_digest(team: Team) -> bytes:
+    """Returns the 32 byte digest of team_hash"""
+    slots = json.dumps([ENCODING_VERSION, team_slots(team)], separators=(",", ":"))
+    return hashlib.sha256(slots.encode("ascii")).digest()
+
+
+def _valid_slot(slot) -> bool:
+    """Whether a decoded slot has the shape written by team_slots"""
+    if not isinstance(slot, tuple) or len(slot) != 6:
+        return False
+    name, tier, level, experience, stats, ability = slot
+    return (
+        isinstance(name, str)
+        and all(type(value) is int for value in (tier, level, experience))
+        and isinstance(stats, tuple)
+        and len(stats) == 4
+        and all(type(value) is int for value in stats)
+        and isinstance(ability, str)
+    )
+
+
+def _ability_json(ability: Ability) -> str:
+    return json.dumps(ability.to_dict(), sort_keys=True, separators=(",", ":"))
+
+
+@lru_cache(maxsize=1024)
+def _ability_prototype(ability_json: str) -> Ability:
+    return Ability.from_dict(json.loads(ability_json))
@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 from superautosim.pets import Pet
 from superautosim.teams import Team
 
+if TYPE_CHECKING:
+    from superautosim.scheduler import EventScheduler
+    from superautosim.tracing import TraceRecorder
+
 
 class EventType(Enum):
     NONE = auto()
@@ -28,7 +35,7 @@ class EventType(Enum):
     END_TURN = END_OF_TURN  # Is there a difference?
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Class for providing event data"""
 
@@ -37,6 +44,16 @@ class Event:
     # food: Food = None
     in_battle: bool = False
     teams: tuple = field(default_factory=tuple)
+    # Scheduler resolving the event, actions schedule follow-up events with it
+    scheduler: EventScheduler | None = field(default=None, repr=False, compare=False)
+    # The scheduler's trace recorder, None unless the battle is traced
+    trace: TraceRecorder | None = field(default=None, repr=False, compare=False)
+    # Filter results cached while this event is resolved, see Filter memoisation
+    _filter_memo: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Team.mutations when the memoised results were computed, -1 if never
+    _filter_memo_version: int = field(default=-1, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if len(self.teams) > 2:
@@ -71,3 +88,71 @@ class Event:
         else:
             raise ValueError("pet must be in at least 1 event team")
         return (friendly_team, enemy_team)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        type_: EventType,
+        pet: Pet | None,
+        in_battle: bool,
+        teams: tuple,
+        scheduler: EventScheduler | None = None,
+        trace: TraceRecorder | None = None,
+    ) -> Event:
+        """Create an event without validation, for trusted internal callers"""
+        event = object.__new__(cls)
+        event.type = type_
+        event.pet = pet
+        event.in_battle = in_battle
+        event.teams = teams
+        event.scheduler = scheduler
+        event.trace = trace
+        event._filter_memo = {}
+        event._filter_memo_version = -1
+        return event
+
+
+class EventPool:
+    """Pool of reusable events for the battle loop
+
+    Events are acquired without validation, so callers must only give at most 2
+    teams. Released events are reset and handed out again by later acquires, so
+    they must not be used after release.
+    """
+
+    def __init__(self) -> None:
+        self._free: list[Event] = []
+
+    def acquire(
+        self,
+        type_: EventType,
+        pet: Pet | None = None,
+        in_battle: bool = False,
+        teams: tuple = (),
+        scheduler: EventScheduler | None = None,
+        trace: TraceRecorder | None = None,
+    ) -> Event:
+        """Return a pooled event with the given data"""
+        if not self._free:
+            return Event._unchecked(type_, pet, in_battle, teams, scheduler, trace)
+        event = self._free.pop()
+        event.type = type_
+        event.pet = pet
+        event.in_battle = in_battle
+        event.teams = teams
+        event.scheduler = scheduler
+        event.trace = trace
+        return event
+
+    def release(self, event: Event):
+        """Return an event to the pool, dropping its references to pets and teams"""
+        event.pet = None
+        event.teams = ()
+        event.scheduler = None
+        event.trace = None
+        event._filter_memo.clear()
+        event._filter_memo_version = -1
+        self._free.append(event)
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -0,0 +1,171 @@
+"""Module for re-evaluating teams incrementally from an evaluated parent team
+
+Every team is battled against each opponent on the same battle ids, so a child
+team that differs from an evaluated parent in a single slot shares the parent's
+random streams (common random numbers). A parent battle in which no ability ran
+and no pet at or behind the changed slot reached the front was decided by the
+pets ahead of that slot, so its result is reused rather than re-simulated.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import NamedTuple, Sequence
+
+from superautosim.batch import is_stat_only
+from superautosim.battle import Battle, BattleResult
+from superautosim.encoding import team_slots
+from superautosim.montecarlo import Tally
+from superautosim.teams import Team
+
+# Stands in for the changed slot when looking up parents
+_ANY_SLOT = object()
+
+
+class BattleRecord(NamedTuple):
+    result: BattleResult
+    # Furthest slot of the evaluated team whose pet reached the front
+    reach: int
+    activations: int
+    # Slots of the evaluated team's surviving pets
+    survivors: tuple[int, ...]
+
+    def reusable(self, slot: int, key: tuple) -> bool:
+        """Whether the result holds for the team with the given team_slots key,
+        which differs from the evaluated team only in the given slot
+        """
+        if self.activations or self.reach >= slot:
+            return False
+        if any(survivor <= self.reach for survivor in self.survivors):
+            return True
+        # Only unreached pets can survive, so only whether there are any matters
+        unreached = any(survivor > self.reach for survivor in self.survivors)
+        return unreached == _has_pets(key, self.reach + 1)
+
+
+class IncrementalEvaluator:
+    """Scores teams against fixed opponents, reusing parent battle results
+
+    Has the same evaluate interface and scores as search.FitnessEvaluator, but
+    runs in this process so parent battle records can be shared between teams.
+    """
+
+    def __init__(
+        self,
+        opponents: Sequence[Team],
+        battles: int,
+        seed: int = 0,
+        max_records: int = 4096,
+    ):
+        """Initialises an incremental evaluator
+
+        Args:
+            opponents (Sequence[Team]): Teams every candidate is scored against.
+            battles (int): Battles played against each opponent.
+            seed (int): Seed of every battle's random stream.
+            max_records (int): Number of evaluated teams whose battle records are
+                kept for reuse, least recently used first out.
+        """
+        if not opponents:
+            raise ValueError("IncrementalEvaluator needs at least one opponent")
+        self._opponents = list(opponents)
+        self._battles = battles
+        self._seed = seed
+        self._max_records = max_records
+        # Per opponent battle records of each evaluated team, keyed by team_slots
+        self._records: OrderedDict[tuple, list[list[BattleRecord]]] = OrderedDict()
+        # Keys of evaluated teams with one slot replaced by _ANY_SLOT
+        self._masked: dict[tuple, tuple] = {}
+        self.simulated = 0
+        self.reused = 0
+
+    def evaluate(self, teams: Sequence[Team]) -> list[float]:
+        """Returns the fitness of each team, in [0, 1]"""
+        return [
+            sum(tally.score for tally in tallies) / len(tallies)
+            for tallies in map(self.tallies, teams)
+        ]
+
+    def tallies(self, team: Team) -> list[Tally]:
+        """Returns the team's tally against each opponent"""
+        key = team_slots(team)
+        records = self._records.get(key)
+        if records is None:
+            records = self._evaluate(team, key)
+        else:
+            self._records.move_to_end(key)
+        return [
+            Tally.from_results(record.result for record in opponent_records)
+            for opponent_records in records
+        ]
+
+    def _evaluate(self, team: Team, key: tuple) -> list[list[BattleRecord]]:
+        parent, slot = self._find_parent(key)
+        changed = key[slot] if parent is not None else None
+        if changed is not None and changed[-1]:
+            # A new ability can act from any slot
+            parent = None
+
+        records = []
+        for opponent_idx, opponent in enumerate(self._opponents):
+            if is_stat_only(team) and is_stat_only(opponent):
+                # No random numbers are used, every battle is the same
+                battle_ids = range(min(1, self._battles))
+            else:
+                battle_ids = range(self._battles)
+            opponent_records = []
+            for battle_id in battle_ids:
+                if parent is not None:
+                    record = parent[opponent_idx][battle_id]
+                    if record.reusable(slot, key):
+                        self.reused += 1
+                        opponent_records.append(record)
+                        continue
+                self.simulated += 1
+                opponent_records.append(self._simulate(team, opponent, battle_id))
+            if len(battle_ids) < self._battles:
+                opponent_records *= self._battles
+            records.append(opponent_records)
+
+        self._store(key, records)
+        return records
+
+    def _simulate(self, team: Team, opponent: Team, battle_id: int) -> BattleRecord:
+        battle = Battle(team, opponent, self._seed, battle_id)
+        result = battle.run()
+        return BattleRecord(
+            result,
+            battle.reach[0],
+            battle.activations,
+            tuple(battle.surviving_slots(0)),
+        )
+
+    def _find_parent(self, key: tuple) -> tuple[list | None, int]:
+        """Returns the records of an evaluated team differing only in one slot"""
+        for slot in range(len(key)):
+            parent_key = self._masked.get(_mask(key, slot))
+            if parent_key is not None and parent_key in self._records:
+                return self._records[parent_key], slot
+        return None, -1
+
+    def _store(self, key: tuple, records: list[list[BattleRecord]]):
+        self._records[key] = records
+        for slot in range(len(key)):
+            self._masked[_mask(key, slot)] = key
+        while len(self._records) > self._max_records:
+            evicted, _ = self._records.popitem(last=False)
+            for slot in range(len(evicted)):
+                masked = _mask(evicted, slot)
+                if self._masked.get(masked) == evicted:
+                    del self._masked[masked]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def _mask(key: tuple, slot: int) -> tuple:
+    return (*key[:slot], _ANY_SLOT, *key[slot + 1 :])
+
+
+def _has_pets(key: tuple, start: int) -> bool:
+    """Whether the team_slots key has a pet with health from the start slot"""
+    return any(slot is not None and slot[4][1] + slot[4][3] > 0 for slot in key[start:])
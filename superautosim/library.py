@@ -0,0 +1,240 @@
+"""Module for loading libraries of pet definitions"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import marshal
+import os
+from typing import Iterator
+
+from superautosim.abilities import Ability, AbilityDict
+from superautosim.pets import Pet
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore[assignment]
+
+# Bump when the cache layout changes to invalidate existing cache files
+CACHE_FORMAT = b"superautosim-library-1" + bytes([marshal.version])
+MAX_TIER = 6
+
+
+@dataclasses.dataclass(frozen=True)
+class PetDefinition:
+    """Validated definition of a pet, used to create pet instances"""
+
+    name: str
+    tier: int
+    attack: int
+    health: int
+    ability: AbilityDict | None = None
+
+    def to_dict(self) -> dict:
+        result = {
+            "name": self.name,
+            "tier": self.tier,
+            "attack": self.attack,
+            "health": self.health,
+        }
+        if self.ability is not None:
+            result["ability"] = self.ability
+        return result
+
+    @staticmethod
+    def from_dict(definition_dict: dict) -> PetDefinition:
+        """Creates and validates a pet definition from its dictionary representation
+
+        The ability is checked by building it, and stored in its canonical form
+        (the output of Ability.to_dict).
+
+        Args:
+            definition_dict (dict): dictionary with "name", "tier", "attack",
+                "health" and optional "ability" keys.
+
+        Raises:
+            ValueError: When given an invalid dictionary
+
+        Returns:
+            PetDefinition: The validated definition
+        """
+        name = definition_dict.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Pet definition must have a name: {definition_dict}")
+        tier = definition_dict.get("tier")
+        if not isinstance(tier, int) or not 1 <= tier <= MAX_TIER:
+            raise ValueError(f"{name}: tier must be an integer from 1 to {MAX_TIER}")
+        for stat in ("attack", "health"):
+            value = definition_dict.get(stat)
+            if not isinstance(value, int) or not 1 <= value <= Pet.STAT_CAP:
+                raise ValueError(f"{name}: {stat} must be an integer from 1 to 50")
+
+        ability = definition_dict.get("ability")
+        if ability is not None:
+            try:
+                ability = Ability.from_dict(ability).to_dict()
+            except (ValueError, TypeError, KeyError) as err:
+                raise ValueError(f"{name}: invalid ability ({err})") from err
+
+        return PetDefinition(
+            name, tier, definition_dict["attack"], definition_dict["health"], ability
+        )
+
+
+class Library:
+    """Collection of pet definitions, keyed by pet name"""
+
+    def __init__(self, definitions: list[PetDefinition]):
+        self._definitions: dict[str, PetDefinition] = {}
+        for definition in definitions:
+            if definition.name in self._definitions:
+                raise ValueError(f"Duplicate pet definition: {definition.name}")
+            self._definitions[definition.name] = definition
+        # Ability prototypes shared by all instances, keyed by interned ability id
+        self._prototypes: dict[int, Ability] = {}
+
+    def create_pet(self, name: str) -> Pet:
+        """Create a new pet instance from the named definition"""
+        definition = self._definitions[name]
+        pet = Pet(definition.name, (definition.attack, definition.health))
+        pet.tier = definition.tier
+        if definition.ability is not None:
+            pet.ability = self.get_prototype(definition)
+        return pet
+
+    def get_prototype(self, definition: PetDefinition) -> Ability | None:
+        """Return the shared ability of the definition, built on first use"""
+        if definition.ability is None:
+            return None
+        prototype = self._prototypes.get(id(definition.ability))
+        if prototype is None:
+            prototype = Ability.from_dict(definition.ability)
+            self._prototypes[id(definition.ability)] = prototype
+        return prototype
+
+    def to_dict(self) -> dict:
+        return {"pets": [d.to_dict() for d in self]}
+
+    @staticmethod
+    def from_dict(library_dict: dict) -> Library:
+        """Creates a library from a dictionary with a list of pet definitions
+
+        Raises:
+            ValueError: When any definition is invalid
+        """
+        if not isinstance(library_dict.get("pets"), list):
+            raise ValueError("Library dict must have a list of pets")
+        definitions = []
+        # Identical abilities share a single canonical dictionary
+        interned: dict[str, AbilityDict] = {}
+        for definition_dict in library_dict["pets"]:
+            definition = PetDefinition.from_dict(definition_dict)
+            if definition.ability is not None:
+                key = json.dumps(definition.ability, sort_keys=True)
+                ability = interned.setdefault(key, definition.ability)
+                definition = dataclasses.replace(definition, ability=ability)
+            definitions.append(definition)
+        return Library(definitions)
+
+    @staticmethod
+    def load(path: str | os.PathLike, cache_path: str | os.PathLike | None = None):
+        """Load a JSON or TOML library file, using a binary cache when possible
+
+        The parsed and validated definitions are stored in a marshal cache file
+        (`<path>.cache` by default) tagged with a hash of the library contents.
+        The cache is used when the hash matches, skipping parsing and validation;
+        otherwise the library is re-read and the cache rewritten.
+
+        Args:
+            path: Path of a `.json` or `.toml` library file.
+            cache_path: Path of the cache file.
+
+        Raises:
+            ValueError: When the library is invalid
+
+        Returns:
+            Library: The loaded library.
+        """
+        with open(path, "rb") as file:
+            content = file.read()
+        digest = hashlib.sha256(CACHE_FORMAT + content).digest()
+        cache_path = f"{os.fspath(path)}.cache" if cache_path is None else cache_path
+
+        library = Library._read_cache(cache_path, digest)
+        if library is None:
+            library = Library.from_dict(_parse_library(os.fspath(path), content))
+            Library._write_cache(cache_path, digest, library)
+        return library
+
+    @staticmethod
+    def _read_cache(cache_path, digest: bytes) -> Library | None:
+        try:
+            with open(cache_path, "rb") as file:
+                if file.read(len(digest)) != digest:
+                    return None
+                abilities, rows = marshal.load(file)
+            return Library(
+                [
+                    PetDefinition(*stats, None if idx < 0 else abilities[idx])
+                    for *stats, idx in rows
+                ]
+            )
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, digest: bytes, library: Library):
+        # Interned abilities are stored once and referenced by index
+        abilities: list[AbilityDict] = []
+        indices: dict[int, int] = {}
+        rows = []
+        for definition in library:
+            idx = -1
+            if definition.ability is not None:
+                idx = indices.setdefault(id(definition.ability), len(abilities))
+                if idx == len(abilities):
+                    abilities.append(definition.ability)
+            rows.append(
+                (
+                    definition.name,
+                    definition.tier,
+                    definition.attack,
+                    definition.health,
+                    idx,
+                )
+            )
+        try:
+            with open(cache_path, "wb") as file:
+                file.write(digest)
+                marshal.dump((abilities, rows), file)
+        except OSError:
+            # A read-only location only costs the validation on the next load
+            pass
+
+    def __getitem__(self, name: str) -> PetDefinition:
+        return self._definitions[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._definitions
+
+    def __iter__(self) -> Iterator[PetDefinition]:
+        return iter(self._definitions.values())
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def __repr__(self) -> str:
+        return f"Library<{list(self._definitions)}>"
+
+
+def _parse_library(path: str, content: bytes) -> dict:
+    """Parse library file content as TOML or JSON depending on the file extension"""
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ImportError("Loading TOML libraries requires Python 3.11+ or tomli")
+        return tomllib.loads(content.decode())
+    return json.loads(content)
@@ -0,0 +1,175 @@
+"""Module for counting and timing calls to the battle engine's hot paths
+
+When metrics are enabled the hot-path methods of every built-in trigger, filter,
+selector, target generator, action and Team mutation are replaced by wrappers
+that count calls and accumulate time. Disabling restores the original methods,
+so there is no overhead at all when metrics are off. Metrics are enabled with
+the `instrument` context manager, or for a whole process by setting the
+SUPERAUTOSIM_METRICS environment variable, which prints a breakdown at exit.
+
+Only the outermost call of each subsystem is counted and timed, so nested calls
+(e.g. the child filters of an ALL filter, or super() calls) are part of their
+parent's time and subsystem totals never double-count. Times are inclusive of
+other subsystems, e.g. Action time includes the targets it generates. Classes
+defined after metrics were enabled are not instrumented.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Iterator
+
+from superautosim.actions import Action
+from superautosim.targets.filters import Filter
+from superautosim.targets.selectors import Selector
+from superautosim.targets.target_generators import TargetGenerator
+from superautosim.teams import Team
+from superautosim.triggers import Trigger
+
+ENV_VAR = "SUPERAUTOSIM_METRICS"
+
+# Subsystem name: (base class, instrumented method names)
+SUBSYSTEMS: dict[str, tuple[type, tuple[str, ...]]] = {
+    "Trigger": (Trigger, ("is_triggered",)),
+    "Filter": (Filter, ("filter",)),
+    "Selector": (Selector, ("select",)),
+    "TargetGenerator": (TargetGenerator, ("get",)),
+    "Action": (Action, ("run",)),
+    "Team": (Team, ("summon_pet", "insert_pet", "remove_pet")),
+}
+
+
+@dataclass
+class Counter:
+    calls: int = 0
+    seconds: float = 0.0
+
+    def __add__(self, other: Counter) -> Counter:
+        return Counter(self.calls + other.calls, self.seconds + other.seconds)
+
+
+class Metrics:
+    """Call counters of each instrumented class, grouped by subsystem"""
+
+    def __init__(self):
+        self.counters: dict[tuple[str, str], Counter] = {}
+
+    def record(self, subsystem: str, cls: type, seconds: float):
+        counter = self.counters.get((subsystem, cls.__name__))
+        if counter is None:
+            counter = self.counters[subsystem, cls.__name__] = Counter()
+        counter.calls += 1
+        counter.seconds += seconds
+
+    def breakdown(self) -> dict[str, Counter]:
+        """Returns the total counter of each subsystem"""
+        totals = {subsystem: Counter() for subsystem in SUBSYSTEMS}
+        for (subsystem, _), counter in self.counters.items():
+            totals[subsystem] += counter
+        return totals
+
+    def format(self) -> str:
+        """Returns a table of each subsystem's calls and time, then each class's"""
+        lines = [f"{'subsystem':<32}{'calls':>12}{'seconds':>12}"]
+        for subsystem, counter in self.breakdown().items():
+            lines.append(f"{subsystem:<32}{counter.calls:>12}{counter.seconds:>12.6f}")
+            for (owner, name), counter in sorted(self.counters.items()):
+                if owner == subsystem:
+                    lines.append(
+                        f"  {name:<30}{counter.calls:>12}{counter.seconds:>12.6f}"
+                    )
+        return "\n".join(lines)
+
+    def reset(self):
+        self.counters.clear()
+
+
+_current: Metrics | None = None
+_originals: list[tuple[type, str, Callable]] = []
+# Subsystems with an instrumented call in progress, per thread
+_active = threading.local()
+
+
+def enabled() -> bool:
+    return _current is not None
+
+
+def enable(metrics: Metrics | None = None) -> Metrics:
+    """Start recording into metrics (a new Metrics if not given)
+
+    Returns:
+        Metrics: The metrics being recorded into.
+    """
+    global _current
+    _current = Metrics() if metrics is None else metrics
+    if not _originals:
+        for subsystem, (base, names) in SUBSYSTEMS.items():
+            for cls in _subclasses(base):
+                for name in names:
+                    method = cls.__dict__.get(name)
+                    if method is None or getattr(method, "__isabstractmethod__", False):
+                        continue
+                    _originals.append((cls, name, method))
+                    setattr(cls, name, _instrumented(method, subsystem))
+    return _current
+
+
+def disable():
+    """Stop recording and restore the original methods"""
+    global _current
+    _current = None
+    while _originals:
+        cls, name, method = _originals.pop()
+        setattr(cls, name, method)
+
+
+@contextmanager
+def instrument() -> Iterator[Metrics]:
+    """Context manager recording metrics of the calls made within it"""
+    previous = _current
+    metrics = enable()
+    try:
+        yield metrics
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def _subclasses(cls: type) -> list[type]:
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        classes.extend(c for c in _subclasses(subclass) if c not in classes)
+    return classes
+
+
+def _instrumented(method: Callable, subsystem: str) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        active = _active.__dict__
+        if active.get(subsystem) or _current is None:
+            return method(self, *args, **kwargs)
+        active[subsystem] = True
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            active[subsystem] = False
+            if _current is not None:
+                _current.record(subsystem, type(self), perf_counter() - start)
+
+    return wrapper
+
+
+def _enable_from_environment():
+    """Enable metrics for the process if ENV_VAR is set, reporting at exit"""
+    if os.environ.get(ENV_VAR, "") not in ("", "0"):
+        metrics = enable()
+        atexit.register(lambda: print(metrics.format(), file=sys.stderr))
@@ -0,0 +1,175 @@
+"""Module for estimating matchup outcomes by simulating many battles"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+from superautosim.backends import Backend
+from superautosim.batch import is_stat_only, run_batch
+from superautosim.battle import BattleResult
+from superautosim.encoding import decode_team, team_digest
+from superautosim.teams import Team
+
+
+@dataclass
+class Tally:
+    """Counts of battle results, from the perspective of the first team"""
+
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        """Fraction of battles won, counting draws as half a win"""
+        if not self.total:
+            return 0.0
+        return (self.wins + self.draws / 2) / self.total
+
+    def add(self, result: BattleResult):
+        if result is BattleResult.WIN:
+            self.wins += 1
+        elif result is BattleResult.LOSS:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def mirrored(self) -> Tally:
+        """Returns the tally from the perspective of the opposing team"""
+        return Tally(self.losses, self.draws, self.wins)
+
+    def __add__(self, other: Tally) -> Tally:
+        return Tally(
+            self.wins + other.wins,
+            self.draws + other.draws,
+            self.losses + other.losses,
+        )
+
+    @classmethod
+    def repeated(cls, result: BattleResult, battles: int) -> Tally:
+        """Returns the tally of the same result repeated for every battle"""
+        if result is BattleResult.WIN:
+            return cls(wins=battles)
+        if result is BattleResult.LOSS:
+            return cls(losses=battles)
+        return cls(draws=battles)
+
+    @classmethod
+    def from_results(cls, results: Iterable[BattleResult]) -> Tally:
+        tally = cls()
+        for result in results:
+            tally.add(result)
+        return tally
+
+
+class ResultRecord(NamedTuple):
+    """Result of a matchup, identifying the teams by their team_digest"""
+
+    team_a: bytes
+    team_b: bytes
+    seed: int
+    wins: int
+    draws: int
+    losses: int
+
+    @property
+    def tally(self) -> Tally:
+        return Tally(self.wins, self.draws, self.losses)
+
+    @classmethod
+    def from_tally(
+        cls, team_a: bytes, team_b: bytes, seed: int, tally: Tally
+    ) -> ResultRecord:
+        return cls(team_a, team_b, seed, tally.wins, tally.draws, tally.losses)
+
+
+def simulate(
+    team_a: Team,
+    team_b: Team,
+    battles: int,
+    seed: int = 0,
+    first_battle_id: int = 0,
+    backend: Backend | None = None,
+) -> Tally:
+    """Battle two teams repeatedly and tally the results
+
+    Battle i uses the random stream (seed, first_battle_id + i), so equal
+    arguments always give the same tally.
+
+    Args:
+        team_a (Team): The first team, the tally is from its perspective.
+        team_b (Team): The opposing team.
+        battles (int): Number of battles to run.
+        seed (int): Seed of every battle's random stream.
+        first_battle_id (int): Battle id of the first battle.
+        backend (Backend, optional): Backend for stat-only battles.
+
+    Returns:
+        Tally: The battle results.
+    """
+    if battles and is_stat_only(team_a) and is_stat_only(team_b):
+        # Stat-only battles use no random numbers, every battle is the same
+        (result,) = run_batch([(team_a, team_b)], backend=backend)
+        return Tally.repeated(result, battles)
+    matchups = [(team_a, team_b)] * battles
+    return Tally.from_results(
+        run_batch(matchups, seed, first_battle_id, backend=backend)
+    )
+
+
+def simulate_encoded(
+    team_a: bytes, team_b: bytes, battles: int, seed: int = 0
+) -> Tally:
+    """simulate for teams in their encode_team encoding, e.g. in a process pool"""
+    return simulate(decode_team(team_a), decode_team(team_b), battles, seed)
+
+
+def simulate_encoded_batch(
+    requests: Sequence[tuple[bytes, bytes, int, int]]
+) -> list[Tally | Exception]:
+    """simulate_encoded for many (team_a, team_b, battles, seed) requests at once
+
+    Stat-only matchups of every request go to the batched engine together. A
+    request that fails gives its exception in place of a tally, so one bad
+    request does not fail the others.
+    """
+    results: list[Tally | Exception | None] = [None] * len(requests)
+    stat_only: list[tuple[int, Team, Team]] = []
+    for i, (team_a, team_b, battles, seed) in enumerate(requests):
+        try:
+            decoded_a, decoded_b = decode_team(team_a), decode_team(team_b)
+            if battles and is_stat_only(decoded_a) and is_stat_only(decoded_b):
+                stat_only.append((i, decoded_a, decoded_b))
+            else:
+                results[i] = simulate(decoded_a, decoded_b, battles, seed)
+        except Exception as exc:  # pylint: disable=broad-except
+            results[i] = exc
+
+    if stat_only:
+        outcomes = run_batch([(team_a, team_b) for _, team_a, team_b in stat_only])
+        for (i, _, _), outcome in zip(stat_only, outcomes):
+            # Stat-only battles use no random numbers, every battle is the same
+            results[i] = Tally.repeated(outcome, requests[i][2])
+    return results
+
+
+def iter_simulate(
+    matchups: Iterable[tuple[Team, Team]],
+    battles: int,
+    seed: int = 0,
+    backend: Backend | None = None,
+) -> Iterator[ResultRecord]:
+    """Lazily simulate each matchup, yielding its result record
+
+    Matchups are consumed one at a time, so a sweep can be streamed to a
+    results.ResultWriter without holding every result in memory.
+    """
+    for team_a, team_b in matchups:
+        tally = simulate(team_a, team_b, battles, seed, backend=backend)
+        yield ResultRecord.from_tally(
+            team_digest(team_a), team_digest(team_b), seed, tally
+        )
@@ -1,4 +1,5 @@
 """Module defining the Pet class"""
+from __future__ import annotations
 
 
 class Pet:
@@ -20,19 +21,27 @@ class Pet:
             if len(stats) == 4:
                 self._temp_attack, self._temp_health = stats[2:]
 
+        # Total stats are stored rather than computed so that selectors and
+        # damage resolution read them without summing. Only _update_totals and
+        # take_damage write them, the public attack/health are read-only.
+        self._update_totals()
+
         self.ability = None
+        # State of the ability's stateful triggers, abilities themselves are
+        # shared between every pet with the same definition
+        self.ability_counters: dict = {}
         self.perk = None
 
         self.experience = 0
         self.level = 1
 
     @property
-    def attack(self):
-        return self._perm_attack + self._temp_attack
+    def attack(self) -> int:
+        return self._attack
 
     @property
-    def health(self):
-        return self._perm_health + self._temp_health
+    def health(self) -> int:
+        return self._health
 
     @property
     def stats(self):
@@ -71,5 +80,89 @@ class Pet:
             self._perm_attack += attack_added
             self._perm_health += health_added
 
+        self._update_totals()
+
+    def reset_temp_stats(self):
+        """Remove the pet's temporary stats, e.g. when a turn or battle ends"""
+        self._temp_attack = 0
+        self._temp_health = 0
+        self._update_totals()
+
+    @property
+    def fainted(self) -> bool:
+        return self.health <= 0
+
+    def take_damage(self, damage: int) -> int:
+        """Reduce the pet's health by the given damage
+
+        Unlike add_stats, health may drop below 1, at which point the pet has fainted.
+        Damage is taken from temporary health so it is restored after battle.
+
+        Args:
+            damage (int): Damage to deal, negative values are treated as 0.
+
+        Returns:
+            int: The damage dealt.
+        """
+        damage = max(0, damage)
+        self._temp_health -= damage
+        self._health -= damage
+        return damage
+
+    def copy_from(self, other: Pet):
+        """Overwrite this pet's state with a copy of another pet's state"""
+        self.name = other.name
+        self.tier = other.tier
+        (
+            self._perm_attack,
+            self._perm_health,
+            self._temp_attack,
+            self._temp_health,
+        ) = other.stats
+        self._attack = other.attack
+        self._health = other.health
+        self.ability = other.ability
+        self.ability_counters.clear()
+        self.perk = other.perk
+        self.experience = other.experience
+        self.level = other.level
+
+    def _update_totals(self):
+        self._attack = self._perm_attack + self._temp_attack
+        self._health = self._perm_health + self._temp_health
+
     def __repr__(self) -> str:
         return f"{self.name}<{self.attack}-{self.health}>"
+
+
+class PetPool:
+    """Pool of reusable copies of a prototype pet
+
+    Acquired pets start with the prototype's state. Released pets are handed out
+    again by later acquires, so they must not be used after release.
+    """
+
+    def __init__(self, prototype: Pet) -> None:
+        self._prototype = prototype
+        self._free: list[Pet] = []
+
+    @property
+    def prototype(self) -> Pet:
+        return self._prototype
+
+    def acquire(self) -> Pet:
+        """Return a copy of the prototype"""
+        try:
+            # A single pop, so battles on other threads can share the pool
+            pet = self._free.pop()
+        except IndexError:
+            pet = Pet()
+        pet.copy_from(self._prototype)
+        return pet
+
+    def release(self, pet: Pet):
+        """Return a pet to the pool"""
+        self._free.append(pet)
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -0,0 +1,81 @@
+"""Module defining counter-based random number streams
+
+Each random number is a pure function of (seed, stream, counter), so a battle
+identified by a stream id draws the same numbers regardless of which process,
+batch or order it is simulated in.
+"""
+from __future__ import annotations
+
+MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_FLOAT_SCALE = 2.0**-53
+
+
+def splitmix64(value: int) -> int:
+    """Returns the splitmix64 hash of a 64 bit integer"""
+    value = (value + _GOLDEN_GAMMA) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def stream_key(seed: int, stream: int) -> int:
+    """Returns the key identifying the random stream of the given seed"""
+    return splitmix64((seed & MASK64) ^ splitmix64(stream & MASK64))
+
+
+def uniform(seed: int, stream: int, counter: int) -> float:
+    """Returns the counter-th number of a stream, following `0 >= rand and rand < 1`"""
+    return RandStream(seed, stream, counter)()
+
+
+class RandStream:
+    """Callable producing the numbers of a counter-based random stream in order"""
+
+    def __init__(
+        self, seed: int = 0, stream: int = 0, counter: int = 0, antithetic=False
+    ) -> None:
+        """Initialises a random stream
+
+        Args:
+            seed (int): Seed shared by related streams, e.g. every battle of a run.
+            stream (int): Identifier of the stream, e.g. a battle id.
+            counter (int): Index of the next number to draw.
+            antithetic (bool): Mirror every number u of the stream to 1 - u,
+                shifted down one step so that 0 maps to the largest value below 1.
+        """
+        self.seed = seed
+        self.stream = stream
+        self.counter = counter
+        self.antithetic = antithetic
+        self._key = stream_key(seed, stream)
+
+    def __call__(self) -> float:
+        value = splitmix64((self._key + self.counter) & MASK64) >> 11
+        self.counter += 1
+        if self.antithetic:
+            value = (1 << 53) - 1 - value
+        return value * _FLOAT_SCALE
+
+    def __repr__(self) -> str:
+        antithetic = ", antithetic" if self.antithetic else ""
+        return f"RandStream<{self.seed}, {self.stream}, {self.counter}{antithetic}>"
+
+
+class PrefetchedStream(RandStream):
+    """RandStream whose first numbers were drawn in advance, e.g. by a backend
+
+    The prefetched numbers must be the stream's own, from counter 0 onwards,
+    numbers past them are drawn as usual.
+    """
+
+    def __init__(self, seed: int, stream: int, prefetched: list[float]) -> None:
+        super().__init__(seed, stream)
+        self._prefetched = prefetched
+
+    def __call__(self) -> float:
+        if self.counter < len(self._prefetched):
+            value = self._prefetched[self.counter]
+            self.counter += 1
+            return value
+        return super().__call__()
@@ -0,0 +1,49 @@
+"""Module for replaying battles from their seed and encoded teams
+
+A battle's random numbers come from the counter-based RandStream(seed, battle_id)
+and its teams have a compact canonical encoding, so those few values reproduce
+any battle exactly. Runs can therefore skip tracing, and a single battle can be
+replayed with a full trace whenever it needs investigating.
+"""
+from __future__ import annotations
+
+from superautosim.battle import Battle
+from superautosim.encoding import decode_team
+from superautosim.tracing import TraceRecorder
+
+
+def replay(
+    seed: int,
+    battle_id: int,
+    team_a_bytes: bytes,
+    team_b_bytes: bytes,
+    max_turns: int | None = None,
+    capacity: int = 1 << 16,
+) -> Battle:
+    """Re-run a battle with tracing enabled
+
+    Args:
+        seed (int): Seed the battle was run with.
+        battle_id (int): Identifier of the battle's random stream, e.g. the
+            battle's index plus first_battle_id in batch.run_batch.
+        team_a_bytes (bytes): encoding.encode_team of the first team.
+        team_b_bytes (bytes): encoding.encode_team of the opposing team.
+        max_turns (int, optional): Turns before the battle is a draw.
+        capacity (int): Trace records kept, see TraceRecorder.
+
+    Raises:
+        ValueError: A team encoding is invalid.
+
+    Returns:
+        Battle: The finished battle, its recorder is Battle.trace.
+    """
+    battle = Battle(
+        decode_team(team_a_bytes),
+        decode_team(team_b_bytes),
+        seed,
+        battle_id,
+        max_turns,
+        trace=TraceRecorder(capacity),
+    )
+    battle.run()
+    return battle
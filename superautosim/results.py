@@ -0,0 +1,202 @@
+"""Module for streaming matchup results to and from fixed-width binary files
+
+A results file is a short header followed by ResultRecords packed as RECORD:
+both 32 byte team digests, the seed and the win/draw/loss counts. Records are
+written in chunks as they are produced, and read back (optionally through mmap)
+without loading the whole file.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator
+
+from superautosim.montecarlo import ResultRecord, Tally
+
+MAGIC = b"SASR"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHH")
+# Seeds are signed, as random.Random and RandStream accept negative seeds
+RECORD = struct.Struct("<32s32sqIII")
+
+
+class ResultWriter:
+    """Appends result records to a file in chunks"""
+
+    def __init__(self, path: str | os.PathLike, chunk_records: int = 4096):
+        """Opens a new results file, replacing any existing file
+
+        Args:
+            path (PathLike): File to write.
+            chunk_records (int): Records buffered before each write.
+        """
+        if chunk_records < 1:
+            raise ValueError("chunk_records must be positive")
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size))
+        self._file.flush()
+        self._chunk_bytes = chunk_records * RECORD.size
+        self._buffer = bytearray()
+        self.records = 0
+
+    def write(self, record: ResultRecord):
+        """Buffer a record, writing the chunk once it is full
+
+        Raises:
+            ValueError: The seed or a count does not fit its fixed-width field.
+        """
+        try:
+            self._buffer += RECORD.pack(*record)
+        except struct.error as exc:
+            raise ValueError(
+                f"Result record out of range (seeds must fit a signed 64 bit "
+                f"integer, counts an unsigned 32 bit integer): {record!r}"
+            ) from exc
+        self.records += 1
+        if len(self._buffer) >= self._chunk_bytes:
+            self.flush()
+
+    def write_all(self, records: Iterable[ResultRecord]) -> int:
+        """Write every record of an iterable, returning the number written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> ResultWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_results(
+    path: str | os.PathLike,
+    records: Iterable[ResultRecord],
+    chunk_records: int = 4096,
+) -> int:
+    """Stream records (e.g. from montecarlo.iter_simulate) to a new results file
+
+    Returns:
+        int: The number of records written.
+    """
+    with ResultWriter(path, chunk_records) as writer:
+        return writer.write_all(records)
+
+
+class ResultReader:
+    """Reads a results file record by record
+
+    With use_mmap the file is mapped rather than read, so the OS pages records in
+    as they are needed and random access is cheap.
+    """
+
+    def __init__(self, path: str | os.PathLike, use_mmap: bool = True):
+        """Opens a results file
+
+        Raises:
+            ValueError: The file is not a results file of this version.
+        """
+        self._file: BinaryIO = open(path, "rb")
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError("Results file is truncated")
+            magic, version, record_size = HEADER.unpack(header)
+            if (
+                magic != MAGIC
+                or version != FORMAT_VERSION
+                or record_size != RECORD.size
+            ):
+                raise ValueError("Not a results file of this version")
+            size = os.fstat(self._file.fileno()).st_size - HEADER.size
+            if size % RECORD.size:
+                raise ValueError("Results file ends with a partial record")
+        except ValueError:
+            self._file.close()
+            raise
+        self._len = size // RECORD.size
+        self._mmap: mmap.mmap | None = None
+        if use_mmap and self._len:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> ResultRecord:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Result record index out of range")
+        offset = HEADER.size + index * RECORD.size
+        if self._mmap is not None:
+            return ResultRecord(*RECORD.unpack_from(self._mmap, offset))
+        self._file.seek(offset)
+        return ResultRecord(*RECORD.unpack(self._file.read(RECORD.size)))
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        return self.iter_chunks()
+
+    def iter_chunks(self, chunk_records: int = 4096) -> Iterator[ResultRecord]:
+        """Iterate over the records, reading chunk_records at a time"""
+        chunk_bytes = chunk_records * RECORD.size
+        for start in range(
+            HEADER.size, HEADER.size + self._len * RECORD.size, chunk_bytes
+        ):
+            if self._mmap is not None:
+                chunk = self._mmap[start : start + chunk_bytes]
+            else:
+                self._file.seek(start)
+                chunk = self._file.read(chunk_bytes)
+            for fields in RECORD.iter_unpack(chunk):
+                yield ResultRecord(*fields)
+
+    def aggregate(self) -> Tally:
+        """Total tally of every record, from each record's first team's perspective"""
+        wins = draws = losses = 0
+        for record in self:
+            wins += record.wins
+            draws += record.draws
+            losses += record.losses
+        return Tally(wins, draws, losses)
+
+    def aggregate_by_team(self, mirror: bool = True) -> dict[bytes, Tally]:
+        """Tally of each team digest over the records it played
+
+        Args:
+            mirror (bool): Also count each record for its second team, mirrored,
+                as for tournament records that only store one direction.
+        """
+        totals: dict[bytes, Tally] = {}
+        for record in self:
+            tally = record.tally
+            totals[record.team_a] = totals.get(record.team_a, Tally()) + tally
+            if mirror and record.team_b != record.team_a:
+                totals[record.team_b] = (
+                    totals.get(record.team_b, Tally()) + tally.mirrored()
+                )
+        return totals
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> ResultReader:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
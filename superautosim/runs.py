@@ -0,0 +1,200 @@
+"""Module for rolling out whole runs (many turns of shop and battle) under a policy
+
+Each turn the player's shop is played by the policy, then the team battles a
+ghost team built by a second shop played by the same policy. Wins give trophies
+and losses cost lives until the run is won, lost or out of turns.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from superautosim.battle import Battle, BattleResult
+from superautosim.library import Library
+from superautosim.rand import RandStream
+from superautosim.shop import (
+    FOOD_COST,
+    PET_COST,
+    ROLL_COST,
+    FoodDefinition,
+    Shop,
+    ShopTables,
+)
+
+STARTING_LIVES = 5
+TROPHIES_TO_WIN = 10
+MAX_TURNS = 30
+
+Policy = Callable[[Shop], None]
+
+
+def lives_lost(turn: int) -> int:
+    """Lives lost by losing a battle in the given turn"""
+    return 1 if turn <= 2 else 2 if turn <= 4 else 3
+
+
+@dataclass
+class RunResult:
+    run_id: int
+    trophies: int
+    lives: int
+    turns: int
+
+    @property
+    def won(self) -> bool:
+        return self.trophies >= TROPHIES_TO_WIN
+
+
+@dataclass
+class RolloutReport:
+    results: list[RunResult]
+    wall_time: float
+
+    @property
+    def seconds_per_thousand(self) -> float:
+        """Wall time per thousand runs"""
+        return self.wall_time * 1000 / len(self.results) if self.results else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(result.won for result in self.results) / len(self.results)
+
+    @property
+    def mean_trophies(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(result.trophies for result in self.results) / len(self.results)
+
+
+class RunEngine:
+    """Plays runs one after another, reusing its shops, teams and pet pools"""
+
+    def __init__(self, tables: ShopTables, policy: Policy, seed: int = 0):
+        self.policy = policy
+        self.seed = seed
+        self._player = Shop(tables, RandStream(seed))
+        self._ghost = Shop(tables, RandStream(seed))
+
+    def play(self, run_id: int, max_turns: int = MAX_TURNS) -> RunResult:
+        """Play a run, its random streams are given by the seed and run id"""
+        player, ghost = self._player, self._ghost
+        # Separate streams so the player's choices never change the ghost's shop
+        player.reset(RandStream(self.seed, 3 * run_id))
+        ghost.reset(RandStream(self.seed, 3 * run_id + 1))
+        battle_rand = RandStream(self.seed, 3 * run_id + 2)
+
+        trophies, lives, turn = 0, STARTING_LIVES, 0
+        while turn < max_turns and lives > 0 and trophies < TROPHIES_TO_WIN:
+            turn += 1
+            for shop in (player, ghost):
+                shop.start_turn()
+                self.policy(shop)
+                shop.end_turn()
+            result = Battle(player.team, ghost.team, rand=battle_rand).run()
+            if result is BattleResult.WIN:
+                trophies += 1
+            elif result is BattleResult.LOSS:
+                lives -= lives_lost(turn)
+        return RunResult(run_id, trophies, max(lives, 0), turn)
+
+
+def run_rollouts(
+    library: Library,
+    policy: Policy,
+    runs: int,
+    seed: int = 0,
+    foods: Sequence[FoodDefinition] = (),
+    max_workers: int | None = 0,
+    max_turns: int = MAX_TURNS,
+) -> RolloutReport:
+    """Play many independent runs and time them
+
+    Args:
+        library (Library): Pets on offer in the shop.
+        policy (Policy): Plays a shop turn by calling the shop's actions, must be
+            picklable (e.g. a module level function) when using processes.
+        runs (int): Number of runs, with run ids 0 to runs - 1.
+        seed (int): Seed of every run's random streams.
+        foods (Sequence[FoodDefinition]): Foods on offer in the shop.
+        max_workers (int, optional): Processes to split the runs between, 0 plays
+            every run in this process and None uses every core.
+        max_turns (int): Turns after which a run is stopped.
+
+    Returns:
+        RolloutReport: Result of every run in run id order, and the wall time.
+    """
+    start = time.perf_counter()
+    if max_workers == 0:
+        results = _play_runs(library, foods, policy, seed, range(runs), max_turns)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        library_dict = library.to_dict()
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(
+                    _play_runs,
+                    library_dict,
+                    foods,
+                    policy,
+                    seed,
+                    range(i, runs, workers),
+                    max_turns,
+                )
+                for i in range(min(workers, runs))
+            ]
+            results = [result for future in futures for result in future.result()]
+        results.sort(key=lambda result: result.run_id)
+    return RolloutReport(results, time.perf_counter() - start)
+
+
+def _play_runs(
+    library: Library | dict,
+    foods: Sequence[FoodDefinition],
+    policy: Policy,
+    seed: int,
+    run_ids: range,
+    max_turns: int,
+) -> list[RunResult]:
+    """Play a chunk of runs on one engine, process pool entry point"""
+    if isinstance(library, dict):
+        library = Library.from_dict(library)
+    engine = RunEngine(ShopTables(library, foods), policy, seed)
+    return [engine.play(run_id, max_turns) for run_id in run_ids]
+
+
+def greedy_policy(shop: Shop):
+    """Level up team pets when possible, otherwise fill the team from the front,
+    then spend leftover gold on food for the front pet and rolls
+    """
+    while True:
+        if shop.gold >= PET_COST and _buy_any(shop):
+            continue
+        if shop.gold >= FOOD_COST and shop.team.pets:
+            front = next(i for i, pet in enumerate(shop.team) if pet is not None)
+            if any(shop.buy_food(i, front) for i in range(len(shop.foods))):
+                continue
+        if shop.gold >= PET_COST + ROLL_COST and shop.roll():
+            continue
+        return
+
+
+def _buy_any(shop: Shop) -> bool:
+    team = shop.team
+    for shop_idx, pet in enumerate(shop.pets):
+        if pet is None:
+            continue
+        for team_idx, team_pet in enumerate(team):
+            if team_pet is not None and team_pet.name == pet.name:
+                if shop.buy_pet(shop_idx, team_idx):
+                    return True
+    if None in team:
+        empty = list(team).index(None)
+        for shop_idx, pet in enumerate(shop.pets):
+            if pet is not None and shop.buy_pet(shop_idx, empty):
+                return True
+    return False
@@ -0,0 +1,124 @@
+"""Module defining the EventScheduler, which resolves triggered abilities"""
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Callable, Sequence
+
+from superautosim.events import Event, EventPool, EventType
+from superautosim.pets import Pet, PetPool
+from superautosim.teams import Team
+from superautosim.tracing import TraceKind
+
+if TYPE_CHECKING:
+    from superautosim.tracing import TraceRecorder
+
+
+class EventScheduler:
+    """Resolves events by running the abilities they trigger in priority order
+
+    Scheduled events are resolved in batches: every event pending when `run` starts
+    a batch is treated as simultaneous. The abilities triggered by the batch are
+    pushed onto a heap and run highest attack first, then highest health, then by
+    team and slot. Only triggered pets are ordered, the battlefield is never sorted.
+    A triggered pet that faints or is removed before its turn is skipped, unless
+    the event is its own FAINT. Events scheduled while a batch resolves (e.g. by
+    actions) form the next batch.
+    """
+
+    def __init__(
+        self,
+        teams: Sequence[Team | list[Pet]],
+        rand: Callable[[], float],
+        in_battle: bool = False,
+        pool: EventPool | None = None,
+        trace: TraceRecorder | None = None,
+    ):
+        """Initialises an event scheduler
+
+        Args:
+            teams (Sequence[Team]): The (at most 2) teams whose abilities can trigger.
+            rand (Callable[[], float]): Returns the random number used by each ability
+                activation, must follow `0 >= rand and rand < 1`.
+            in_battle (bool): Whether events happen during a battle.
+            pool (EventPool, optional): Pool to take events from.
+            trace (TraceRecorder, optional): Records resolved events and triggered
+                abilities.
+        """
+        self._teams = tuple(teams)
+        self._rand = rand
+        self._in_battle = in_battle
+        self._pool = EventPool() if pool is None else pool
+        self._pending: list[tuple[EventType, Pet | None]] = []
+        self._trace = trace
+        # Pool of each summoned pet, see add_summon
+        self.summons: dict[Pet, PetPool] = {}
+
+    @property
+    def teams(self) -> tuple:
+        return self._teams
+
+    @property
+    def trace(self) -> TraceRecorder | None:
+        return self._trace
+
+    def add_summon(self, pet: Pet, pool: PetPool):
+        """Record the pool a summoned pet was acquired from"""
+        self.summons[pet] = pool
+
+    def schedule(self, event_type: EventType, pet: Pet | None = None):
+        """Add an event to the next batch"""
+        self._pending.append((event_type, pet))
+
+    def run(self) -> int:
+        """Resolve all scheduled events, including any scheduled while resolving
+
+        Returns:
+            int: The number of abilities run.
+        """
+        activated = 0
+        trace = self._trace
+        while self._pending:
+            batch, self._pending = self._pending, []
+            events = [
+                self._pool.acquire(
+                    event_type, pet, self._in_battle, self._teams, self, trace
+                )
+                for event_type, pet in batch
+            ]
+            if trace is not None:
+                for event in events:
+                    trace.record(TraceKind.EVENT, event.type, event.pet)
+            heap = self._triggered(events)
+            while heap:
+                *_, event_idx, owner = heapq.heappop(heap)
+                event = events[event_idx]
+                if not self._can_activate(owner, event):
+                    continue
+                if trace is not None:
+                    trace.record(TraceKind.TRIGGER, event.type, owner)
+                owner.ability.run(event, owner, self._rand())
+                activated += 1
+            for event in events:
+                self._pool.release(event)
+        return activated
+
+    def _can_activate(self, owner: Pet, event: Event) -> bool:
+        """Whether a triggered pet is still fit to activate, e.g. not sniped
+        by a higher priority ability of the same batch
+        """
+        if event.type is EventType.FAINT and event.pet is owner:
+            return True
+        return not owner.fainted and any(owner in team for team in self._teams)
+
+    def _triggered(self, events: list[Event]) -> list:
+        """Returns a heap of (priority..., event index, owner) for triggered pets"""
+        heap: list = []
+        for team_idx, team in enumerate(self._teams):
+            for slot, owner in enumerate(team):
+                if owner is None or owner.ability is None:
+                    continue
+                for event_idx, event in enumerate(events):
+                    if owner.ability.is_triggered(event, owner):
+                        priority = (-owner.attack, -owner.health, team_idx, slot)
+                        heapq.heappush(heap, (*priority, event_idx, owner))
+        return heap
@@ -0,0 +1,181 @@
+"""Module for searching for strong teams against a fixed set of opponents"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+
+from superautosim.encoding import decode_team, encode_team, team_hash
+from superautosim.library import Library
+from superautosim.montecarlo import simulate
+from superautosim.teams import Team
+
+
+class FitnessEvaluator:
+    """Scores teams by their mean Monte Carlo score against fixed opponents
+
+    Scores are cached by team_hash, and uncached teams are scored in parallel on
+    a process pool (or the given executor). Every team plays the same battle ids
+    against each opponent, so scores are deterministic and comparable.
+    """
+
+    def __init__(
+        self,
+        opponents: Sequence[Team],
+        battles: int,
+        seed: int = 0,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ):
+        """Initialises a fitness evaluator
+
+        Args:
+            opponents (Sequence[Team]): Teams every candidate is scored against.
+            battles (int): Battles played against each opponent.
+            seed (int): Seed of every battle's random stream.
+            max_workers (int, optional): Size of the process pool created on first
+                use when no executor is given, 0 scores teams in this process.
+            executor (Executor, optional): Executor to score teams on.
+        """
+        if not opponents:
+            raise ValueError("FitnessEvaluator needs at least one opponent")
+        self._opponents = tuple(encode_team(team) for team in opponents)
+        self._battles = battles
+        self._seed = seed
+        self._max_workers = max_workers
+        self._executor = executor
+        self._own_executor = False
+        self._cache: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, teams: Sequence[Team]) -> list[float]:
+        """Returns the fitness of each team, in [0, 1]"""
+        keys = [team_hash(team) for team in teams]
+        pending: dict[str, bytes] = {}
+        for key, team in zip(keys, teams):
+            if key in self._cache:
+                self.hits += 1
+            elif key not in pending:
+                self.misses += 1
+                pending[key] = encode_team(team)
+            else:
+                self.hits += 1
+
+        if pending:
+            args = (self._opponents, self._battles, self._seed)
+            executor = self._get_executor()
+            if executor is None:
+                scores = [_fitness(team, *args) for team in pending.values()]
+            else:
+                workers = self._max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(pending) // (4 * workers))
+                scores = executor.map(
+                    _fitness,
+                    pending.values(),
+                    *([arg] * len(pending) for arg in args),
+                    chunksize=chunksize,
+                )
+            self._cache.update(zip(pending, scores))
+        return [self._cache[key] for key in keys]
+
+    def close(self):
+        """Shut down the process pool created by the evaluator, if any"""
+        if self._own_executor:
+            self._executor.shutdown()
+            self._executor = None
+            self._own_executor = False
+
+    def _get_executor(self) -> Executor | None:
+        if self._executor is None and self._max_workers != 0:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+            self._own_executor = True
+        return self._executor
+
+    def __enter__(self) -> FitnessEvaluator:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+@dataclass
+class SearchResult:
+    names: tuple[str, ...]
+    team: Team
+    fitness: float
+    evaluated: int
+
+
+def build_team(library: Library, names: Sequence[str]) -> Team:
+    """Create a team of fresh library pets, front (slot 0) first"""
+    team = Team()
+    for index, name in enumerate(names):
+        team.insert_pet(library.create_pet(name), index)
+    return team
+
+
+def beam_search(
+    library: Library,
+    evaluator: FitnessEvaluator,
+    beam_width: int = 8,
+    max_tier: int = 6,
+    max_pets: int = Team.MAX_TEAM_SIZE,
+) -> SearchResult:
+    """Search for the fittest team of library pets with a beam search
+
+    Each step extends every team in the beam by inserting one pet available up to
+    max_tier at every position, so both composition and ordering are searched.
+    The best beam_width new teams form the next beam, and the best team of any
+    size is returned.
+
+    Args:
+        library (Library): Pets to build teams from.
+        evaluator (FitnessEvaluator): Scores candidate teams.
+        beam_width (int): Number of teams kept between steps.
+        max_tier (int): Highest tier of pet available.
+        max_pets (int): Largest team size searched.
+
+    Returns:
+        SearchResult: The fittest team found.
+    """
+    names = [d.name for d in library if d.tier <= max_tier]
+    if not names:
+        raise ValueError(f"No library pets are available up to tier {max_tier}")
+    max_pets = min(max_pets, Team.MAX_TEAM_SIZE)
+
+    scored: dict[tuple[str, ...], float] = {}
+    beam: list[tuple[str, ...]] = [()]
+    for _ in range(max_pets):
+        candidates = []
+        for state in beam:
+            if len(state) == max_pets:
+                continue
+            for name in names:
+                for index in range(len(state) + 1):
+                    candidate = (*state[:index], name, *state[index:])
+                    if candidate not in scored:
+                        scored[candidate] = -1.0
+                        candidates.append(candidate)
+        if not candidates:
+            break
+        teams = [build_team(library, candidate) for candidate in candidates]
+        scored.update(zip(candidates, evaluator.evaluate(teams)))
+        beam = sorted(candidates, key=lambda s: (-scored[s], s))[:beam_width]
+
+    # Ties are broken towards smaller teams, then name order
+    best = min(scored, key=lambda s: (-scored[s], len(s), s))
+    return SearchResult(best, build_team(library, best), scored[best], len(scored))
+
+
+def _fitness(team: bytes, opponents: tuple[bytes, ...], battles: int, seed: int):
+    """Process pool entry point, teams are sent in their compact encoding"""
+    candidate = decode_team(team)
+    total = 0.0
+    for opponent in opponents:
+        total += simulate(candidate, decode_team(opponent), battles, seed).score
+    return total / len(opponents)
@@ -0,0 +1,331 @@
+"""Module defining a local asyncio service answering matchup odds requests
+
+Clients send both teams in the encode_team format, the server replies with the
+Tally of the matchup. Requests are length-framed binary messages:
+
+    request:  magic, battles, seed, len(team_a), len(team_b), team_a, team_b
+    response: status, wins, draws, losses, len(message), message
+
+Seeds are signed 64 bit integers, like the seeds given to simulate.
+
+Results are kept in an LRU cache, identical in-flight requests share a single
+computation, and work waits in a bounded queue for a warm process pool. A full
+queue stops the server reading from clients, so backpressure reaches them
+through their sockets. Distinct queued requests are sent to the workers in
+micro-batches of up to max_batch_size, waiting at most max_wait seconds for a
+batch to fill: larger values favour throughput, smaller values latency.
+
+Teams are decoded with marshal, which is not safe against malicious data, so
+only listen on a trusted interface (the default is localhost) or a Unix socket.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+
+from superautosim.encoding import encode_team
+from superautosim.montecarlo import Tally, simulate_encoded_batch
+from superautosim.teams import Team
+
+MAGIC = b"SAS1"
+REQUEST_HEADER = struct.Struct("!4sIqII")
+RESPONSE_HEADER = struct.Struct("!BIIII")
+STATUS_OK = 0
+STATUS_ERROR = 1
+MAX_TEAM_BYTES = 1 << 16
+MAX_BATTLES = 1 << 20
+SEEDS = range(-(1 << 63), 1 << 63)
+
+
+class ServiceError(Exception):
+    """A request was rejected or failed on the server"""
+
+
+class MatchupServer:
+    """Evaluates matchups for clients connected over TCP or a Unix socket"""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int = 1024,
+        cache_size: int = 65536,
+        executor: Executor | None = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+    ):
+        """Initialises a matchup server, call start to serve clients
+
+        Args:
+            max_workers (int, optional): Size of the process pool created on start
+                when no executor is given, defaults to the number of cores.
+            max_pending (int): Requests waiting for a worker before new requests
+                are held back.
+            cache_size (int): Number of matchup results kept.
+            executor (Executor, optional): Executor to evaluate matchups on.
+            max_batch_size (int): Most requests sent to a worker at once.
+            max_wait (float): Seconds a batch waits for more requests after its
+                first, 0 only batches requests that are already queued.
+        """
+        if max_batch_size < 1 or max_wait < 0:
+            raise ValueError("max_batch_size must be positive, max_wait non-negative")
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._cache_size = cache_size
+        self._executor = executor
+        self._own_executor = executor is None
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._cache: OrderedDict[bytes, Tally] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future] = {}
+        self._queue: asyncio.Queue | None = None
+        self._dispatchers: list[asyncio.Task] = []
+        self._server: asyncio.AbstractServer | None = None
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.batches = 0
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: str | None = None
+    ) -> asyncio.AbstractServer:
+        """Warm up the workers and start listening
+
+        Args:
+            host (str): Host to listen on for TCP clients.
+            port (int): Port to listen on, 0 picks a free port.
+            path (str, optional): Listen on this Unix socket path instead of TCP.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+        loop = asyncio.get_running_loop()
+        # Start every worker now rather than on the first requests
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, simulate_encoded_batch, [_WARM_UP])
+                for _ in range(self._max_workers)
+            )
+        )
+        self._queue = asyncio.Queue(self._max_pending)
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self._max_workers)
+        ]
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    @property
+    def address(self):
+        """The socket address clients connect to"""
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        """Stop serving, fail pending requests and shut down the workers"""
+        if self._server is not None:
+            self._server.close()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        # Queued requests are also in flight, fail them so no client waits forever
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait()
+        for future in self._inflight.values():
+            _fail(future, ServiceError("Server closed"))
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def evaluate(
+        self, team_a: bytes, team_b: bytes, battles: int, seed: int = 0
+    ) -> Tally:
+        """Returns the tally of an encoded matchup, cached and single-flight
+
+        The returned tally is a copy, callers may modify it freely.
+
+        Raises:
+            ValueError: battles is negative or more than MAX_BATTLES, or seed is
+                not a signed 64 bit integer.
+            ServiceError: The server closed before the matchup was evaluated.
+        """
+        if not 0 <= battles <= MAX_BATTLES:
+            raise ValueError(f"battles must be between 0 and {MAX_BATTLES}")
+        _check_seed(seed)
+        key = _request_key(team_a, team_b, battles, seed)
+        tally = self._cache.get(key)
+        if tally is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return replace(tally)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return replace(await asyncio.shield(future))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            try:
+                await self._queue.put(((team_a, team_b, battles, seed), future))
+            except asyncio.CancelledError:
+                # Never queued, so coalesced requests must not wait on it
+                _fail(future, ServiceError("Request was cancelled before queueing"))
+                raise
+            tally = await asyncio.shield(future)
+        finally:
+            del self._inflight[key]
+        self._cache[key] = tally
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return replace(tally)
+
+    async def _dispatch(self):
+        """Move queued requests to the executor in micro-batches"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            self._fill_batch(batch)
+            if len(batch) < self._max_batch_size and self._max_wait:
+                await asyncio.sleep(self._max_wait)
+                self._fill_batch(batch)
+            self.batches += 1
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, simulate_encoded_batch, [args for args, _ in batch]
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                results = [exc] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _fill_batch(self, batch: list):
+        """Add already queued requests to the batch, up to max_batch_size"""
+        while len(batch) < self._max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve the requests of one connection in order"""
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST_HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                magic, battles, seed, len_a, len_b = REQUEST_HEADER.unpack(header)
+                if magic != MAGIC or max(len_a, len_b) > MAX_TEAM_BYTES:
+                    writer.write(_error_response("Invalid request header"))
+                    break
+                team_a = await reader.readexactly(len_a)
+                team_b = await reader.readexactly(len_b)
+                try:
+                    tally = await self.evaluate(team_a, team_b, battles, seed)
+                except Exception as exc:  # pylint: disable=broad-except
+                    writer.write(_error_response(f"{type(exc).__name__}: {exc}"))
+                else:
+                    writer.write(
+                        RESPONSE_HEADER.pack(
+                            STATUS_OK, tally.wins, tally.draws, tally.losses, 0
+                        )
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class MatchupClient:
+    """Client of a MatchupServer, sending one request at a time"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(
+        cls, host: str = "127.0.0.1", port: int = 0, path: str | None = None
+    ) -> MatchupClient:
+        """Connect to a server over TCP, or over a Unix socket when given a path"""
+        if path is not None:
+            return cls(*await asyncio.open_unix_connection(path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def evaluate(
+        self, team_a: Team | bytes, team_b: Team | bytes, battles: int, seed: int = 0
+    ) -> Tally:
+        """Returns the tally of team_a against team_b
+
+        Raises:
+            ValueError: seed is not a signed 64 bit integer.
+            ServiceError: The server could not evaluate the matchup.
+        """
+        _check_seed(seed)
+        if isinstance(team_a, Team):
+            team_a = encode_team(team_a)
+        if isinstance(team_b, Team):
+            team_b = encode_team(team_b)
+        header = REQUEST_HEADER.pack(MAGIC, battles, seed, len(team_a), len(team_b))
+        async with self._lock:
+            self._writer.write(header + team_a + team_b)
+            await self._writer.drain()
+            response = await self._reader.readexactly(RESPONSE_HEADER.size)
+            status, wins, draws, losses, length = RESPONSE_HEADER.unpack(response)
+            message = await self._reader.readexactly(length)
+        if status != STATUS_OK:
+            raise ServiceError(message.decode("utf-8", "replace"))
+        return Tally(wins, draws, losses)
+
+    async def close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def __aenter__(self) -> MatchupClient:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+_WARM_UP = (encode_team(Team()), encode_team(Team()), 1, 0)
+
+
+def _request_key(team_a: bytes, team_b: bytes, battles: int, seed: int) -> bytes:
+    digest = hashlib.sha256(struct.pack("!IIq", len(team_a), battles, seed))
+    digest.update(team_a)
+    digest.update(team_b)
+    return digest.digest()
+
+
+def _check_seed(seed: int):
+    if seed not in SEEDS:
+        raise ValueError("seed must be a signed 64 bit integer")
+
+
+def _fail(future: asyncio.Future, exc: Exception):
+    """Fail a future that may have no waiters left"""
+    if not future.done():
+        future.set_exception(exc)
+        # Mark the exception retrieved, so an unawaited failure is not logged
+        future.exception()
+
+
+def _error_response(message: str) -> bytes:
+    encoded = message.encode("utf-8")
+    return RESPONSE_HEADER.pack(STATUS_ERROR, 0, 0, 0, len(encoded)) + encoded
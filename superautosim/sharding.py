@@ -0,0 +1,322 @@
+"""Module for spreading matchup work across worker nodes over plain sockets
+
+The coordinator splits the 64 bit matchup hash space into equal ranges (shards)
+and hands shards to workers one at a time over TCP connections. A shard whose
+worker fails or times out is queued again for the remaining workers. Every
+battle's random numbers depend only on the seed and battle id, so the merged
+tallies are the same whichever workers compute them.
+
+Messages are length-prefixed marshal payloads, only connect to trusted nodes.
+"""
+from __future__ import annotations
+
+import hashlib
+import marshal
+import multiprocessing
+import queue
+import socket
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from superautosim.encoding import encode_team
+from superautosim.montecarlo import Tally, simulate_encoded_batch
+from superautosim.teams import Team
+
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_BYTES = 1 << 28
+
+Address = tuple[str, int]
+
+
+class ShardError(Exception):
+    """Shards could not be computed"""
+
+
+def send_frame(sock: socket.socket, payload):
+    """Send a marshallable payload as one frame"""
+    data = marshal.dumps(payload)
+    sock.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+
+def recv_frame(sock: socket.socket):
+    """Receive one frame's payload
+
+    Raises:
+        ConnectionError: The connection closed or sent an invalid frame.
+    """
+    (length,) = FRAME_HEADER.unpack(_recv_exactly(sock, FRAME_HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise ConnectionError("Frame too large")
+    try:
+        return marshal.loads(_recv_exactly(sock, length))
+    except (EOFError, ValueError, TypeError) as exc:
+        raise ConnectionError("Invalid frame") from exc
+
+
+def matchup_key(team_a: bytes, team_b: bytes) -> int:
+    """Returns the 64 bit hash of an encoded matchup"""
+    digest = hashlib.sha256(FRAME_HEADER.pack(len(team_a)) + team_a + team_b)
+    return int.from_bytes(digest.digest()[:8], "big")
+
+
+def shard_of(key: int, shards: int) -> int:
+    """Returns the shard of a matchup key, shards are equal ranges of keys"""
+    return (key * shards) >> 64
+
+
+def serve_worker(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    ready: Callable[[Address], None] | None = None,
+):
+    """Serve shards to coordinators forever, one thread per connection
+
+    Args:
+        host (str): Host to listen on.
+        port (int): Port to listen on, 0 picks a free port.
+        ready (Callable, optional): Called with the listening address.
+    """
+    with socket.create_server((host, port)) as server:
+        if ready is not None:
+            ready(server.getsockname()[:2])
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(
+                target=_serve_connection, args=(conn,), daemon=True
+            ).start()
+
+
+def _serve_connection(conn: socket.socket):
+    with conn:
+        while True:
+            try:
+                shard_id, battles, seed, matchups = recv_frame(conn)
+            except ConnectionError:
+                return
+            results = simulate_encoded_batch(
+                [(team_a, team_b, battles, seed) for team_a, team_b in matchups]
+            )
+            send_frame(
+                conn,
+                (
+                    shard_id,
+                    [
+                        (r.wins, r.draws, r.losses) if isinstance(r, Tally) else str(r)
+                        for r in results
+                    ],
+                ),
+            )
+
+
+@dataclass
+class ShardedResult:
+    """Tally of every matchup in the order given, from team_a's perspective"""
+
+    tallies: list[Tally]
+    shards: int
+    retries: int
+
+    @property
+    def total(self) -> Tally:
+        total = Tally()
+        for tally in self.tallies:
+            total = total + tally
+        return total
+
+
+class Coordinator:
+    """Shards matchups across workers and merges their tallies"""
+
+    def __init__(
+        self,
+        workers: Sequence[Address],
+        timeout: float = 60.0,
+        max_retries: int = 3,
+    ):
+        """Initialises a coordinator
+
+        Args:
+            workers (Sequence[Address]): (host, port) of each worker.
+            timeout (float): Seconds to wait for a connection or shard result
+                before the worker is considered lost.
+            max_retries (int): Times a shard is retried before giving up.
+        """
+        if not workers:
+            raise ValueError("Coordinator needs at least one worker")
+        self._workers = list(workers)
+        self._timeout = timeout
+        self._max_retries = max_retries
+
+    def run(
+        self,
+        matchups: Sequence[tuple[Team | bytes, Team | bytes]],
+        battles: int,
+        seed: int = 0,
+        shards: int | None = None,
+    ) -> ShardedResult:
+        """Simulate every matchup on the workers
+
+        Args:
+            matchups (Sequence[tuple[Team, Team]]): Teams, or their encodings.
+            battles (int): Battles played for each matchup.
+            seed (int): Seed of every battle's random stream.
+            shards (int, optional): Number of hash ranges, defaults to 4 per worker.
+
+        Raises:
+            ShardError: A shard failed on every retry, or every worker was lost.
+        """
+        if shards is None:
+            shards = 4 * len(self._workers)
+        encoded = [
+            tuple(t if isinstance(t, bytes) else encode_team(t) for t in matchup)
+            for matchup in matchups
+        ]
+        members: dict[int, list[int]] = {}
+        for i, (team_a, team_b) in enumerate(encoded):
+            shard_id = shard_of(matchup_key(team_a, team_b), shards)
+            members.setdefault(shard_id, []).append(i)
+
+        state = _RunState(members, self._max_retries)
+        for shard_id in sorted(members):
+            state.pending.put(shard_id)
+        threads = [
+            threading.Thread(
+                target=self._drive_worker,
+                args=(address, state, encoded, battles, seed),
+                daemon=True,
+            )
+            for address in self._workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if state.error is not None:
+            raise ShardError(state.error)
+        if len(state.results) < len(members):
+            lost = sorted(set(members) - set(state.results))
+            raise ShardError(f"Every worker was lost, shards {lost} not computed")
+
+        tallies: list[Tally | None] = [None] * len(encoded)
+        for shard_id, indexes in members.items():
+            for i, result in zip(indexes, state.results[shard_id]):
+                if isinstance(result, str):
+                    raise ShardError(f"Matchup {i} failed: {result}")
+                tallies[i] = Tally(*result)
+        return ShardedResult(tallies, len(members), state.retries)
+
+    def _drive_worker(
+        self,
+        address: Address,
+        state: _RunState,
+        encoded: list[tuple[bytes, bytes]],
+        battles: int,
+        seed: int,
+    ):
+        """Send shards to one worker until every shard is done or it is lost
+
+        A lost worker's shard is queued again for the other workers, the run ends
+        without its results once every worker is lost.
+        """
+        try:
+            conn = socket.create_connection(address, self._timeout)
+        except OSError:
+            return
+        with conn:
+            while not state.done.is_set():
+                try:
+                    shard_id = state.pending.get(timeout=0.05)
+                except queue.Empty:
+                    # Shards in flight on other workers may still be retried
+                    continue
+                matchups = [encoded[i] for i in state.members[shard_id]]
+                try:
+                    send_frame(conn, (shard_id, battles, seed, matchups))
+                    result_id, results = recv_frame(conn)
+                    if result_id != shard_id or len(results) != len(matchups):
+                        raise ConnectionError("Mismatched shard result")
+                except OSError:
+                    state.retry(shard_id)
+                    return
+                state.complete(shard_id, results)
+
+
+class _RunState:
+    """Shard queue and results shared by the worker threads of one run"""
+
+    def __init__(self, members: dict[int, list[int]], max_retries: int):
+        self.members = members
+        self.pending: queue.Queue[int] = queue.Queue()
+        self.results: dict[int, list] = {}
+        self.retries = 0
+        self.error: str | None = None
+        self.done = threading.Event()
+        self._max_retries = max_retries
+        self._attempts: dict[int, int] = {}
+        self._lock = threading.Lock()
+        if not members:
+            self.done.set()
+
+    def complete(self, shard_id: int, results: list):
+        with self._lock:
+            self.results[shard_id] = results
+            if len(self.results) == len(self.members):
+                self.done.set()
+
+    def retry(self, shard_id: int):
+        with self._lock:
+            self._attempts[shard_id] = self._attempts.get(shard_id, 0) + 1
+            if self._attempts[shard_id] > self._max_retries:
+                self.error = f"Shard {shard_id} failed {self._attempts[shard_id]} times"
+                self.done.set()
+                return
+            self.retries += 1
+        self.pending.put(shard_id)
+
+
+class LocalCluster:
+    """Worker processes on this machine standing in for nodes, for testing"""
+
+    def __init__(self, workers: int = 2):
+        self._size = workers
+        self.processes: list[multiprocessing.Process] = []
+        self.addresses: list[Address] = []
+
+    def __enter__(self) -> LocalCluster:
+        context = multiprocessing.get_context()
+        for _ in range(self._size):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_local_worker, args=(sender,), daemon=True)
+            process.start()
+            self.processes.append(process)
+            self.addresses.append(tuple(receiver.recv()))
+        return self
+
+    def kill(self, index: int):
+        """Terminate a worker, as if its node was lost"""
+        self.processes[index].terminate()
+        self.processes[index].join()
+
+    def __exit__(self, *exc_info):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
+
+
+def _local_worker(sender):
+    serve_worker(ready=sender.send)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
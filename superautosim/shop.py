@@ -0,0 +1,281 @@
+"""Module defining the Shop, which simulates the shop phase of a turn
+
+Pets and foods offered at each shop tier are drawn from alias tables built once
+per library (ShopTables), so every draw takes a single random number and O(1)
+time. Shop pets are taken from per-pet PetPools and returned when rolled away.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Sequence, TypeVar
+
+from superautosim.events import EventType
+from superautosim.library import MAX_TIER, Library
+from superautosim.pets import Pet, PetPool
+from superautosim.scheduler import EventScheduler
+from superautosim.teams import Team
+
+T = TypeVar("T")
+
+STARTING_GOLD = 10
+PET_COST = 3
+FOOD_COST = 3
+ROLL_COST = 1
+# Experience needed to reach levels 2 and 3
+LEVEL_EXPERIENCE = (2, 5)
+
+
+class AliasTable(Generic[T]):
+    """Weighted choice in O(1) per draw, using Vose's alias method"""
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float] | None = None):
+        if not items:
+            raise ValueError("AliasTable needs at least one item")
+        if weights is None:
+            weights = [1.0] * len(items)
+        if len(weights) != len(items) or min(weights) < 0 or not sum(weights):
+            raise ValueError("AliasTable weights must be non-negative, one per item")
+
+        self.items = list(items)
+        size = len(items)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        self._prob = [1.0] * size
+        self._alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+    def draw(self, rand: float) -> T:
+        """Returns an item with probability proportional to its weight
+
+        Args:
+            rand (float): Number following `0 >= rand and rand < 1`.
+        """
+        scaled = rand * len(self.items)
+        # Rounding can give len(items) for rand just below 1
+        index = min(int(scaled), len(self.items) - 1)
+        if scaled - index < self._prob[index]:
+            return self.items[index]
+        return self.items[self._alias[index]]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+@dataclass(frozen=True)
+class FoodDefinition:
+    """A food that adds stats to the pet it is given to"""
+
+    name: str
+    tier: int
+    attack: int = 0
+    health: int = 0
+    temp_stats: bool = False
+
+
+class ShopTables:
+    """Per shop tier draw tables and pet pools, shared between shops"""
+
+    def __init__(self, library: Library, foods: Sequence[FoodDefinition] = ()):
+        self.pet_pools = {d.name: PetPool(library.create_pet(d.name)) for d in library}
+        self.pet_tables: list[AliasTable[PetPool] | None] = [None]
+        self.food_tables: list[AliasTable[FoodDefinition] | None] = [None]
+        for tier in range(1, MAX_TIER + 1):
+            pools = [self.pet_pools[d.name] for d in library if d.tier <= tier]
+            tier_foods = [food for food in foods if food.tier <= tier]
+            self.pet_tables.append(AliasTable(pools) if pools else None)
+            self.food_tables.append(AliasTable(tier_foods) if tier_foods else None)
+
+
+class Shop:
+    """The shop and team of a player across the turns of a run
+
+    Every action returns False, changing nothing, when it is not allowed. Shop
+    events are resolved through an EventScheduler on the team.
+    """
+
+    def __init__(
+        self,
+        tables: ShopTables,
+        rand: Callable[[], float],
+        team: Team | None = None,
+    ):
+        """Initialises a shop, call start_turn to stock it for the first turn
+
+        Args:
+            tables (ShopTables): Draw tables of the pets and foods on offer.
+            rand (Callable[[], float]): Returns the random numbers for draws and
+                abilities, must follow `0 >= rand and rand < 1`.
+            team (Team, optional): The player's team, empty by default.
+        """
+        self.tables = tables
+        self.rand = rand
+        self.team = Team() if team is None else team
+        self.turn = 0
+        self.tier = 1
+        self.gold = 0
+        self.pets: list[Pet | None] = []
+        self.foods: list[FoodDefinition | None] = []
+        self._pools: list[PetPool | None] = []
+        self._scheduler = EventScheduler((self.team,), rand)
+
+    def reset(self, rand: Callable[[], float]):
+        """Start a new run with the given random numbers, reusing this shop
+
+        The team is emptied and its pets, like the shop's, return to their pools.
+        """
+        self._release_shop()
+        pools = self.tables.pet_pools
+        for pet in self.team.pets:
+            self.team.remove_pet(pet)
+            if pet.name in pools:
+                pools[pet.name].release(pet)
+        self.rand = rand
+        self.turn = 0
+        self.tier = 1
+        self.gold = 0
+        self._scheduler = EventScheduler((self.team,), rand)
+
+    @staticmethod
+    def tier_for_turn(turn: int) -> int:
+        """Highest tier on offer in the given turn, one more every 2 turns"""
+        return max(1, min(MAX_TIER, (turn + 1) // 2))
+
+    @property
+    def pet_slots(self) -> int:
+        return 3 + (self.tier >= 3) + (self.tier >= 5)
+
+    @property
+    def food_slots(self) -> int:
+        return 1 if self.tier < 2 else 2
+
+    def start_turn(self):
+        """Start the next turn, resetting gold and restocking the shop"""
+        self.turn += 1
+        tier = self.tier_for_turn(self.turn)
+        if tier != self.tier:
+            self.tier = tier
+            self._scheduler.schedule(EventType.UPGRADE_SHOP_TIER)
+        self.gold = STARTING_GOLD
+        self._restock()
+        self._scheduler.schedule(EventType.START_OF_TURN)
+        self._scheduler.run()
+
+    def end_turn(self):
+        """End the turn, releasing the pets left in the shop
+
+        Temporary stats (e.g. from foods) last until the end of the turn. Pets
+        summoned during the turn become ordinary team pets, so the scheduler
+        stops tracking their pools.
+        """
+        self._release_shop()
+        self._scheduler.schedule(EventType.END_OF_TURN)
+        self._scheduler.run()
+        self._scheduler.summons.clear()
+        for pet in self.team.pets:
+            pet.reset_temp_stats()
+
+    def roll(self) -> bool:
+        """Restock the shop with new pets and foods"""
+        if self.gold < ROLL_COST:
+            return False
+        self.gold -= ROLL_COST
+        self._restock()
+        self._scheduler.schedule(EventType.ROLL)
+        self._scheduler.run()
+        return True
+
+    def buy_pet(self, shop_idx: int, team_idx: int) -> bool:
+        """Buy a shop pet, merging it into an equal pet at team_idx or inserting it
+
+        Args:
+            shop_idx (int): Shop slot of the pet to buy.
+            team_idx (int): Team slot to place the pet in.
+        """
+        pet = self.pets[shop_idx] if 0 <= shop_idx < len(self.pets) else None
+        if pet is None or self.gold < PET_COST or not _valid_team_idx(team_idx):
+            return False
+        target = self.team[team_idx]
+        if target is not None and target.name == pet.name:
+            if target.experience >= LEVEL_EXPERIENCE[-1]:
+                return False
+            self._merge(target, pet)
+            bought = target
+        elif self.team.insert_pet(pet, team_idx):
+            bought = pet
+        else:
+            return False
+
+        self.gold -= PET_COST
+        self.pets[shop_idx] = None
+        self._pools[shop_idx] = None
+        self._scheduler.schedule(EventType.BUY_PET, bought)
+        self._scheduler.run()
+        return True
+
+    def buy_food(self, shop_idx: int, team_idx: int) -> bool:
+        """Buy a shop food, feeding it to the pet at team_idx"""
+        food = self.foods[shop_idx] if 0 <= shop_idx < len(self.foods) else None
+        pet = self.team[team_idx] if _valid_team_idx(team_idx) else None
+        if food is None or pet is None or self.gold < FOOD_COST:
+            return False
+        self.gold -= FOOD_COST
+        self.foods[shop_idx] = None
+        pet.add_stats(food.attack, food.health, food.temp_stats)
+        self._scheduler.schedule(EventType.BUY_FOOD, pet)
+        self._scheduler.schedule(EventType.EAT_SHOP_FOOD, pet)
+        self._scheduler.run()
+        return True
+
+    def sell(self, team_idx: int) -> bool:
+        """Sell the pet at team_idx for gold equal to its level"""
+        pet = self.team[team_idx] if _valid_team_idx(team_idx) else None
+        if pet is None:
+            return False
+        self._scheduler.schedule(EventType.SELL, pet)
+        self._scheduler.run()
+        self.team.remove_pet(pet)
+        self.gold += pet.level
+        if pet.name in self.tables.pet_pools:
+            self.tables.pet_pools[pet.name].release(pet)
+        return True
+
+    def _merge(self, target: Pet, pet: Pet):
+        """Merge a bought pet into an equal team pet, the bought pet is released"""
+        target.experience += 1
+        target.add_stats(1, 1)
+        level = 1 + sum(target.experience >= exp for exp in LEVEL_EXPERIENCE)
+        if level != target.level:
+            target.level = level
+            self._scheduler.schedule(EventType.LEVEL_UP, target)
+        self.tables.pet_pools[pet.name].release(pet)
+
+    def _restock(self):
+        self._release_shop()
+        pet_table = self.tables.pet_tables[self.tier]
+        food_table = self.tables.food_tables[self.tier]
+        rand = self.rand
+        if pet_table is not None:
+            self._pools = [pet_table.draw(rand()) for _ in range(self.pet_slots)]
+            self.pets = [pool.acquire() for pool in self._pools]
+        if food_table is not None:
+            self.foods = [food_table.draw(rand()) for _ in range(self.food_slots)]
+
+    def _release_shop(self):
+        """Return the unbought shop pets to their pools"""
+        for pool, pet in zip(self._pools, self.pets):
+            if pool is not None and pet is not None:
+                pool.release(pet)
+        self.pets = []
+        self._pools = []
+        self.foods = []
+
+
+def _valid_team_idx(team_idx: int) -> bool:
+    return 0 <= team_idx < Team.MAX_TEAM_SIZE
@@ -1,12 +1,16 @@
 """Module containing target filter definitions"""
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Literal, TypedDict, Union
+from functools import wraps
+from typing import Callable, Literal, TypedDict, Union
 
 from superautosim.events import Event
 from superautosim.pets import Pet
+from superautosim.teams import Team
+from superautosim.utils import ClassMapMixin, get_member
 
 
 class SingleFilterDict(TypedDict, total=True):
@@ -26,7 +30,7 @@ SingleFilterValue = Literal[
 ]
 
 
-class FilterType(Enum):
+class FilterType(ClassMapMixin["Filter"], Enum):
     """Enumeration of types of filter"""
 
     NONE = auto()
@@ -41,7 +45,7 @@ class FilterType(Enum):
     name: SingleFilterValue
 
     @classmethod
-    def _get_mapping(cls):
+    def _get_mapping(cls) -> dict[FilterType, type[Filter]]:
         return {
             cls.NONE: NoneFilter,
             cls.SELF: SelfFilter,
@@ -53,29 +57,11 @@ class FilterType(Enum):
             cls.ADJACENT: AdjacentFilter,
         }
 
-    def to_class(self) -> type[Filter]:
-        """Returns the TargetFilter class corresponding to the enum value"""
-        mapping = self._get_mapping()
-        if self in mapping:
-            class_ = mapping[self]
-        else:
-            raise NotImplementedError(f"{self} does not map to a class")
-        return class_
-
-    @classmethod
-    def from_class(cls, class_: type[Filter]) -> FilterType:
-        """Returns the Type corresponding to the given class"""
-        mapping = cls._get_mapping()
-        for type_, map_class in mapping.items():
-            if class_ is map_class:
-                return type_
-        raise NotImplementedError(f"{class_} does not map to a type")
-
 
 MultiFilterValue = Literal["ANY", "ALL"]
 
 
-class MultiFilterType(Enum):
+class MultiFilterType(ClassMapMixin["MultiFilter"], Enum):
     """Enumeration of types of multi-filter"""
 
     ANY = auto()
@@ -90,29 +76,79 @@ class MultiFilterType(Enum):
             cls.ALL: AllFilter,
         }
 
-    def to_class(self) -> type[MultiFilter]:
-        """Returns the TargetFilter class corresponding to the enum value"""
-        mapping = self._get_mapping()
-        return mapping[self]
 
-    @classmethod
-    def from_class(cls, class_: type[MultiFilter]) -> MultiFilterType:
-        """Returns the Type corresponding to the given class"""
-        mapping = cls._get_mapping()
-        for type_, map_class in mapping.items():
-            if class_ is map_class:
-                return type_
-        raise NotImplementedError(f"{class_} does not map to a type")
+FilterMethod = Callable[["Filter", list[Pet], Event, Union[Pet, None]], list[Pet]]
+
+
+def memoised(filter_method: FilterMethod) -> FilterMethod:
+    """Memoise a Filter.filter implementation on the event being resolved
+
+    Results are stored on the event, keyed by the filter structure, the owner and
+    the given pets. The memo is cleared whenever Team.mutations has changed since
+    it was filled, so cached results are only reused while the battlefield is
+    unchanged. Plain list teams mutate unseen and are never memoised. Only applied
+    to the composite ALL / ANY filters, single filters are cheaper to recompute
+    than to look up.
+    """
+
+    @wraps(filter_method)
+    def filter_(
+        self: Filter, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
+        if owner is None:
+            owner = self._owner
+        if event is None:
+            return filter_method(self, pets, event, owner)
+        memo = event._filter_memo
+        if event._filter_memo_version != Team.mutations:
+            if not all(isinstance(team, Team) for team in event.teams):
+                return filter_method(self, pets, event, owner)
+            memo.clear()
+            event._filter_memo_version = Team.mutations
+        key = (self._memo_key, owner, *pets)
+        result = memo.get(key)
+        if result is None:
+            result = memo[key] = tuple(filter_method(self, pets, event, owner))
+        return list(result)
+
+    return filter_
 
 
 class Filter(ABC):
-    """Filters a list of possible targets based on criteria"""
+    """Filters a list of possible targets based on criteria
+
+    Filters are relative to an owner pet. The owner can be given to `filter` so
+    that a single filter is shared by every pet with the same ability, otherwise
+    the owner given at construction is used.
+    """
 
-    def __init__(self, owner: Pet):
+    # Estimates used to order the filters of an ALL / ANY filter: the expected
+    # fraction of pets kept, and relative cost of a call.
+    _selectivity: float = 1.0
+    _cost: float = 1.0
+    # False if results are ordered by the battlefield rather than the given pets
+    _preserves_order: bool = True
+
+    def __init__(self, owner: Pet | None = None):
         self._owner = owner
+        # Identifies filters with the same behaviour for a given owner
+        self._memo_key: object = type(self)
 
     @abstractmethod
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
+        """Filter the given pets
+
+        Args:
+            pets (list[Pet]): Pets to filter.
+            event (Event): The event being resolved.
+            owner (Pet, optional): The pet the filter is relative to, defaults to
+                the owner given at construction.
+
+        Returns:
+            list[Pet]: The pets that pass the filter
+        """
         raise NotImplementedError()
 
     def to_dict(self) -> FilterDict:
@@ -135,11 +171,12 @@ class Filter(ABC):
         }
 
     @classmethod
-    def from_dict(cls, filter_dict: FilterDict, owner: Pet) -> Filter:
+    def from_dict(cls, filter_dict: FilterDict, owner: Pet | None = None) -> Filter:
         """Creates a filter from its dictionary representation
 
         Args:
             filter_dict (dict): dictionary representation to create from.
+            owner (Pet, optional): Owner to bind the filter to.
 
         Raises:
             ValueError: When given an invalid dictionary
@@ -147,11 +184,11 @@ class Filter(ABC):
         Returns:
             TargetFilter: TargetFilter instance specified by filter_dict
         """
-        types = {type_.name for type_ in FilterType}
         if "op" in filter_dict:
-            if filter_dict["op"] == "SINGLE" and filter_dict["filter"] in types:
-                class_ = FilterType[filter_dict["filter"]].to_class()
-                return class_(owner)
+            if filter_dict["op"] == "SINGLE":
+                filter_type = get_member(FilterType, filter_dict["filter"])
+                if filter_type is not None:
+                    return filter_type.to_class()(owner)
 
             if (
                 filter_dict["op"] == "ANY" or filter_dict["op"] == "ALL"
@@ -169,12 +206,14 @@ class Filter(ABC):
 class MultiFilter(Filter):
     """Base class for a filter that applies a list of filters"""
 
-    def __init__(self, owner: Pet, filters: list[Filter]):
+    def __init__(self, owner: Pet | None, filters: list[Filter]):
         super().__init__(owner)
         for filt in filters:
             if not isinstance(filt, Filter):
                 raise TypeError("filters must all be TargetFilter instances")
         self._filters = filters
+        self._memo_key = (type(self), tuple(f._memo_key for f in filters))
+        self._cost = sum(f._cost for f in filters)
 
     @abstractmethod
     def to_dict(self) -> MultiFilterDict:
@@ -186,12 +225,33 @@ class MultiFilter(Filter):
 
 class AllFilter(MultiFilter):
     """Returns results that are unfiltered by all of the given filters (AND)
-    returns all pets if given an empty list of filters"""
-
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
-        for t_filter in self._filters:
-            pets = t_filter.filter(pets, event)
-        return [p for p in pets]
+    returns all pets if given an empty list of filters
+
+    Filters are applied most selective and cheapest first, stopping as soon as no
+    pets remain. Filters that order their results by the battlefield are applied
+    last, in their given order, so the result order is unaffected.
+    """
+
+    def __init__(self, owner: Pet | None, filters: list[Filter]):
+        super().__init__(owner, filters)
+        self._preserves_order = all(f._preserves_order for f in self._filters)
+        self._selectivity = math.prod(f._selectivity for f in self._filters)
+        self._ordered_filters = sorted(
+            self._filters,
+            key=lambda f: (0, f._selectivity, f._cost) if f._preserves_order else (1,),
+        )
+
+    @memoised
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
+        if not self._ordered_filters:
+            return list(pets)
+        for t_filter in self._ordered_filters:
+            pets = t_filter.filter(pets, event, owner)
+            if not pets:
+                break
+        return pets
 
     def to_dict(self) -> MultiFilterDict:
         result = super().to_dict()
@@ -201,14 +261,34 @@ class AllFilter(MultiFilter):
 
 class AnyFilter(MultiFilter):
     """Returns results that are unfiltered by any of the given filters (OR)
-    returns nothing if given an empty list of filters"""
-
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
-        returned_pets = set()
-        for t_filter in self._filters:
-            returned_pets.update(t_filter.filter(pets, event))
+    returns nothing if given an empty list of filters
+
+    Filters are applied least selective and cheapest first, stopping as soon as
+    every pet has been included.
+    """
+
+    def __init__(self, owner: Pet | None, filters: list[Filter]):
+        super().__init__(owner, filters)
+        self._selectivity = 1 - math.prod(1 - f._selectivity for f in self._filters)
+        self._ordered_filters = sorted(
+            self._filters, key=lambda f: (-f._selectivity, f._cost)
+        )
+
+    @memoised
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
+        # Bitset of included pets, indexed by position in `pets`
+        positions = {id(p): i for i, p in enumerate(pets)}
+        all_included = (1 << len(pets)) - 1
+        included = 0
+        for t_filter in self._ordered_filters:
+            for pet in t_filter.filter(pets, event, owner):
+                included |= 1 << positions[id(pet)]
+            if included == all_included:
+                return list(pets)
         # Ensure that pet order is preserved
-        return [p for p in pets if p in returned_pets]
+        return [p for i, p in enumerate(pets) if included >> i & 1]
 
     def to_dict(self) -> MultiFilterDict:
         result = super().to_dict()
@@ -219,11 +299,12 @@ class AnyFilter(MultiFilter):
 class NoneFilter(Filter):
     """No Filtering"""
 
-    def __init__(self, owner: Pet | None):
-        if owner:
-            super().__init__(owner)
+    _selectivity = 1.0
+    _cost = 0.5
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """Does no filtering"""
         return [p for p in pets]
 
@@ -231,77 +312,128 @@ class NoneFilter(Filter):
 class SelfFilter(Filter):
     """Filters to only the owner pet"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.1
+    _cost = 1.0
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes only the owner pet"""
-        return [p for p in pets if p is self._owner]
+        if owner is None:
+            owner = self._owner
+        return [p for p in pets if p is owner]
 
 
 class NotSelfFilter(Filter):
     """Filters to pets that are not the owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.9
+    _cost = 1.0
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets that are not the owner in order given in `pets`"""
-        return [p for p in pets if p is not self._owner]
+        if owner is None:
+            owner = self._owner
+        return [p for p in pets if p is not owner]
 
 
 class FriendlyFilter(Filter):
     """Filters to pets in friendly to owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.5
+    _cost = 2.0
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets friendly to owner (inclusive) in order given in `pets`"""
-        if not event.pet_in_event_teams(self._owner):
+        if owner is None:
+            owner = self._owner
+        if not event.pet_in_event_teams(owner):
             raise ValueError("Owner must be in at least 1 team to use FriendlyFilter")
-        friendly_team, _ = event.get_ordered_teams(self._owner)
+        friendly_team, _ = event.get_ordered_teams(owner)
         return [p for p in pets if p in friendly_team]
 
 
 class EnemyFilter(Filter):
     """Filters to pets in opposition to owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.5
+    _cost = 2.0
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets in opposition to owner in order given in `pets`"""
-        if not event.pet_in_event_teams(self._owner):
+        if owner is None:
+            owner = self._owner
+        if not event.pet_in_event_teams(owner):
             raise ValueError("Owner must be in at least 1 team to use EnemyFilter")
-        _, enemy_team = event.get_ordered_teams(self._owner)
+        _, enemy_team = event.get_ordered_teams(owner)
         return [p for p in pets if p in enemy_team]
 
 
 class AheadFilter(Filter):
     """Filters to pets ahead of owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.5
+    _cost = 3.0
+    _preserves_order = False
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets infront of owner in order from closest to furthest"""
-        if not event.pet_in_event_teams(self._owner):
+        if owner is None:
+            owner = self._owner
+        if not event.pet_in_event_teams(owner):
             raise ValueError("Owner must be in at least 1 team to use AheadFilter")
-        friendly_team, enemy_team = event.get_ordered_teams(self._owner)
+        friendly_team, enemy_team = event.get_ordered_teams(owner)
         battlefield = [*friendly_team[::-1], *enemy_team]
-        idx = battlefield.index(self._owner)
+        idx = battlefield.index(owner)
         return [p for p in battlefield[(idx + 1) :] if p in pets]
 
 
 class BehindFilter(Filter):
     """Filters to pets behind owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.5
+    _cost = 3.0
+    _preserves_order = False
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets behind owner in order from closest to furthest"""
-        if not event.pet_in_event_teams(self._owner):
+        if owner is None:
+            owner = self._owner
+        if not event.pet_in_event_teams(owner):
             raise ValueError("Owner must be in at least 1 team to use BehindFilter")
-        friendly_team, enemy_team = event.get_ordered_teams(self._owner)
+        friendly_team, enemy_team = event.get_ordered_teams(owner)
         battlefield = [*friendly_team[::-1], *enemy_team]
-        idx = battlefield.index(self._owner)
+        idx = battlefield.index(owner)
         return [p for p in battlefield[:idx][::-1] if p in pets]
 
 
 class AdjacentFilter(Filter):
     """Filters to pets adjacent to owner"""
 
-    def filter(self, pets: list[Pet], event: Event) -> list[Pet]:
+    _selectivity = 0.2
+    _cost = 3.0
+
+    def filter(
+        self, pets: list[Pet], event: Event, owner: Pet | None = None
+    ) -> list[Pet]:
         """includes pets next to owner in order given by `pets`"""
-        if not event.pet_in_event_teams(self._owner):
+        if owner is None:
+            owner = self._owner
+        if not event.pet_in_event_teams(owner):
             raise ValueError("Owner must be in at least 1 team to use AdjacentFilter")
-        friendly_team, enemy_team = event.get_ordered_teams(self._owner)
+        friendly_team, enemy_team = event.get_ordered_teams(owner)
         battlefield = [*friendly_team[::-1], *enemy_team]
-        idx = battlefield.index(self._owner)
+        idx = battlefield.index(owner)
         result = []
         if (idx - 1) >= 0:
             result.append((battlefield[idx - 1]))
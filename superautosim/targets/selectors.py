@@ -4,10 +4,11 @@ from __future__ import annotations
 import math
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+from operator import attrgetter
 from typing import Callable, Literal, TypedDict
 
 from superautosim.pets import Pet
-from superautosim.utils import ClassMapMixin, nth_combination
+from superautosim.utils import ClassMapMixin, get_member, nth_combination
 
 
 class SelectorOptionalKeysDict(TypedDict, total=False):
@@ -70,11 +71,11 @@ class Selector(ABC):
         Returns:
             TargetFilter: Selector instance specified by selector_dict
         """
-        types = [type_.name for type_ in SelectorType]
-        if dict_.get("selector") not in types:
+        selector_type = get_member(SelectorType, dict_.get("selector"))
+        if selector_type is None:
             raise ValueError("Invalid Selector dict representation ('selector' value)")
 
-        class_ = SelectorType[dict_["selector"]].to_class()
+        class_ = selector_type.to_class()
 
         kwargs = {}
         if issubclass(class_, ValueSelector):
@@ -132,44 +133,53 @@ class ValueSelector(RandomSelector):
         super().__init__()
         self._highest = highest
 
-    def _tiebreak_select(
-        self, items: list[tuple[Pet, int]], num: int, rand: float
-    ) -> list[Pet]:
-        """Selects the top n items values, using a random select to break any ties
+    @staticmethod
+    @abstractmethod
+    def _value(pet: Pet) -> int:
+        """Returns the value of the given pet that selection is based on"""
+        raise NotImplementedError()
+
+    def _tiebreak_select(self, pets: list[Pet], num: int, rand: float) -> list[Pet]:
+        """Selects the top n pets by value, using a random select to break any ties
 
         Args:
-            items (list[tuple[Pet, int]]): List of pet, value tuples. With the
-                value determining the sort order.
-            n (int): Number of pets to select
+            pets (list[Pet]): List of pets to choose from, values are read with
+                `self._value`.
+            num (int): Number of pets to select
             rand (float): Number to determine random effects.
                 Must follow `0 >= rand and rand < 1`.
-            highest (bool, optional): Wheter to return the highest or lowest items.
 
         Returns:
-            list[Pet]: The highest (or lowest) n pets in the list of items.
+            list[Pet]: The highest (or lowest) n pets in the list of pets.
         """
-        sorted_items = sorted(items, key=lambda i: i[1], reverse=self._highest)
         if num <= 0:
             return []
+        key = self._value
+        sorted_pets = sorted(pets, key=key, reverse=self._highest)
         # No excess pets to filter
-        if len(items) <= num:
-            return [p for p, _ in sorted_items]
+        if len(sorted_pets) <= num:
+            return sorted_pets
 
-        cutoff_value = sorted_items[num - 1][1]
-        # If no tiebreak is needed for the top n items
-        if cutoff_value != sorted_items[num][1]:
-            return [p for p, _ in sorted_items[:num]]
+        cutoff_value = key(sorted_pets[num - 1])
+        # If no tiebreak is needed for the top n pets
+        if cutoff_value != key(sorted_pets[num]):
+            return sorted_pets[:num]
 
         # If there is a tie at the cutoff point randomise the pets selected
-        tied_pets = [p for p, val in sorted_items if val == cutoff_value]
-        above_cutoff = [p for p, val in sorted_items[:num] if val != cutoff_value]
-        needed = num - len(above_cutoff)
-        chosen = self._random_select(tied_pets, num=needed, rand=rand)
-        return [*above_cutoff, *chosen]
+        tie_start = num - 1
+        while tie_start > 0 and key(sorted_pets[tie_start - 1]) == cutoff_value:
+            tie_start -= 1
+        tie_end = num + 1
+        while tie_end < len(sorted_pets) and key(sorted_pets[tie_end]) == cutoff_value:
+            tie_end += 1
+        chosen = self._random_select(
+            sorted_pets[tie_start:tie_end], num=num - tie_start, rand=rand
+        )
+        return [*sorted_pets[:tie_start], *chosen]
 
-    @abstractmethod
     def select(self, pets: list[Pet], num: int, rand: float) -> list[Pet]:
-        raise NotImplementedError()
+        self._validate_args(pets, num, rand)
+        return self._tiebreak_select(pets, num, rand)
 
     def to_dict(self) -> SelectorDict:
         result = super().to_dict()
@@ -180,28 +190,22 @@ class ValueSelector(RandomSelector):
 class HealthSelector(ValueSelector):
     """Selects pets based on health"""
 
-    def select(self, pets: list[Pet], num: int, rand: float) -> list[Pet]:
-        self._validate_args(pets, num, rand)
-        pet_value = [(p, p.health) for p in pets]
-        return self._tiebreak_select(pet_value, num, rand)
+    # Read the cached total directly, skipping the property call
+    _value = attrgetter("_health")
 
 
 class AttackSelector(ValueSelector):
     """Selects pets based on attack"""
 
-    def select(self, pets: list[Pet], num: int, rand: float) -> list[Pet]:
-        self._validate_args(pets, num, rand)
-        pet_value = [(p, p.attack) for p in pets]
-        return self._tiebreak_select(pet_value, num, rand)
+    _value = attrgetter("_attack")
 
 
 class StrengthSelector(ValueSelector):
     """Selects pets based on value of attack + health"""
 
-    def select(self, pets: list[Pet], num: int, rand: float) -> list[Pet]:
-        self._validate_args(pets, num, rand)
-        pet_value = [(p, p.attack + p.health) for p in pets]
-        return self._tiebreak_select(pet_value, num, rand)
+    @staticmethod
+    def _value(pet: Pet) -> int:
+        return pet._attack + pet._health
 
 
 class SelectorType(ClassMapMixin[Selector], Enum):
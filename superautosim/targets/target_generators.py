@@ -9,6 +9,7 @@ from superautosim.events import Event
 from superautosim.pets import Pet
 from superautosim.targets.filters import Filter, FilterDict, NoneFilter
 from superautosim.targets.selectors import Selector, SelectorDict
+from superautosim.utils import ClassMapMixin, get_member
 
 
 class TargetGeneratorDict(TypedDict, total=True):
@@ -20,7 +21,7 @@ class TargetGeneratorDict(TypedDict, total=True):
 TargetGeneratorTypeValue = Literal["BATTLEFIELD"]
 
 
-class TargetGeneratorType(Enum):
+class TargetGeneratorType(ClassMapMixin["TargetGenerator"], Enum):
     """Enumeration of types of selector"""
 
     BATTLEFIELD = auto()
@@ -28,40 +29,47 @@ class TargetGeneratorType(Enum):
     name: TargetGeneratorTypeValue
 
     @classmethod
-    def _get_mapping(cls):
+    def _get_mapping(cls) -> dict[TargetGeneratorType, type[TargetGenerator]]:
         return {
             cls.BATTLEFIELD: BattlefieldTargetGenerator,
         }
 
-    def to_class(self) -> type[TargetGenerator]:
-        """Returns the TargetFilter class corresponding to the enum value"""
-        mapping = self._get_mapping()
-        return mapping[self]
-
-    @classmethod
-    def from_class(cls, class_: type[TargetGenerator]) -> TargetGeneratorType:
-        """Returns the Type corresponding to the given class"""
-        mapping = cls._get_mapping()
-        for type_, map_class in mapping.items():
-            if class_ is map_class:
-                return type_
-        raise NotImplementedError(f"{class_} does not map to a type")
-
 
 class TargetGenerator(ABC):
-    """Generates a target(s)"""
+    """Generates a target(s)
 
-    def __init__(self, owner: Pet, selector: Selector, filter_: Filter = None):
+    Like filters, target generators are relative to an owner which is either given
+    to `get` or bound at construction.
+    """
+
+    def __init__(self, owner: Pet | None, selector: Selector, filter_: Filter = None):
         self._owner = owner
         self._selector = selector
         self._filter = filter_ if filter_ else NoneFilter(None)
 
-    def _filter_select(self, pets: list[Pet], event: Event, num: int, rand: float):
-        filtered = self._filter.filter(pets, event) if self._filter else pets
+    def _filter_select(
+        self, pets: list[Pet], event: Event, num: int, rand: float, owner: Pet
+    ):
+        filtered = self._filter.filter(pets, event, owner) if self._filter else pets
         return self._selector.select(filtered, num, rand)
 
     @abstractmethod
-    def get(self, event: Event, num: int, rand: float) -> list[Pet]:
+    def get(
+        self, event: Event, num: int, rand: float, owner: Pet | None = None
+    ) -> list[Pet]:
+        """Generate up to num targets
+
+        Args:
+            event (Event): The event being resolved.
+            num (int): Maximum number of targets.
+            rand (float): Number to determine random effects.
+                Must follow `0 >= rand and rand < 1`.
+            owner (Pet, optional): The pet targets are relative to, defaults to
+                the owner given at construction.
+
+        Returns:
+            list[Pet]: The generated targets
+        """
         raise NotImplementedError()
 
     def to_dict(self) -> TargetGeneratorDict:
@@ -72,11 +80,14 @@ class TargetGenerator(ABC):
         }
 
     @staticmethod
-    def from_dict(generator_dict: TargetGeneratorDict, owner: Pet) -> TargetGenerator:
+    def from_dict(
+        generator_dict: TargetGeneratorDict, owner: Pet | None = None
+    ) -> TargetGenerator:
         """Creates a target generator from its dictionary representation
 
         Args:
             dict_ (dict): dictionary representation to create from.
+            owner (Pet, optional): Owner to bind the target generator to.
 
         Raises:
             ValueError: When given an invalid dictionary
@@ -86,19 +97,24 @@ class TargetGenerator(ABC):
         """
         selector = Selector.from_dict(generator_dict["selector"])
         filter_ = Filter.from_dict(generator_dict["filter"], owner)
-        types = [type_.name for type_ in TargetGeneratorType]
-        if generator_dict.get("target_generator") in types:
-            class_ = TargetGeneratorType[generator_dict["target_generator"]].to_class()
-        else:
+        generator_type = get_member(
+            TargetGeneratorType, generator_dict.get("target_generator")
+        )
+        if generator_type is None:
             raise ValueError("Invalid TargetGenerator dict representation")
 
-        return class_(owner, selector, filter_)
+        return generator_type.to_class()(owner, selector, filter_)
 
 
 class BattlefieldTargetGenerator(TargetGenerator):
     """Generates target(s) from current battlefield teams"""
 
-    def get(self, event: Event, num: int, rand: float) -> list[Pet]:
-        friendly_team, enemy_team = event.get_ordered_teams(self._owner)
-        pets = [*friendly_team[::-1], *enemy_team]
-        return self._filter_select(pets, event, num, rand)
+    def get(
+        self, event: Event, num: int, rand: float, owner: Pet | None = None
+    ) -> list[Pet]:
+        if owner is None:
+            owner = self._owner
+        friendly_team, enemy_team = event.get_ordered_teams(owner)
+        # Team slots may be empty
+        pets = [pet for pet in (*friendly_team[::-1], *enemy_team) if pet is not None]
+        return self._filter_select(pets, event, num, rand, owner)
@@ -10,6 +10,9 @@ class Team:
     """Class to represent a team of pets"""
 
     MAX_TEAM_SIZE = 5
+    # Incremented on every change to the slots of any team, a cheap check that
+    # no team changed since a cached result was computed.
+    mutations = 0
 
     def __init__(self, pets: Sequence[Pet | None] | None = None) -> None:
         if pets is None:
@@ -20,6 +23,9 @@ class Team:
         empty_slots = self.MAX_TEAM_SIZE - len(pets)
         # Slots always has a length of MAX_TEAM_SIZE
         self._slots: list[Pet | None] = list(pets) + [None] * empty_slots
+        # Incremented on every change to the slots, used to invalidate cached
+        # results that depend on team composition or order.
+        self.version = 0
 
     def summon_pet(self, pet: Pet, index: int) -> bool:
         """Summon a pet as close as possible to the given idx
@@ -65,8 +71,30 @@ class Team:
         self._slots.pop(index_to_remove)
 
         self._slots.insert(index, pet)
+        self.version += 1
+        Team.mutations += 1
         return True
 
+    def remove_pet(self, pet: Pet) -> int:
+        """Remove the pet from the team, leaving its slot empty
+
+        Args:
+            pet (Pet): Pet to remove.
+
+        Raises:
+            ValueError: pet is not in the team.
+
+        Returns:
+            int: Index of the slot the pet was removed from.
+        """
+        for index, slot_pet in enumerate(self._slots):
+            if slot_pet is pet:
+                self._slots[index] = None
+                self.version += 1
+                Team.mutations += 1
+                return index
+        raise ValueError("pet is not in the team")
+
     @property
     def pets(self) -> list[Pet]:
         return [p for p in self._slots if p]
@@ -0,0 +1,156 @@
+"""Module for round-robin tournaments between candidate teams"""
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterator, Sequence
+
+from superautosim.encoding import encode_team, team_digest, team_hash
+from superautosim.montecarlo import ResultRecord, Tally, simulate, simulate_encoded
+from superautosim.teams import Team
+
+
+@dataclass
+class TournamentResult:
+    """Results of a round-robin tournament
+
+    matrix[i][j] is the tally of teams[i] against teams[j].
+    """
+
+    teams: list[Team]
+    matrix: list[list[Tally]]
+
+    def scores(self) -> list[float]:
+        """Returns the mean score of each team against every team"""
+        return [
+            sum(tally.score for tally in row) / len(row) if row else 0.0
+            for row in self.matrix
+        ]
+
+
+def iter_tournament(
+    teams: Sequence[Team],
+    battles_per_pair: int,
+    seed: int = 0,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> Iterator[tuple[int, int, Tally]]:
+    """Play every pair of distinct teams, yielding results as they finish
+
+    Identical teams (equal team_hash) are only played once, and each unordered
+    pair is only played once as the mirrored tally gives the reverse matchup.
+    Yields (i, j, tally) for i <= j indexes of the unique teams given by
+    unique_teams, the tally being from team i's perspective.
+
+    Args:
+        teams (Sequence[Team]): The teams to play.
+        battles_per_pair (int): Battles played for each pair of teams.
+        seed (int): Seed of every battle's random stream.
+        max_workers (int, optional): Size of the process pool to create when no
+            executor is given, 0 plays every pair in this process.
+        executor (Executor, optional): Executor to submit pairs to.
+    """
+    unique = unique_teams(teams)[0]
+    encoded = [encode_team(team) for team in unique]
+    pairs = [(i, j) for i in range(len(unique)) for j in range(i, len(unique))]
+
+    if executor is None and max_workers == 0:
+        for i, j in pairs:
+            yield i, j, simulate(unique[i], unique[j], battles_per_pair, seed)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers)
+    try:
+        futures = {
+            executor.submit(
+                simulate_encoded, encoded[i], encoded[j], battles_per_pair, seed
+            ): (i, j)
+            for i, j in pairs
+        }
+        for future in as_completed(futures):
+            yield (*futures[future], future.result())
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def iter_tournament_records(
+    teams: Sequence[Team],
+    battles_per_pair: int,
+    seed: int = 0,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> Iterator[ResultRecord]:
+    """iter_tournament yielding a result record for each pair of unique teams
+
+    The reverse matchup of each record is its mirror, see
+    results.ResultReader.aggregate_by_team.
+    """
+    digests = [team_digest(team) for team in unique_teams(teams)[0]]
+    for i, j, tally in iter_tournament(
+        teams, battles_per_pair, seed, max_workers, executor
+    ):
+        yield ResultRecord.from_tally(digests[i], digests[j], seed, tally)
+
+
+def tournament(
+    teams: Sequence[Team],
+    battles_per_pair: int,
+    seed: int = 0,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    on_result: Callable[[int, int, Tally], None] | None = None,
+) -> TournamentResult:
+    """Play a round robin of every team against every team, itself included
+
+    See iter_tournament for the shared work between pairs.
+
+    Args:
+        on_result (Callable, optional): Called with (i, j, tally) for every cell of
+            the matrix as soon as it is known, i and j index the given teams.
+
+    Returns:
+        TournamentResult: The K x K result matrix of the given teams.
+    """
+    unique, index_of = unique_teams(teams)
+    members: list[list[int]] = [[] for _ in unique]
+    for team_idx, unique_idx in enumerate(index_of):
+        members[unique_idx].append(team_idx)
+
+    matrix: list[list[Tally]] = [[Tally() for _ in teams] for _ in teams]
+    for i, j, tally in iter_tournament(
+        unique, battles_per_pair, seed, max_workers, executor
+    ):
+        if i == j:
+            # A team against itself is not symmetric, its random streams differ
+            cells = [(row, col, tally) for row in members[i] for col in members[i]]
+        else:
+            mirrored = tally.mirrored()
+            cells = [(row, col, tally) for row in members[i] for col in members[j]]
+            cells += [(col, row, mirrored) for row, col, _ in cells]
+        for row, col, cell in cells:
+            matrix[row][col] = cell
+            if on_result is not None:
+                on_result(row, col, cell)
+    return TournamentResult(list(teams), matrix)
+
+
+def unique_teams(teams: Sequence[Team]) -> tuple[list[Team], list[int]]:
+    """Dedupe teams by team_hash
+
+    Returns:
+        tuple[list[Team], list[int]]: The unique teams in first-seen order, and
+            the index into them of every given team.
+    """
+    unique: list[Team] = []
+    index_of: list[int] = []
+    seen: dict[str, int] = {}
+    for team in teams:
+        key = team_hash(team)
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append(team)
+        index_of.append(seen[key])
+    return unique, index_of
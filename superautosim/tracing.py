@@ -0,0 +1,140 @@
+"""Module defining the TraceRecorder, an opt-in battle event trace
+
+Tracing is off unless a recorder is given to a Battle (or EventScheduler), the
+engine then only pays for an `is not None` check at each trace point. Records
+are fixed-width rows of integers written into a preallocated ring buffer, so a
+long battle keeps its most recent `capacity` records. Pets are stored as codes
+and rendered with Pet.__repr__ when the trace is decoded.
+"""
+from __future__ import annotations
+
+from array import array
+from enum import IntEnum
+from typing import NamedTuple
+
+from superautosim.events import EventType
+from superautosim.pets import Pet
+
+# kind, turn, event type, pet code, attack, health, value
+FIELDS = 7
+NO_PET = -1
+
+
+class TraceKind(IntEnum):
+    """Kind of a trace record"""
+
+    TURN = 1  # value is the new turn number
+    EVENT = 2  # an event was resolved, pet is the event pet
+    TRIGGER = 3  # pet's ability was triggered by an event of the given type
+    TARGET = 4  # pet was targeted by an ability triggered by the event type
+    DAMAGE = 5  # pet took value attack damage
+    REMOVE = 6  # fainted pet was removed from its team
+
+
+class TraceEntry(NamedTuple):
+    """A decoded trace record"""
+
+    kind: TraceKind
+    turn: int
+    event: EventType | None
+    pet: str | None
+    value: int
+
+    def __str__(self) -> str:
+        parts = [f"turn {self.turn}", self.kind.name]
+        if self.event is not None:
+            parts.append(self.event.name)
+        if self.pet is not None:
+            parts.append(self.pet)
+        if self.kind in (TraceKind.TURN, TraceKind.DAMAGE):
+            parts.append(str(self.value))
+        return " ".join(parts)
+
+
+class TraceRecorder:
+    """Records integer-coded trace records into a ring buffer"""
+
+    def __init__(self, capacity: int = 4096):
+        """Initialises a recorder
+
+        Args:
+            capacity (int): Records kept, older records are overwritten.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._data = array("q", bytes(8 * FIELDS * capacity))
+        self._written = 0
+        self._codes: dict[int, int] = {}
+        # Registered pets are kept alive so their ids are never reused
+        self._pets: list[Pet] = []
+        self.turn = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def dropped(self) -> int:
+        """Number of records overwritten since the recorder was cleared"""
+        return max(0, self._written - self._capacity)
+
+    def __len__(self) -> int:
+        return min(self._written, self._capacity)
+
+    def record(
+        self,
+        kind: TraceKind,
+        event_type: EventType | None = None,
+        pet: Pet | None = None,
+        value: int = 0,
+    ):
+        row = (self._written % self._capacity) * FIELDS
+        data = self._data
+        data[row] = kind
+        data[row + 1] = self.turn
+        data[row + 2] = 0 if event_type is None else event_type.value
+        if pet is None:
+            data[row + 3] = NO_PET
+            data[row + 4] = data[row + 5] = 0
+        else:
+            code = self._codes.get(id(pet))
+            if code is None:
+                code = self._codes[id(pet)] = len(self._pets)
+                self._pets.append(pet)
+            data[row + 3] = code
+            data[row + 4] = pet.attack
+            data[row + 5] = pet.health
+        data[row + 6] = value
+        self._written += 1
+
+    def records(self) -> list[tuple[int, ...]]:
+        """Returns the raw records, oldest first"""
+        start = self._written % self._capacity if self.dropped else 0
+        order = [*range(start, len(self)), *range(start)]
+        data = self._data
+        return [tuple(data[i * FIELDS : (i + 1) * FIELDS]) for i in order]
+
+    def decode(self) -> list[TraceEntry]:
+        """Returns the records, oldest first, with pets rendered by Pet.__repr__
+
+        Pets are shown with their stats at the time of the record.
+        """
+        entries = []
+        for kind, turn, event_value, code, attack, health, value in self.records():
+            pet = None
+            if code != NO_PET:
+                pet = repr(Pet(self._pets[code].name, (attack, health)))
+            event = EventType(event_value) if event_value else None
+            entries.append(TraceEntry(TraceKind(kind), turn, event, pet, value))
+        return entries
+
+    def format(self) -> str:
+        """Returns the decoded trace, one record per line"""
+        return "\n".join(str(entry) for entry in self.decode())
+
+    def clear(self):
+        self._written = 0
+        self._codes.clear()
+        self._pets.clear()
+        self.turn = 0
@@ -6,13 +6,16 @@ from typing import List, Union
 
 from superautosim.events import Event, EventType
 from superautosim.pets import Pet
+from superautosim.utils import get_member
 
 
 class Trigger(ABC):
     """Base class to determine if an ability's effect should be triggered"""
 
     @abstractmethod
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
         """Determines if the given conditions should trigger an effect
 
         Args:
@@ -20,6 +23,9 @@ class Trigger(ABC):
                 as the type of event, the source pet, which food was used,
                 whether a battle is in progress and the teams involved.
             owner (Pet, optional): The pet who owns the trigger.
+            counters (dict, optional): Per-owner state of stateful triggers, keyed
+                by trigger. This allows a trigger to be shared by many pets. When
+                not given, triggers keep their state on themselves.
 
         Returns:
             bool: Whether the event is triggered.
@@ -56,8 +62,9 @@ class Trigger(ABC):
         """
         trigger: Trigger
         # Create base trigger based on "op" or "event" key
-        if trigger_dict.get("event") in [et.name for et in EventType]:
-            trigger = TypeTrigger(EventType[trigger_dict["event"]])
+        event_type = get_member(EventType, trigger_dict.get("event"))
+        if event_type is not None:
+            trigger = TypeTrigger(event_type)
 
         elif trigger_dict.get("op") in ("ANY", "ALL") and "triggers" in trigger_dict:
             nested_triggers = [cls.from_dict(t) for t in trigger_dict["triggers"]]
@@ -140,7 +147,9 @@ class Trigger(ABC):
 class NeverTrigger(Trigger):
     """Always triggers, regardless of event or owner"""
 
-    def is_triggered(self, event: Event, owner: Pet = None) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet = None, counters: dict | None = None
+    ) -> bool:
         return False
 
     def to_dict(self) -> dict:
@@ -150,7 +159,9 @@ class NeverTrigger(Trigger):
 class AlwaysTrigger(Trigger):
     """Always triggers, regardless of event or owner"""
 
-    def is_triggered(self, event: Event, owner: Pet = None) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet = None, counters: dict | None = None
+    ) -> bool:
         return True
 
     def to_dict(self) -> dict:
@@ -175,9 +186,11 @@ class MultiTrigger(Trigger):
 class AnyTrigger(MultiTrigger):
     """Triggers if any of the given triggers are triggered"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
         for trigger in self._triggers:
-            if trigger.is_triggered(event, owner):
+            if trigger.is_triggered(event, owner, counters):
                 return True
         return False
 
@@ -190,9 +203,11 @@ class AnyTrigger(MultiTrigger):
 class AllTrigger(MultiTrigger):
     """Triggers if all of the given triggers are triggered"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
         for trigger in self._triggers:
-            if not trigger.is_triggered(event, owner):
+            if not trigger.is_triggered(event, owner, counters):
                 return False
         return len(self._triggers) > 0
 
@@ -208,7 +223,9 @@ class TypeTrigger(Trigger):
     def __init__(self, event_type: EventType):
         self._event_type = event_type
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
         return bool(event and event.type is self._event_type)
 
     def to_dict(self) -> dict:
@@ -228,8 +245,10 @@ class ModifierTrigger(Trigger):
         else:
             raise ValueError("trigger must be of type Trigger or EventType")
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
-        return self._trigger.is_triggered(event, owner)
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        return self._trigger.is_triggered(event, owner, counters)
 
     def to_dict(self) -> dict:
         result = self._trigger.to_dict()
@@ -257,16 +276,27 @@ class LimitTrigger(ModifierTrigger):
     def reset_limit(self):
         self.remaining_limit = self.trigger_limit
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        if counters is None:
+            remaining = self.remaining_limit
+        else:
+            remaining = counters.get(self, self.trigger_limit)
+
         if event.type is self._reset_event:
-            self.reset_limit()
+            remaining = self.trigger_limit
 
-        if self.remaining_limit <= 0:
-            return False
+        is_triggered = False
+        if remaining > 0:
+            is_triggered = super().is_triggered(event, owner, counters)
+            if is_triggered:
+                remaining -= 1
 
-        is_triggered = super().is_triggered(event, owner)
-        if is_triggered:
-            self.remaining_limit -= 1
+        if counters is None:
+            self.remaining_limit = remaining
+        else:
+            counters[self] = remaining
         return is_triggered
 
     def to_dict(self) -> dict:
@@ -299,17 +329,26 @@ class CountTrigger(ModifierTrigger):
     def reset_count(self):
         self.count = 0
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        count = self.count if counters is None else counters.get(self, 0)
+
         if event.type is self._reset_event:
-            self.reset_count()
+            count = 0
 
-        if super().is_triggered(event, owner):
-            self.count += 1
+        is_triggered = False
+        if super().is_triggered(event, owner, counters):
+            count += 1
+            if count >= self.required_count:
+                count = 0
+                is_triggered = True
 
-            if self.count >= self.required_count:
-                self.reset_count()
-                return True
-        return False
+        if counters is None:
+            self.count = count
+        else:
+            counters[self] = count
+        return is_triggered
 
     def to_dict(self) -> dict:
         result = super().to_dict()
@@ -325,8 +364,10 @@ class CountTrigger(ModifierTrigger):
 class SelfTrigger(ModifierTrigger):
     """Trigger on type IF event pet is owner pet"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
-        if not super().is_triggered(event, owner):
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        if not super().is_triggered(event, owner, counters):
             return False
         return None not in (owner, event.pet) and owner is event.pet
 
@@ -340,8 +381,10 @@ class SelfTrigger(ModifierTrigger):
 class FriendlyTrigger(ModifierTrigger):
     """Trigger on type IF event pet is a *non-owner* friendly pet"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
-        if not super().is_triggered(event, owner):
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        if not super().is_triggered(event, owner, counters):
             return False
 
         try:
@@ -365,8 +408,10 @@ class FriendlyTrigger(ModifierTrigger):
 class EnemyTrigger(ModifierTrigger):
     """Trigger on type IF event pet is an enemy pet"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
-        if not super().is_triggered(event, owner):
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        if not super().is_triggered(event, owner, counters):
             return False
 
         if len(event.teams) < 2:
@@ -391,8 +436,10 @@ class EnemyTrigger(ModifierTrigger):
 class AheadTrigger(ModifierTrigger):
     """Trigger on type IF event pet is ahead"""
 
-    def is_triggered(self, event: Event, owner: Pet) -> bool:
-        if not super().is_triggered(event, owner):
+    def is_triggered(
+        self, event: Event, owner: Pet, counters: dict | None = None
+    ) -> bool:
+        if not super().is_triggered(event, owner, counters):
             return False
 
         if len(event.teams) == 0 or owner is None:
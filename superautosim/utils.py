@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import math
 from enum import Enum
+from functools import cache
 from typing import Generic, TypeVar
 
 T = TypeVar("T", bound=Enum)
@@ -7,19 +10,53 @@ Y = TypeVar("Y")
 
 
 class ClassMapMixin(Generic[Y]):
-    """Helper class for Enums mapping to classes"""
+    """Helper class for Enums mapping to classes
+
+    By default each enum value is the class it maps to. Enums defined before their
+    classes override `_get_mapping` instead. Both directions of the mapping are
+    built once per enum, so lookups are constant time.
+    """
+
+    @classmethod
+    def _get_mapping(cls: type[T]) -> dict[T, type[Y]]:
+        """Returns a mapping of each enum type to its class"""
+        return {type_: type_.value for type_ in cls}
+
+    @classmethod
+    @cache
+    def _class_mapping(cls: type[T]) -> dict[T, type[Y]]:
+        return dict(cls._get_mapping())
+
+    @classmethod
+    @cache
+    def _type_mapping(cls: type[T]) -> dict[type[Y], T]:
+        return {class_: type_ for type_, class_ in cls._class_mapping().items()}
 
     def to_class(self) -> type[Y]:
-        """Returns the Selector class corresponding to the enum value"""
-        return self.value
+        """Returns the class corresponding to the enum value"""
+        class_ = self._class_mapping().get(self)
+        if class_ is None:
+            raise NotImplementedError(f"{self} does not map to a class")
+        return class_
 
     @classmethod
     def from_class(cls: type[T], class_: type[Y]) -> T:
         """Returns the Type corresponding to the given class"""
-        for type_ in cls:
-            if type_.value is class_:
-                return type_
-        raise NotImplementedError(f"{class_} does not map to a type")
+        type_ = cls._type_mapping().get(class_)
+        if type_ is None:
+            raise NotImplementedError(f"{class_} does not map to a type")
+        return type_
+
+
+def get_member(enum: type[T], name) -> T | None:
+    """Returns the member of the enum with the given name, or None if there is none
+
+    Unlike `enum[name]` this does not raise for unknown or non-string names, so it can
+    be used to validate dictionary values.
+    """
+    if not isinstance(name, str):
+        return None
+    return enum.__members__.get(name)
 
 
 def nth_combination(iterable, r, index):
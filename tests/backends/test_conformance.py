@@ -0,0 +1,80 @@
+"""Conformance tests every backend must pass, NumPy tests skip without NumPy"""
+import random
+
+import pytest
+
+from superautosim.backends import (
+    BACKENDS,
+    Backend,
+    PythonBackend,
+    default_backend,
+    get_backend,
+)
+from superautosim.pets import Pet
+from superautosim.rand import uniform
+from superautosim.teams import Team
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request) -> Backend:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return get_backend(request.param)
+
+
+def make_matchups(seed, num):
+    rng = random.Random(seed)
+
+    def team():
+        return Team(
+            [
+                Pet(stats=(rng.randint(0, 8), rng.randint(0, 8)))
+                if rng.random() > 0.2
+                else None
+                for _ in range(rng.randint(0, Team.MAX_TEAM_SIZE))
+            ]
+        )
+
+    return [(team(), team()) for _ in range(num)]
+
+
+def test_pack(backend):
+    fainted = Pet(stats=(3, 0))
+    matchups = [(Team([Pet(stats=(1, 2)), None, fainted, Pet(stats=(3, 4))]), Team())]
+    batch = backend.pack(matchups)
+    assert len(batch) == 1
+    assert [list(side) for side in batch.counts] == [[2, 0]]
+    assert list(batch.attack[0][0][:2]) == [1, 3]
+    assert list(batch.health[0][0][:2]) == [2, 4]
+
+
+@pytest.mark.parametrize("max_turns", [0, 1, 3, 500])
+def test_run_stat_only(backend, max_turns):
+    matchups = make_matchups(max_turns, 300)
+    reference = PythonBackend()
+    expected = reference.run_stat_only(reference.pack(matchups), max_turns)
+    results = backend.run_stat_only(backend.pack(matchups), max_turns)
+    assert results == expected
+    assert set(results) <= {-1, 0, 1}
+
+
+def test_argmax(backend):
+    values = [[1, 5, 5, 2], [0, 0, 0, 0], [-1, -3, 7, 7]]
+    assert list(backend.argmax(values)) == [1, 0, 2]
+    assert list(backend.argmax([[False, True, True], [False, False, True]])) == [1, 2]
+
+
+@pytest.mark.parametrize("seed", [0, 1, -1, 2**64 - 1])
+def test_uniform(backend, seed):
+    streams = [0, 1, 2, 12345, 2**63]
+    for counter in (0, 1, 99):
+        expected = [uniform(seed, stream, counter) for stream in streams]
+        assert backend.uniform(seed, streams, counter) == expected
+
+
+def test_get_backend():
+    assert get_backend() is default_backend
+    assert isinstance(get_backend("python"), PythonBackend)
+    with pytest.raises(ValueError):
+        get_backend("fortran")
+    assert set(BACKENDS) >= {"python"}
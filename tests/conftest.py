@@ -1,8 +1,25 @@
+import copy
+
 import pytest
 
+from superautosim.abilities import Ability
+from superautosim.library import Library
 from superautosim.pets import Pet
 from superautosim.teams import Team
 
+MOSQUITO = {
+    "trigger": {"event": "START_OF_BATTLE"},
+    "action": {
+        "action": "DEAL_DAMAGE",
+        "target_generator": {
+            "target_generator": "BATTLEFIELD",
+            "filter": {"op": "SINGLE", "filter": "ENEMY"},
+            "selector": {"selector": "RANDOM"},
+        },
+        "damage": 1,
+    },
+}
+
 
 @pytest.fixture
 def pet():
@@ -33,3 +50,53 @@ def enemy_team():
             Pet("enemy5", (5, 5)),
         ]
     )
+
+
+@pytest.fixture
+def mosquito():
+    """Ability dict dealing 1 damage to a random enemy at the start of battle"""
+    return copy.deepcopy(MOSQUITO)
+
+
+@pytest.fixture
+def make_pet():
+    """Factory of pets with the given stats and optional ability dict"""
+
+    def make_pet(stats, ability_dict=None):
+        pet = Pet(stats=stats)
+        if ability_dict is not None:
+            pet.ability = Ability.from_dict(ability_dict)
+        return pet
+
+    return make_pet
+
+
+@pytest.fixture
+def mosquito_team(make_pet, mosquito):
+    """Factory of teams of a single mosquito with the given stats"""
+
+    def mosquito_team(attack=1, health=2):
+        return Team([make_pet((attack, health), mosquito)])
+
+    return mosquito_team
+
+
+@pytest.fixture
+def opponents():
+    return [
+        Team([Pet(stats=(1, 1)), Pet(stats=(2, 1))]),
+        Team([Pet(stats=(1, 1)), Pet(stats=(1, 3))]),
+    ]
+
+
+@pytest.fixture
+def pet_library():
+    return Library.from_dict(
+        {
+            "pets": [
+                {"name": "ant", "tier": 1, "attack": 2, "health": 1},
+                {"name": "fish", "tier": 1, "attack": 2, "health": 3},
+                {"name": "giraffe", "tier": 3, "attack": 2, "health": 4},
+            ]
+        }
+    )
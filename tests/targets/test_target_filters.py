@@ -22,6 +22,7 @@ from superautosim.targets import (
     SelfFilter,
     SingleFilterValue,
 )
+from superautosim.teams import Team
 
 
 def test_single_filter_dict():
@@ -448,3 +449,184 @@ class FilterFromDictTestCase(TestCase):
         )
         self.assertIsInstance(filt, AllFilter)
         self.assertEqual(len(filt._filters), 2)
+
+
+class FilterMemoTestCase(TestCase):
+    def setUp(self):
+        self.friendly_team = Team([Pet(f"friend{i}") for i in range(3)])
+        self.enemy_team = Team([Pet(f"enemy{i}") for i in range(3)])
+        self.owner = self.friendly_team[0]
+        self.event = Event(EventType.NONE, teams=(self.friendly_team, self.enemy_team))
+
+    def battlefield(self):
+        return [*self.friendly_team.pets[::-1], *self.enemy_team.pets]
+
+    def friendly_not_self(self):
+        owner = self.owner
+        return AllFilter(owner, [FriendlyFilter(owner), NotSelfFilter(owner)])
+
+    def test_memo_shared_between_equivalent_filters(self):
+        expected = self.friendly_team.pets[:0:-1]
+        self.assertEqual(
+            expected, self.friendly_not_self().filter(self.battlefield(), self.event)
+        )
+        memo_size = len(self.event._filter_memo)
+        self.assertEqual(
+            expected, self.friendly_not_self().filter(self.battlefield(), self.event)
+        )
+        self.assertEqual(memo_size, len(self.event._filter_memo))
+
+    def test_memo_result_is_a_copy(self):
+        filt = self.friendly_not_self()
+        filt.filter(self.battlefield(), self.event).clear()
+        self.assertEqual(2, len(filt.filter(self.battlefield(), self.event)))
+
+    def test_memo_keyed_on_owner_and_pets(self):
+        other = self.friendly_team[1]
+        self.friendly_not_self().filter(self.battlefield(), self.event)
+        self.assertNotIn(
+            other,
+            AllFilter(other, [FriendlyFilter(other), NotSelfFilter(other)]).filter(
+                self.battlefield(), self.event
+            ),
+        )
+        self.assertEqual(
+            [], FriendlyFilter(self.owner).filter(self.enemy_team.pets, self.event)
+        )
+
+    def test_memo_invalidated_by_team_mutation(self):
+        filt = self.friendly_not_self()
+        self.assertEqual(2, len(filt.filter(self.battlefield(), self.event)))
+        new_pet = Pet("new")
+        self.friendly_team.summon_pet(new_pet, 1)
+        self.assertIn(new_pet, filt.filter(self.battlefield(), self.event))
+
+    def test_memo_cleared_on_team_mutation(self):
+        filt = self.friendly_not_self()
+        for i in range(3):
+            self.friendly_team.summon_pet(Pet(f"new{i}"), 4)
+            filt.filter(self.battlefield(), self.event)
+            memo_size = len(self.event._filter_memo)
+            self.friendly_team.remove_pet(self.friendly_team[4])
+            filt.filter(self.battlefield(), self.event)
+            # Results of earlier battlefield states are dropped
+            self.assertEqual(memo_size, len(self.event._filter_memo))
+
+    def test_single_filters_not_memoised(self):
+        filt = FriendlyFilter(self.owner)
+        self.assertEqual(3, len(filt.filter(self.battlefield(), self.event)))
+        self.assertEqual({}, self.event._filter_memo)
+
+    def test_list_teams_not_memoised(self):
+        friendly = self.friendly_team.pets
+        event = Event(EventType.NONE, teams=(friendly, self.enemy_team))
+        filt = self.friendly_not_self()
+        self.assertEqual(2, len(filt.filter(self.battlefield(), event)))
+        new_pet = Pet("new")
+        friendly.append(new_pet)
+        self.assertIn(new_pet, filt.filter([*self.battlefield(), new_pet], event))
+        self.assertEqual({}, event._filter_memo)
+
+
+class MultiFilterOrderingTestCase(TestCase):
+    class RecordingFilter(Filter):
+        """Filter keeping all pets and recording each call"""
+
+        _selectivity = 0.5
+
+        def __init__(self, owner):
+            super().__init__(owner)
+            self.calls = 0
+
+        def filter(self, pets, event, owner=None):
+            self.calls += 1
+            return list(pets)
+
+    def setUp(self):
+        self.friendly_team = [Mock(Pet) for i in range(5)]
+        self.enemy_team = [Mock(Pet) for i in range(5)]
+        self.owner = self.friendly_team[2]
+        self.event = Event(EventType.NONE, teams=(self.friendly_team, self.enemy_team))
+        self.battlefield = [*self.friendly_team[::-1], *self.enemy_team]
+
+    def test_all_filter_order(self):
+        owner = self.owner
+        ahead, friendly, self_ = (
+            AheadFilter(owner),
+            FriendlyFilter(owner),
+            SelfFilter(owner),
+        )
+        filt = AllFilter(owner, [ahead, friendly, self_])
+        self.assertEqual([self_, friendly, ahead], filt._ordered_filters)
+        # Serialised order is unchanged
+        self.assertEqual(
+            ["AHEAD", "FRIENDLY", "SELF"],
+            [d["filter"] for d in filt.to_dict()["filters"]],
+        )
+
+    def test_all_filter_result_order_unchanged(self):
+        owner = self.owner
+        expected = self.friendly_team[1::-1]
+        for filters in (
+            [AheadFilter(owner), FriendlyFilter(owner)],
+            [FriendlyFilter(owner), AheadFilter(owner)],
+        ):
+            filt = AllFilter(owner, filters)
+            self.assertEqual(expected, filt.filter(self.battlefield[::-1], self.event))
+
+    def test_all_filter_short_circuit(self):
+        recorder = self.RecordingFilter(self.owner)
+        filt = AllFilter(self.owner, [recorder, SelfFilter(self.owner)])
+        self.assertEqual([], filt.filter(self.enemy_team, self.event))
+        self.assertEqual(0, recorder.calls)
+        self.assertEqual([self.owner], filt.filter(self.friendly_team, self.event))
+        self.assertEqual(1, recorder.calls)
+
+    def test_any_filter_short_circuit(self):
+        recorder = self.RecordingFilter(self.owner)
+        filt = AnyFilter(self.owner, [recorder, NoneFilter(self.owner)])
+        self.assertEqual(self.battlefield, filt.filter(self.battlefield, self.event))
+        self.assertEqual(0, recorder.calls)
+        filt = AnyFilter(self.owner, [SelfFilter(self.owner), recorder])
+        self.assertEqual(self.battlefield, filt.filter(self.battlefield, self.event))
+        self.assertEqual(1, recorder.calls)
+
+    def test_any_filter_preserves_pet_order(self):
+        owner = self.owner
+        filt = AnyFilter(owner, [BehindFilter(owner), SelfFilter(owner)])
+        self.assertEqual(
+            self.friendly_team[2:], filt.filter(self.friendly_team, self.event)
+        )
+
+
+class FilterCallTimeOwnerTestCase(TestCase):
+    def setUp(self):
+        self.friendly_team = [Mock(Pet) for i in range(5)]
+        self.enemy_team = [Mock(Pet) for i in range(5)]
+        self.event = Event(EventType.NONE, teams=(self.friendly_team, self.enemy_team))
+        self.battlefield = [*self.friendly_team[::-1], *self.enemy_team]
+
+    def test_unbound_filters(self):
+        for owner in (self.friendly_team[1], self.enemy_team[3]):
+            for filt_class in (SelfFilter, NotSelfFilter, AheadFilter, AdjacentFilter):
+                self.assertEqual(
+                    filt_class(owner).filter(self.battlefield, self.event),
+                    filt_class().filter(self.battlefield, self.event, owner),
+                )
+
+    def test_shared_multi_filter(self):
+        filt = AllFilter(None, [FriendlyFilter(), NotSelfFilter()])
+        for owner, team in (
+            (self.friendly_team[0], self.friendly_team),
+            (self.enemy_team[0], self.enemy_team),
+        ):
+            self.assertEqual(team[1:], filt.filter(team, self.event, owner))
+
+    def test_call_time_owner_overrides_bound_owner(self):
+        owner = self.friendly_team[0]
+        filt = SelfFilter(self.enemy_team[0])
+        self.assertEqual([owner], filt.filter(self.battlefield, self.event, owner))
+        filt = FriendlyFilter(self.enemy_team[0])
+        self.assertEqual(
+            self.friendly_team, filt.filter(self.friendly_team, self.event, owner)
+        )
@@ -140,3 +140,27 @@ class BattlefieldTargetGeneratorTestCase(TestCase):
             "selector": {"selector": "RANDOM"},
         }
         self.assertEqual(test, target.to_dict())
+
+    def test_unbound_target_generator(self):
+        target = BattlefieldTargetGenerator(
+            None, selector=FirstSelector(), filter_=FriendlyFilter()
+        )
+        self.assertEqual(
+            self.friendly_team[::-1],
+            target.get(self.event, 10, 0, self.friendly_team[0]),
+        )
+        self.assertEqual(
+            self.enemy_team[:2:-1], target.get(self.event, 2, 0, self.enemy_team[3])
+        )
+
+
+def test_from_dict_unbound(friendly_team, enemy_team):
+    test = {
+        "target_generator": "BATTLEFIELD",
+        "filter": {"op": "SINGLE", "filter": "NOT_SELF"},
+        "selector": {"selector": "LAST"},
+    }
+    target = TargetGenerator.from_dict(test)
+    event = Event(EventType.NONE, teams=(friendly_team, enemy_team))
+    assert target.get(event, 1, 0, enemy_team[4]) == [friendly_team[4]]
+    assert target.get(event, 1, 0, friendly_team[4]) == [enemy_team[4]]
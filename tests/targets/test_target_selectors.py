@@ -36,7 +36,7 @@ class TargetSelectorTestCase(TestCase):
     def setUp(self):
         self.friendly_team = [Mock(Pet) for i in range(5)]
         for i, p in enumerate(self.friendly_team):
-            p.health = i + 1
+            p._health = i + 1
         self.enemy_team = [Mock(Pet) for i in range(5)]
 
     def test_validate_args(self):
@@ -109,69 +109,74 @@ class TargetSelectorTestCase(TestCase):
         )
 
     def test_random_selector_tiebreak_select(self):
-        class TestValueSelector(ValueSelector):
-            def select(self):
-                pass
+        values = {}
 
-            def get_type(self):
-                pass
+        class TestValueSelector(ValueSelector):
+            @staticmethod
+            def _value(pet):
+                return values[pet]
 
         sel_high = TestValueSelector(highest=True)
         sel_low = TestValueSelector(highest=False)
 
-        pet_vals = [(p, 5 - i) for i, p in enumerate(self.friendly_team)]
+        pets = self.friendly_team
+        values.update((p, 5 - i) for i, p in enumerate(pets))
         # n less <= 0
         self.assertEqual([], sel_low._tiebreak_select([], num=0, rand=0))
         self.assertEqual([], sel_high._tiebreak_select([], num=0, rand=0))
-        self.assertEqual([], sel_high._tiebreak_select(pet_vals, num=0, rand=0))
+        self.assertEqual([], sel_high._tiebreak_select(pets, num=0, rand=0))
         self.assertEqual([], sel_high._tiebreak_select([], num=-1, rand=0))
 
         # items <= n
         self.assertEqual(
             self.friendly_team,
-            sel_high._tiebreak_select(pet_vals, num=5, rand=0),
+            sel_high._tiebreak_select(pets, num=5, rand=0),
         )
         self.assertEqual(
             self.friendly_team,
-            sel_high._tiebreak_select(pet_vals, num=6, rand=0),
+            sel_high._tiebreak_select(pets, num=6, rand=0),
         )
         self.assertEqual(
             self.friendly_team[::-1],
-            sel_low._tiebreak_select(pet_vals, num=5, rand=0),
+            sel_low._tiebreak_select(pets, num=5, rand=0),
         )
         self.assertEqual(
             self.friendly_team[::-1],
-            sel_low._tiebreak_select(pet_vals, num=6, rand=0),
+            sel_low._tiebreak_select(pets, num=6, rand=0),
         )
 
         # no tiebreak
         self.assertEqual(
             self.friendly_team[:3],
-            sel_high._tiebreak_select(pet_vals, num=3, rand=0),
+            sel_high._tiebreak_select(pets, num=3, rand=0),
         )
         self.assertEqual(
             self.friendly_team[::-1][:3],
-            sel_low._tiebreak_select(pet_vals, num=3, rand=0),
+            sel_low._tiebreak_select(pets, num=3, rand=0),
         )
 
         # tiebreak
-        values = [1, 3, 3, 3, 5]
-        pet_vals = list(zip(self.friendly_team, values))
+        values.update(zip(pets, [1, 3, 3, 3, 5]))
         self.assertEqual(
             [self.friendly_team[4], self.friendly_team[1]],
-            sel_high._tiebreak_select(pet_vals, num=2, rand=0),
+            sel_high._tiebreak_select(pets, num=2, rand=0),
         )
         self.assertEqual(
             [self.friendly_team[4], self.friendly_team[3]],
-            sel_high._tiebreak_select(pet_vals, num=2, rand=2 / 3),
+            sel_high._tiebreak_select(pets, num=2, rand=2 / 3),
         )
         self.assertEqual(
             [self.friendly_team[0], self.friendly_team[1]],
-            sel_low._tiebreak_select(pet_vals, num=2, rand=0),
+            sel_low._tiebreak_select(pets, num=2, rand=0),
         )
         self.assertEqual(
             [self.friendly_team[0], self.friendly_team[3]],
-            sel_low._tiebreak_select(pet_vals, num=2, rand=2 / 3),
+            sel_low._tiebreak_select(pets, num=2, rand=2 / 3),
+        )
+        # tie spanning the whole selection
+        self.assertEqual(
+            [self.friendly_team[4], self.friendly_team[2], self.friendly_team[3]],
+            sel_high._tiebreak_select(pets, num=3, rand=0.99),
         )
 
     def test_highest_health_target_selector(self):
@@ -191,8 +196,8 @@ class TargetSelectorTestCase(TestCase):
         )
 
         # Duplicate health (pets at index 1,2,3 have 2 health)
-        self.friendly_team[2].health = 2
-        self.friendly_team[3].health = 2
+        self.friendly_team[2]._health = 2
+        self.friendly_team[3]._health = 2
         duplicates = self.friendly_team[1:4]
         for i in range(3):
             self.assertEqual(
@@ -212,7 +217,7 @@ class TargetSelectorTestCase(TestCase):
         selector = StrengthSelector()
         selector_low = StrengthSelector(highest=False)
         for i, p in enumerate(self.friendly_team):
-            p.attack = i
+            p._attack = i
 
         self.assertEqual([], selector.select(self.friendly_team, num=0, rand=0))
         self.assertEqual(
@@ -231,7 +236,7 @@ class TargetSelectorTestCase(TestCase):
 
         # Check randomness when attack + health is all equal
         for i, p in enumerate(self.friendly_team):
-            p.health = 4 - i
+            p._health = 4 - i
         self.assertEqual(
             [self.friendly_team[0]],
             selector_low.select(self.friendly_team, num=1, rand=0),
@@ -245,7 +250,7 @@ class TargetSelectorTestCase(TestCase):
         selector = AttackSelector()
         selector_low = AttackSelector(highest=False)
         for i, p in enumerate(self.friendly_team):
-            p.attack = i
+            p._attack = i
 
         self.assertEqual([], selector.select(self.friendly_team, num=0, rand=0))
         self.assertEqual(
@@ -317,3 +322,12 @@ class SelectorFromDictTestCase(TestCase):
             Selector.from_dict({"selector": "ATTACK"})
         with self.assertRaises(ValueError):
             Selector.from_dict({"selector": "ATTACK", "highest": "true"})
+
+
+def test_value_selectors_follow_stat_changes():
+    pets = [Pet(stats=(1, 5)), Pet(stats=(3, 3)), Pet(stats=(2, 4))]
+    pets[0].take_damage(4)
+    pets[2].add_stats(attack=2, temp_stats=True)
+    assert HealthSelector().select(pets, 1, 0) == [pets[2]]
+    assert AttackSelector().select(pets, 1, 0) == [pets[2]]
+    assert StrengthSelector(highest=False).select(pets, 1, 0) == [pets[0]]
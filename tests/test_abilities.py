@@ -0,0 +1,78 @@
+import pytest
+
+from superautosim.abilities import Ability
+from superautosim.actions import AddStatsAction
+from superautosim.events import Event, EventType
+from superautosim.pets import Pet
+from superautosim.teams import Team
+from superautosim.triggers import TypeTrigger
+
+ABILITY_DICT = {
+    "trigger": {"event": "START_OF_BATTLE"},
+    "action": {
+        "action": "ADD_STATS",
+        "target_generator": {
+            "target_generator": "BATTLEFIELD",
+            "filter": {"op": "SINGLE", "filter": "SELF"},
+            "selector": {"selector": "FIRST"},
+        },
+        "max_targets": 1,
+        "attack": 1,
+        "health": 2,
+        "level_multiply": True,
+    },
+}
+
+
+def test_ability_dict_round_trip(pet):
+    ability = Ability.from_dict(ABILITY_DICT, pet)
+    assert isinstance(ability.trigger, TypeTrigger)
+    assert isinstance(ability.action, AddStatsAction)
+    assert ability.to_dict() == ABILITY_DICT
+
+
+@pytest.mark.parametrize(
+    "ability_dict",
+    [
+        None,
+        {},
+        {"trigger": ABILITY_DICT["trigger"]},
+        {"action": ABILITY_DICT["action"]},
+    ],
+)
+def test_ability_from_dict_invalid(pet, ability_dict):
+    with pytest.raises(ValueError):
+        Ability.from_dict(ability_dict, pet)
+
+
+def test_ability_activate():
+    pet = Pet("pet", (1, 1))
+    pet.level = 2
+    ability = Ability.from_dict(ABILITY_DICT, pet)
+    team = Team([pet])
+
+    assert not ability.activate(Event(EventType.HURT, teams=(team,)), pet, 0)
+    assert pet.stats == (1, 1, 0, 0)
+    assert ability.activate(Event(EventType.START_OF_BATTLE, teams=(team,)), pet, 0)
+    assert pet.stats == (3, 5, 0, 0)
+
+
+def test_ability_shared_between_pets():
+    ability_dict = {
+        "trigger": {
+            "event": "HURT",
+            "modifiers": [{"type": "limit", "n": 1, "reset_event": "START_OF_BATTLE"}],
+        },
+        "action": ABILITY_DICT["action"],
+    }
+    ability = Ability.from_dict(ability_dict)
+    pets = [Pet("pet1", (1, 1)), Pet("pet2", (2, 2))]
+    team = Team(pets)
+    event = Event(EventType.HURT, teams=(team,))
+    for pet in pets:
+        pet.ability = ability
+
+    assert ability.activate(event, pets[0], 0)
+    assert not ability.activate(event, pets[0], 0)
+    assert ability.activate(event, pets[1], 0)
+    assert [p.stats for p in pets] == [(2, 3, 0, 0), (3, 4, 0, 0)]
@@ -2,7 +2,16 @@ from unittest.mock import Mock
 
 import pytest
 
-from superautosim.actions import Action, ActionType, AddStatsAction, TargetedAction
+from superautosim.actions import (
+    Action,
+    ActionType,
+    AddStatsAction,
+    DealDamageAction,
+    SummonAction,
+    TargetedAction,
+)
+from superautosim.events import Event, EventType
+from superautosim.pets import Pet
 from superautosim.targets import TargetGenerator
 from superautosim.teams import Team
 
@@ -80,3 +89,147 @@ def test_add_stats_action_max_targets(friendly_team, friendly_targen):
 
         addstats_action.run(1, None, 0)
         assert [p.attack for p in friendly_team] == exp_atks
+
+
+FRIENDLY_RANDOM = {
+    "target_generator": "BATTLEFIELD",
+    "filter": {"op": "SINGLE", "filter": "FRIENDLY"},
+    "selector": {"selector": "RANDOM"},
+}
+
+
+@pytest.mark.parametrize("action", ["ADD_STATS", "ADD_TEMP_STATS"])
+def test_add_stats_action_dict(pet, action):
+    action_dict = {
+        "action": action,
+        "target_generator": FRIENDLY_RANDOM,
+        "max_targets": 2,
+        "attack": 1,
+        "health": 3,
+        "level_multiply": False,
+    }
+    addstats_action = Action.from_dict(action_dict, pet)
+    assert isinstance(addstats_action, AddStatsAction)
+    assert addstats_action._temp_stats is (action == "ADD_TEMP_STATS")
+    assert addstats_action.to_dict() == action_dict
+
+
+@pytest.mark.parametrize(
+    "action_dict",
+    [
+        {},
+        {"action": "INVALID", "target_generator": FRIENDLY_RANDOM},
+        {"action": "ADD_STATS"},
+        {"action": "ADD_STATS", "target_generator": FRIENDLY_RANDOM, "attack": "1"},
+        {"action": "ADD_STATS", "target_generator": FRIENDLY_RANDOM, "max_targets": -1},
+        {"action": "DEAL_DAMAGE", "target_generator": FRIENDLY_RANDOM, "damage": -1},
+        {"action": "SUMMON"},
+        {"action": "SUMMON", "pet": "zombie", "count": 0},
+        {
+            "action": "ADD_STATS",
+            "target_generator": FRIENDLY_RANDOM,
+            "level_multiply": 1,
+        },
+    ],
+)
+def test_action_from_dict_invalid(pet, action_dict):
+    with pytest.raises(ValueError):
+        Action.from_dict(action_dict, pet)
+
+
+class ScheduleRecorder:
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule(self, event_type, pet=None):
+        self.scheduled.append((event_type, pet))
+
+    def add_summon(self, pet, pool):
+        pass
+
+
+def test_deal_damage_action(friendly_team, friendly_targen):
+    scheduler = ScheduleRecorder()
+    event = Event(EventType.NONE, scheduler=scheduler)
+    action = DealDamageAction(friendly_targen, max_targets=3, damage=1)
+
+    action.run(2, event, 0)
+    assert [p.health for p in friendly_team] == [-1, 0, 1, 4, 5]
+    assert scheduler.scheduled == [
+        (EventType.FAINT, friendly_team[0]),
+        (EventType.FAINT, friendly_team[1]),
+        (EventType.HURT, friendly_team[2]),
+    ]
+
+    # Fainted pets take no further damage
+    scheduler.scheduled.clear()
+    action.run(1, event, 0)
+    assert [p.health for p in friendly_team] == [-1, 0, 0, 4, 5]
+    assert scheduler.scheduled == [(EventType.FAINT, friendly_team[2])]
+
+    # Without a scheduler no follow-up events are scheduled
+    action = DealDamageAction(friendly_targen, max_targets=4, damage=1)
+    action.run(1, Event(EventType.NONE), 0)
+    assert [p.health for p in friendly_team] == [-1, 0, 0, 3, 5]
+
+
+def test_deal_damage_action_dict(pet):
+    action_dict = {
+        "action": "DEAL_DAMAGE",
+        "target_generator": FRIENDLY_RANDOM,
+        "max_targets": 1,
+        "damage": 2,
+        "level_multiply": False,
+    }
+    action = Action.from_dict(action_dict, pet)
+    assert isinstance(action, DealDamageAction)
+    assert action.to_dict() == action_dict
+
+
+SUMMON_DICT = {
+    "action": "SUMMON",
+    "pet": "zombie",
+    "attack": 1,
+    "health": 2,
+    "count": 2,
+    "level_multiply": True,
+}
+
+
+def test_summon_action_fainted_owner():
+    owner, behind = Pet(), Pet()
+    team = Team([Pet(), owner, behind, Pet(), Pet()])
+    scheduler = ScheduleRecorder()
+    event = Event(EventType.FAINT, owner, teams=(team,), scheduler=scheduler)
+    action = Action.from_dict(SUMMON_DICT)
+    assert isinstance(action, SummonAction)
+
+    owner.take_damage(owner.health)
+    action.run(2, event, 0, owner)
+    summoned = team[1]
+    assert owner not in team.pets and summoned is not None
+    assert (summoned.name, summoned.attack, summoned.health) == ("zombie", 2, 4)
+    # Only one summon fits once the owner has made space
+    assert team[2] is behind
+    assert scheduler.scheduled == [(EventType.SUMMONED, summoned)]
+    assert len(action.pet_pool) == 1
+
+
+def test_summon_action_in_front_of_owner():
+    owner = Pet()
+    team = Team([Pet(), owner])
+    event = Event(EventType.START_OF_BATTLE, owner, teams=(team,))
+    action = SummonAction.from_dict(SUMMON_DICT, owner)
+
+    action.run(1, event, 0)
+    assert [p.name for p in team.pets] == ["", "zombie", "zombie", ""]
+    assert team[3] is owner
+    assert action.to_dict() == SUMMON_DICT
+
+
+def test_summon_action_without_team():
+    owner = Pet()
+    team = [Pet(), owner]
+    event = Event(EventType.START_OF_BATTLE, owner, teams=(team,))
+    SummonAction.from_dict(SUMMON_DICT, owner).run(1, event, 0)
+    assert team == [team[0], owner]
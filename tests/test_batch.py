@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from superautosim import batch
+from superautosim.abilities import Ability
+from superautosim.backends import BACKENDS, get_backend
+from superautosim.battle import Battle
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+
+def random_team(rng: random.Random, ability_dict=None) -> Team:
+    pets = []
+    for _ in range(rng.randint(0, Team.MAX_TEAM_SIZE)):
+        if rng.random() < 0.2:
+            pets.append(None)
+            continue
+        pet = Pet(stats=(rng.randint(1, 10), rng.randint(1, 10)))
+        if ability_dict is not None and rng.random() < 0.5:
+            pet.ability = Ability.from_dict(ability_dict)
+        pets.append(pet)
+    return Team(pets)
+
+
+def scalar_results(matchups, seed, max_turns=None):
+    return [Battle(a, b, seed, i, max_turns).run() for i, (a, b) in enumerate(matchups)]
+
+
+@pytest.mark.parametrize("abilities", [False, True])
+def test_run_batch_matches_scalar(abilities, mosquito):
+    rng = random.Random(0)
+    ability_dict = mosquito if abilities else None
+    matchups = [(random_team(rng, ability_dict), random_team(rng)) for _ in range(200)]
+    assert batch.run_batch(matchups, seed=5) == scalar_results(matchups, 5)
+
+
+def test_run_batch_max_turns():
+    rng = random.Random(1)
+    matchups = [(random_team(rng), random_team(rng)) for _ in range(50)]
+    assert batch.run_batch(matchups, max_turns=1) == scalar_results(matchups, 0, 1)
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_run_batch_backends(backend, mosquito):
+    rng = random.Random(2)
+    matchups = [(random_team(rng, mosquito), random_team(rng)) for _ in range(100)]
+    results = batch.run_batch(matchups, backend=get_backend(backend))
+    assert results == scalar_results(matchups, 0)
+
+
+def test_is_stat_only(mosquito):
+    pet = Pet()
+    assert batch.is_stat_only(Team([pet, None]))
+    pet.ability = Ability.from_dict(mosquito)
+    assert not batch.is_stat_only(Team([pet, None]))
@@ -0,0 +1,79 @@
+import pytest
+
+from superautosim.battle import Battle, BattleResult
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+CRICKET = {
+    "trigger": {"event": "FAINT", "modifiers": [{"type": "self"}]},
+    "action": {"action": "SUMMON", "pet": "zombie cricket"},
+}
+
+
+@pytest.mark.parametrize(
+    ["team_a", "team_b", "result", "turns"],
+    [
+        ([(2, 3)], [(1, 1), (1, 1)], BattleResult.WIN, 2),
+        ([(1, 1), (1, 1)], [(2, 3)], BattleResult.LOSS, 2),
+        ([(2, 2)], [(2, 2)], BattleResult.DRAW, 1),
+        ([], [], BattleResult.DRAW, 0),
+        ([(1, 1)], [], BattleResult.WIN, 0),
+    ],
+)
+def test_battle_stat_only(team_a, team_b, result, turns):
+    team_a = Team([Pet(stats=stats) for stats in team_a])
+    team_b = Team([Pet(stats=stats) for stats in team_b])
+    battle = Battle(team_a, team_b)
+    assert battle.run() == result
+    assert battle.turns == turns
+
+
+def test_battle_copies_teams():
+    pet = Pet(stats=(1, 5))
+    team = Team([pet])
+    battle = Battle(team, Team([Pet(stats=(3, 1))]))
+    assert battle.run() == BattleResult.WIN
+    assert pet.stats == (1, 5, 0, 0)
+    assert battle.teams[0][0] is not pet and battle.teams[0][0].health == 2
+
+
+def test_battle_max_turns():
+    battle = Battle(Team([Pet(stats=(0, 5))]), Team([Pet(stats=(0, 5))]), max_turns=10)
+    assert battle.run() == BattleResult.DRAW
+    assert battle.turns == 10
+
+
+def test_battle_start_of_battle_ability(make_pet, mosquito):
+    team_a = Team([make_pet((1, 1), mosquito)])
+    battle = Battle(team_a, Team([Pet(stats=(5, 1))]))
+    assert battle.run() == BattleResult.WIN
+    assert battle.turns == 0
+
+
+def test_battle_faint_summon_ability(make_pet):
+    team_a = Team([make_pet((1, 1), CRICKET)])
+    battle = Battle(team_a, Team([Pet(stats=(1, 1))]))
+    assert battle.run() == BattleResult.WIN
+    assert [pet.name for pet in battle.teams[0].pets] == ["zombie cricket"]
+
+
+def test_battle_releases_fainted_summons(make_pet):
+    team_a = Team([make_pet((1, 1), CRICKET)])
+    team_b = Team([Pet(stats=(1, 1)), Pet(stats=(1, 1))])
+    pool = team_a[0].ability._action.pet_pool
+    for _ in range(3):
+        assert Battle(team_a, team_b).run() == BattleResult.DRAW
+        # The zombie cricket fainted, so each battle reuses the same pet
+        assert len(pool) == 1
+
+
+def test_battle_deterministic(make_pet, mosquito):
+    def run(seed, battle_id):
+        team_a = Team([make_pet((1, 1), mosquito) for _ in range(3)])
+        team_b = Team([Pet(stats=(1, i)) for i in range(1, 6)])
+        battle = Battle(team_a, team_b, seed, battle_id)
+        battle.run()
+        return [pet.stats for pet in battle.teams[1].pets], battle.rand.counter
+
+    assert run(1, 2) == run(1, 2)
+    assert run(1, 2)[1] == 3
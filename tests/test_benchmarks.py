@@ -0,0 +1,32 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.suite import BENCHMARKS, compare, run
+
+
+def test_compare():
+    baseline = {"fast": 1.0, "slow": 1.0, "removed": 1.0}
+    results = {"fast": 1.05, "slow": 1.2, "new": 5.0}
+    regressions = compare(results, baseline, threshold=10)
+    assert len(regressions) == 1 and regressions[0].startswith("slow:")
+    assert compare(results, baseline, threshold=25) == []
+
+
+def test_run_every_benchmark():
+    results = run(repeat=1, min_time=0)
+    assert results.keys() == BENCHMARKS.keys()
+    assert all(seconds > 0 for seconds in results.values())
+
+
+def test_main_regression(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["selectors.first", "--repeat", "1", "--min-time", "0"]
+    assert main([*args, "--output", str(output)]) == 0
+    document = json.loads(output.read_text())
+    assert list(document["results"]) == ["selectors.first"]
+
+    document["results"]["selectors.first"] /= 1000
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(document))
+    assert main([*args, "--output", str(output), "--baseline", str(baseline)]) == 1
+    assert main([*args, "--baseline", str(baseline), "--threshold", "1e9"]) == 0
@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from superautosim.comparison import Comparison, compare
+from superautosim.montecarlo import simulate
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+
+def test_compare_identical_teams(mosquito_team, opponents):
+    comparison = compare(mosquito_team(), mosquito_team(), opponents, 50)
+    assert comparison == Comparison(100, 0.0, 0.0)
+    assert comparison.std_error == 0.0
+    assert not comparison.significant()
+
+
+def test_compare_matches_independent_means(mosquito_team, opponents):
+    team_a, team_b = mosquito_team(), mosquito_team(2, 1)
+    comparison = compare(team_a, team_b, opponents, 100, seed=7)
+    expected = sum(
+        simulate(team_a, opponent, 100, 7).score
+        - simulate(team_b, opponent, 100, 7).score
+        for opponent in opponents
+    ) / len(opponents)
+    assert comparison.samples == 200
+    assert comparison.mean == pytest.approx(expected)
+    assert comparison.variance > 0
+
+
+def test_compare_antithetic(mosquito_team, opponents):
+    team_a, team_b = mosquito_team(), mosquito_team(2, 1)
+    plain = compare(team_a, team_b, opponents, 100, seed=7)
+    antithetic = compare(team_a, team_b, opponents, 100, seed=7, antithetic=True)
+    assert antithetic.samples == plain.samples
+    assert antithetic.variance <= plain.variance
+
+
+def test_compare_stat_only():
+    team_a, team_b = Team([Pet(stats=(5, 5))]), Team([Pet(stats=(1, 1))])
+    comparison = compare(team_a, team_b, [Team([Pet(stats=(2, 2))])], 10)
+    assert comparison == Comparison(10, 1.0, 0.0)
+    assert comparison.significant()
+
+
+def test_comparison_std_error():
+    assert Comparison(4, 0.5, 1.0).std_error == 0.5
+    assert Comparison(1, 0.5, 1.0).std_error == math.inf
+    assert Comparison(0, 0.0, 0.0).std_error == 0.0
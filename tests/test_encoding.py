@@ -0,0 +1,82 @@
+import marshal
+
+import pytest
+
+from superautosim.abilities import Ability
+from superautosim.encoding import (
+    ENCODING_VERSION,
+    decode_team,
+    encode_team,
+    team_digest,
+    team_hash,
+)
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+
+@pytest.fixture
+def make_team(mosquito):
+    def make_team():
+        pet = Pet("mosquito", (2, 2, 1, 0))
+        pet.ability = Ability.from_dict(mosquito)
+        pet.level = 2
+        return Team([Pet("ant", (2, 1)), None, pet])
+
+    return make_team
+
+
+def test_encode_decode_round_trip(make_team):
+    team = make_team()
+    decoded = decode_team(encode_team(team))
+    assert [p and (p.name, p.stats, p.level) for p in decoded] == [
+        p and (p.name, p.stats, p.level) for p in team
+    ]
+    assert decoded[2].ability.to_dict() == team[2].ability.to_dict()
+    assert encode_team(decoded) == encode_team(team)
+
+
+def test_decoded_abilities_shared(make_team):
+    first, second = decode_team(encode_team(make_team())), decode_team(
+        encode_team(make_team())
+    )
+    assert first[2].ability is second[2].ability
+
+
+def test_team_hash(make_team):
+    assert team_hash(make_team()) == team_hash(make_team())
+    other = make_team()
+    other[0].add_stats(1)
+    assert team_hash(other) != team_hash(make_team())
+    assert team_hash(Team([Pet(), None])) != team_hash(Team([None, Pet()]))
+
+
+def test_team_hash_stable():
+    # Stored hashes must survive Python upgrades, so the digest is pinned
+    assert team_hash(Team([Pet("ant", (2, 1)), None])) == (
+        "76fb134a41385835752aeae263166e62835684cf5bc786ec1332fca761be2d75"
+    )
+
+
+def test_team_hash_independent_of_identity():
+    name = "".join(["ant", "1"])
+    shared = Team([Pet(name, (1, 2)), Pet(name, (1, 2))])
+    separate = Team([Pet(name, (1, 2)), Pet("".join(["ant", "1"]), (1, 2))])
+    assert encode_team(shared) == encode_team(separate)
+    assert team_digest(shared) == team_digest(separate)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not a team",
+        encode_team(Team())[:-1],
+        marshal.dumps((ENCODING_VERSION, [None]), 2),
+        marshal.dumps((ENCODING_VERSION, (None,) * 6), 2),
+        marshal.dumps((ENCODING_VERSION, (("ant", 1, 1, 0, (1, 1), ""),)), 2),
+        marshal.dumps((ENCODING_VERSION, ((b"ant", 1, 1, 0, (1, 1, 0, 0), ""),)), 2),
+    ],
+)
+def test_decode_team_invalid(data):
+    with pytest.raises(ValueError):
+        decode_team(data)
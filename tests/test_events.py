@@ -1,9 +1,10 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
-from superautosim.events import Event, EventType
+from superautosim.events import Event, EventPool, EventType
 from superautosim.pets import Pet
 from superautosim.teams import Team
+from superautosim.tracing import TraceRecorder
 
 
 class EventTestCase(TestCase):
@@ -76,3 +77,46 @@ class EventTestCase(TestCase):
         friendly, enemy = event2.get_ordered_teams(self.enemy_team[0])
         self.assertEqual(enemy, self.friendly_team)
         self.assertEqual(friendly, self.enemy_team)
+
+
+class EventPoolTestCase(TestCase):
+    def setUp(self):
+        self.team = Team([Mock(Pet) for i in range(5)])
+        self.pool = EventPool()
+
+    def test_event_slots(self):
+        event = Event(EventType.NONE)
+        self.assertFalse(hasattr(event, "__dict__"))
+        with self.assertRaises(AttributeError):
+            event.other = 1
+
+    def test_acquire(self):
+        pet = self.team[0]
+        event = self.pool.acquire(EventType.HURT, pet, True, (self.team,))
+        self.assertIsInstance(event, Event)
+        self.assertEqual(Event(EventType.HURT, pet, True, (self.team,)), event)
+        self.assertEqual({}, event._filter_memo)
+
+    def test_acquire_skips_validation(self):
+        teams = (self.team, self.team, self.team)
+        self.assertEqual(teams, self.pool.acquire(EventType.NONE, teams=teams).teams)
+
+    def test_release_reuses_events(self):
+        trace = TraceRecorder()
+        event = self.pool.acquire(
+            EventType.HURT, self.team[0], True, (self.team,), trace=trace
+        )
+        self.assertIs(trace, event.trace)
+        event._filter_memo["key"] = ("value",)
+        self.pool.release(event)
+        self.assertEqual(1, len(self.pool))
+        self.assertIsNone(event.pet)
+        self.assertIsNone(event.trace)
+        self.assertEqual((), event.teams)
+        self.assertEqual({}, event._filter_memo)
+
+        reused = self.pool.acquire(EventType.FAINT, self.team[1])
+        self.assertIs(event, reused)
+        self.assertEqual(0, len(self.pool))
+        self.assertEqual(Event(EventType.FAINT, self.team[1]), reused)
+        self.assertIsNot(event, self.pool.acquire(EventType.FAINT))
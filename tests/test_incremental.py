@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from superautosim.abilities import Ability
+from superautosim.incremental import IncrementalEvaluator
+from superautosim.pets import Pet
+from superautosim.search import FitnessEvaluator
+from superautosim.teams import Team
+
+
+def random_pet(rng: random.Random, ability_dict=None):
+    pet = Pet(stats=(rng.randint(1, 6), rng.randint(1, 6)))
+    if ability_dict is not None and rng.random() < 0.3:
+        pet.ability = Ability.from_dict(ability_dict)
+    return pet
+
+
+@pytest.mark.parametrize("abilities", [False, True])
+def test_incremental_matches_full_evaluation(abilities, mosquito):
+    rng = random.Random(4)
+    ability_dict = mosquito if abilities else None
+    opponents = [
+        Team([random_pet(rng, ability_dict) for _ in range(rng.randint(1, 5))])
+        for _ in range(3)
+    ]
+    incremental = IncrementalEvaluator(opponents, battles=8, seed=2)
+    full = FitnessEvaluator(opponents, battles=8, seed=2, max_workers=0)
+
+    pets = [random_pet(rng, ability_dict) for _ in range(Team.MAX_TEAM_SIZE)]
+    for _ in range(40):
+        # Change one slot of the previous team
+        slot = rng.randrange(Team.MAX_TEAM_SIZE)
+        pets[slot] = None if rng.random() < 0.2 else random_pet(rng, ability_dict)
+        team = Team(list(pets))
+        assert incremental.evaluate([team]) == full.evaluate([team])
+    assert incremental.reused > 0
+
+
+def test_incremental_reuses_unreached_slots():
+    opponent = Team([Pet(stats=(1, 1))])
+    evaluator = IncrementalEvaluator([opponent], battles=4)
+    parent = Team([Pet(stats=(5, 5)), Pet(stats=(1, 1))])
+    assert evaluator.evaluate([parent]) == [1.0]
+    assert (evaluator.simulated, evaluator.reused) == (1, 0)
+
+    # The back pet never fights, so its change needs no battles
+    child = Team([Pet(stats=(5, 5)), Pet(stats=(9, 9))])
+    assert evaluator.evaluate([child]) == [1.0]
+    assert (evaluator.simulated, evaluator.reused) == (1, 1)
+
+    # The front pet fights, so its change is simulated
+    child = Team([Pet(stats=(1, 1)), Pet(stats=(1, 1))])
+    assert evaluator.evaluate([child]) == [1.0]
+    assert evaluator.simulated == 2
+
+    # Removing the only survivor of a won battle changes the result
+    assert evaluator.evaluate([Team([Pet(stats=(1, 1))])]) == [0.5]
+    assert evaluator.simulated == 3
+
+    # Evaluated teams are cached
+    assert evaluator.evaluate([parent]) == [1.0]
+    assert evaluator.simulated == 3 and len(evaluator) == 4
+
+
+def test_incremental_new_ability_resimulates(make_pet, mosquito):
+    opponent = Team([Pet(stats=(1, 1)), Pet(stats=(1, 1))])
+    evaluator = IncrementalEvaluator([opponent], battles=2)
+    evaluator.evaluate([Team([Pet(stats=(5, 5)), Pet(stats=(1, 1))])])
+    evaluator.evaluate([Team([Pet(stats=(5, 5)), make_pet((1, 1), mosquito)])])
+    assert evaluator.reused == 0 and evaluator.simulated == 3
+
+
+def test_incremental_max_records():
+    evaluator = IncrementalEvaluator([Team([Pet()])], battles=1, max_records=2)
+    for attack in range(1, 5):
+        evaluator.evaluate([Team([Pet(stats=(attack, 1))])])
+    assert len(evaluator) == 2
+    assert len(evaluator._masked) <= 2 * Team.MAX_TEAM_SIZE
@@ -0,0 +1,152 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from superautosim.abilities import Ability
+from superautosim.library import Library, PetDefinition, tomllib
+
+SELF_BUFF = {
+    "trigger": {"event": "START_OF_BATTLE"},
+    "action": {
+        "action": "ADD_STATS",
+        "target_generator": {
+            "target_generator": "BATTLEFIELD",
+            "filter": {"op": "SINGLE", "filter": "SELF"},
+            "selector": {"selector": "FIRST"},
+        },
+        "attack": 1,
+    },
+}
+
+LIBRARY = {
+    "pets": [
+        {"name": "ant", "tier": 1, "attack": 2, "health": 1, "ability": SELF_BUFF},
+        {"name": "beaver", "tier": 1, "attack": 3, "health": 2, "ability": SELF_BUFF},
+        {"name": "fish", "tier": 2, "attack": 2, "health": 3},
+    ]
+}
+
+LIBRARY_TOML = """
+[[pets]]
+name = "ant"
+tier = 1
+attack = 2
+health = 1
+
+[pets.ability.trigger]
+event = "START_OF_BATTLE"
+
+[pets.ability.action]
+action = "ADD_STATS"
+attack = 1
+
+[pets.ability.action.target_generator]
+target_generator = "BATTLEFIELD"
+filter = { op = "SINGLE", filter = "SELF" }
+selector = { selector = "FIRST" }
+
+[[pets]]
+name = "fish"
+tier = 2
+attack = 2
+health = 3
+"""
+
+
+@pytest.fixture
+def library_path(tmp_path):
+    path = tmp_path / "pets.json"
+    path.write_text(json.dumps(LIBRARY))
+    return path
+
+
+def test_definition_canonical_ability():
+    definition = PetDefinition.from_dict(LIBRARY["pets"][0])
+    assert definition.ability["action"]["max_targets"] == 1
+    assert definition.ability["action"]["level_multiply"] is True
+    assert definition.to_dict()["ability"] == definition.ability
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"name": ""},
+        {"tier": 0},
+        {"tier": 7},
+        {"attack": 0},
+        {"health": "1"},
+        {"ability": {"trigger": {"event": "INVALID"}, "action": SELF_BUFF["action"]}},
+    ],
+)
+def test_definition_invalid(changes):
+    with pytest.raises(ValueError):
+        PetDefinition.from_dict({**LIBRARY["pets"][0], **changes})
+
+
+def test_library_from_dict():
+    library = Library.from_dict(LIBRARY)
+    assert len(library) == 3 and "ant" in library and "cat" not in library
+    assert [d.name for d in library] == ["ant", "beaver", "fish"]
+    # Identical abilities are interned
+    assert library["ant"].ability is library["beaver"].ability
+    assert Library.from_dict(library.to_dict()).to_dict() == library.to_dict()
+
+    with pytest.raises(ValueError):
+        Library.from_dict({"pets": LIBRARY["pets"] * 2})
+    with pytest.raises(ValueError):
+        Library.from_dict({})
+
+
+def test_library_create_pet():
+    library = Library.from_dict(LIBRARY)
+    ant = library.create_pet("ant")
+    assert (ant.name, ant.tier, ant.stats) == ("ant", 1, (2, 1, 0, 0))
+    assert isinstance(ant.ability, Ability)
+    assert ant.ability.to_dict() == library["ant"].ability
+    # Pets with the same definition share the ability prototype
+    assert library.create_pet("ant").ability is ant.ability
+    assert library.create_pet("beaver").ability is ant.ability
+    assert library.create_pet("fish").ability is None
+    with pytest.raises(KeyError):
+        library.create_pet("cat")
+
+
+def test_library_load_cache(library_path):
+    library = Library.load(library_path)
+    cache_path = library_path.with_name("pets.json.cache")
+    assert cache_path.exists()
+
+    # Cached load skips parsing and validation
+    with patch.object(PetDefinition, "from_dict") as from_dict:
+        cached = Library.load(library_path)
+    from_dict.assert_not_called()
+    assert cached.to_dict() == library.to_dict()
+    assert cached["ant"].ability is cached["beaver"].ability
+
+    # Changing the library invalidates the cache
+    library_path.write_text(json.dumps({"pets": LIBRARY["pets"][2:]}))
+    assert len(Library.load(library_path)) == 1
+
+
+def test_library_load_corrupt_cache(library_path, tmp_path):
+    cache_path = tmp_path / "library.cache"
+    Library.load(library_path, cache_path)
+    cache_path.write_bytes(cache_path.read_bytes()[:40])
+    assert len(Library.load(library_path, cache_path)) == 3
+
+
+def test_library_load_invalid(tmp_path):
+    path = tmp_path / "pets.json"
+    path.write_text(json.dumps({"pets": [{"name": "ant"}]}))
+    with pytest.raises(ValueError):
+        Library.load(path)
+
+
+@pytest.mark.skipif(tomllib is None, reason="TOML support not available")
+def test_library_load_toml(tmp_path):
+    path = tmp_path / "pets.toml"
+    path.write_text(LIBRARY_TOML)
+    library = Library.load(path)
+    assert library["ant"] == Library.from_dict(LIBRARY)["ant"]
+    assert library["fish"].ability is None
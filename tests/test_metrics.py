@@ -0,0 +1,103 @@
+import json
+import subprocess
+import sys
+from time import perf_counter
+
+from superautosim import metrics
+from superautosim.abilities import Ability
+from superautosim.battle import Battle
+from superautosim.events import Event, EventType
+from superautosim.pets import Pet
+from superautosim.targets.filters import Filter
+from superautosim.targets.selectors import FirstSelector, LastSelector
+from superautosim.teams import Team
+from superautosim.triggers import TypeTrigger
+
+
+def run_battle(ability_dict):
+    pet = Pet(stats=(1, 2))
+    pet.ability = Ability.from_dict(ability_dict)
+    team_a = Team([pet])
+    team_b = Team([Pet(stats=(1, 3)), Pet(stats=(2, 2))])
+    Battle(team_a, team_b).run()
+
+
+def test_instrument(mosquito):
+    original = TypeTrigger.is_triggered
+    with metrics.instrument() as recorded:
+        assert metrics.enabled() and TypeTrigger.is_triggered is not original
+        run_battle(mosquito)
+    assert not metrics.enabled() and TypeTrigger.is_triggered is original
+
+    breakdown = recorded.breakdown()
+    assert breakdown["Trigger"].calls > 0
+    for subsystem in ("Filter", "Selector", "TargetGenerator", "Action"):
+        assert breakdown[subsystem].calls == 1
+    assert breakdown["Team"].calls == 2
+    assert recorded.counters["Action", "DealDamageAction"].seconds > 0
+    assert "DealDamageAction" in recorded.format()
+
+    run_battle(mosquito)
+    assert recorded.breakdown() == breakdown
+    recorded.reset()
+    assert recorded.counters == {}
+
+
+def test_super_calls_counted_once():
+    with metrics.instrument() as recorded:
+        LastSelector().select([Pet(), Pet()], 1, 0)
+        FirstSelector().select([Pet()], 1, 0)
+    calls = {key: counter.calls for key, counter in recorded.counters.items()}
+    assert calls == {
+        ("Selector", "LastSelector"): 1,
+        ("Selector", "FirstSelector"): 1,
+    }
+
+
+def test_nested_calls_counted_once():
+    filter_ = Filter.from_dict(
+        {
+            "op": "ALL",
+            "filters": [
+                {"op": "ANY", "filters": [{"op": "SINGLE", "filter": "ENEMY"}]},
+                {"op": "SINGLE", "filter": "NOT_SELF"},
+            ],
+        }
+    )
+    team_a, team_b = Team([Pet(), Pet()]), Team([Pet()])
+    event = Event(EventType.NONE, teams=(team_a, team_b))
+    with metrics.instrument() as recorded:
+        start = perf_counter()
+        filter_.filter([*team_a, *team_b], event, team_a[0])
+        elapsed = perf_counter() - start
+    calls = {key: counter.calls for key, counter in recorded.counters.items()}
+    assert calls == {("Filter", "AllFilter"): 1}
+    assert recorded.breakdown()["Filter"].seconds <= elapsed
+
+
+def test_nested_instrument(mosquito):
+    with metrics.instrument() as outer:
+        with metrics.instrument() as inner:
+            run_battle(mosquito)
+        assert metrics.enabled()
+        run_battle(mosquito)
+    assert not metrics.enabled()
+    assert inner.breakdown()["Action"].calls == 1
+    assert outer.breakdown()["Action"].calls == 1
+
+
+def test_environment_variable(mosquito):
+    code = (
+        "import json, sys; "
+        "from superautosim import metrics; "
+        "from tests.test_metrics import run_battle; "
+        "assert metrics.enabled(); run_battle(json.loads(sys.argv[1]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(mosquito)],
+        env={metrics.ENV_VAR: "1", "PYTHONPATH": "."},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "DealDamageAction" in result.stderr
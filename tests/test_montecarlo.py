@@ -0,0 +1,76 @@
+from superautosim.battle import BattleResult
+from superautosim.encoding import encode_team, team_digest
+from superautosim.montecarlo import (
+    ResultRecord,
+    Tally,
+    iter_simulate,
+    simulate,
+    simulate_encoded,
+    simulate_encoded_batch,
+)
+from superautosim.pets import Pet
+from superautosim.teams import Team
+
+
+def test_tally():
+    tally = Tally.from_results(
+        [BattleResult.WIN, BattleResult.WIN, BattleResult.DRAW, BattleResult.LOSS]
+    )
+    assert (tally.wins, tally.draws, tally.losses) == (2, 1, 1)
+    assert tally.total == 4 and tally.score == 0.625
+    assert tally.mirrored() == Tally(1, 1, 2)
+    assert tally + Tally(1, 0, 0) == Tally(3, 1, 1)
+    assert Tally().score == 0.0
+    assert Tally.repeated(BattleResult.LOSS, 10**12) == Tally(losses=10**12)
+    assert Tally.repeated(BattleResult.DRAW, 2) == Tally(draws=2)
+
+
+def test_simulate_stat_only():
+    team_a = Team([Pet(stats=(3, 3))])
+    team_b = Team([Pet(stats=(1, 1)), Pet(stats=(1, 1))])
+    assert simulate(team_a, team_b, 10) == Tally(wins=10)
+    assert simulate(team_b, team_a, 0) == Tally()
+
+
+def test_simulate_random(make_pet, mosquito):
+    team_a = Team([make_pet((1, 2), mosquito)])
+    team_b = Team([Pet(stats=(1, 1)), Pet(stats=(2, 1))])
+    tally = simulate(team_a, team_b, 200, seed=1)
+    # The mosquito wins when it snipes the back pet, otherwise it draws
+    assert 60 < tally.wins < 140 and tally.wins + tally.draws == 200
+    assert simulate(team_a, team_b, 200, seed=1) == tally
+
+
+def test_simulate_encoded_batch(make_pet, mosquito):
+    teams = [
+        Team([make_pet((1, 2), mosquito)]),
+        Team([Pet(stats=(1, 1)), Pet(stats=(2, 1))]),
+        Team([Pet(stats=(3, 4))]),
+    ]
+    requests = [
+        (encode_team(team_a), encode_team(team_b), battles, seed)
+        for team_a, team_b, battles, seed in [
+            (teams[0], teams[1], 50, 1),
+            (teams[2], teams[1], 4, 0),
+            (teams[1], teams[2], 4, 9),
+            (teams[1], teams[2], 0, 0),
+        ]
+    ]
+    requests.insert(2, (b"invalid", encode_team(Team()), 1, 0))
+    results = simulate_encoded_batch(requests)
+    assert results[0] == simulate_encoded(*requests[0])
+    assert results[1] == Tally(wins=4)
+    assert isinstance(results[2], ValueError)
+    assert results[3] == Tally(losses=4)
+    assert results[4] == Tally()
+
+
+def test_iter_simulate():
+    team_a = Team([Pet(stats=(3, 3))])
+    team_b = Team([Pet(stats=(1, 1))])
+    records = iter_simulate(iter([(team_a, team_b), (team_b, team_a)]), 5, seed=2)
+    assert next(records) == ResultRecord(
+        team_digest(team_a), team_digest(team_b), 2, 5, 0, 0
+    )
+    assert next(records).tally == Tally(losses=5)
+    assert next(records, None) is None
@@ -1,6 +1,6 @@
 import pytest
 
-from superautosim.pets import Pet
+from superautosim.pets import Pet, PetPool
 
 
 @pytest.mark.parametrize(
@@ -109,3 +109,47 @@ def test_pet_add_stats_max_temp_to_perm(pet, stats, is_temp, exp_stats):
 
     assert pet._perm_attack == exp_stats[0] and pet._perm_health == exp_stats[1]
     assert pet._temp_attack == exp_stats[2] and pet._temp_health == exp_stats[3]
+
+
+def test_pet_total_stats_kept_current():
+    """attack / health attributes always equal the sum of perm and temp stats"""
+    pet = Pet(stats=(3, 4, 1, 2))
+    assert (pet.attack, pet.health) == (4, 6)
+    for stats, temp in [((5, -2), False), ((-10, 3), True), ((60, 60), False)]:
+        pet.add_stats(*stats, temp)
+        assert pet.attack == pet._perm_attack + pet._temp_attack
+        assert pet.health == pet._perm_health + pet._temp_health
+
+
+def test_pet_total_stats_read_only(pet):
+    with pytest.raises(AttributeError):
+        pet.attack = 10
+    with pytest.raises(AttributeError):
+        pet.health = 10
+    assert (pet.attack, pet.health) == (1, 1)
+
+
+def test_pet_take_damage():
+    pet = Pet(stats=(2, 3, 0, 1))
+    assert pet.take_damage(2) == 2
+    assert pet.stats == (2, 3, 0, -1) and pet.health == 2
+    assert not pet.fainted
+    assert pet.take_damage(-5) == 0
+    pet.take_damage(4)
+    assert pet.health == -2 and pet.fainted
+
+
+def test_pet_pool():
+    prototype = Pet("zombie", (2, 3))
+    pool = PetPool(prototype)
+    pet = pool.acquire()
+    assert pet is not prototype
+    assert (pet.name, pet.stats) == ("zombie", (2, 3, 0, 0))
+
+    pet.add_stats(1, 1)
+    pet.ability_counters["trigger"] = 1
+    pool.release(pet)
+    assert len(pool) == 1
+    reused = pool.acquire()
+    assert reused is pet and len(pool) == 0
+    assert reused.stats == (2, 3, 0, 0) and reused.ability_counters == {}
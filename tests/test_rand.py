@@ -0,0 +1,37 @@
+from superautosim.rand import PrefetchedStream, RandStream, splitmix64, uniform
+
+
+def test_splitmix64_known_values():
+    assert splitmix64(0) == 0xE220A8397B1DCDAF
+    assert 0 <= splitmix64(2**64 - 1) < 2**64
+
+
+def test_rand_stream_counter_based():
+    stream = RandStream(seed=3, stream=7)
+    values = [stream() for _ in range(100)]
+    assert stream.counter == 100
+    assert all(0 <= value < 1 for value in values)
+    assert len(set(values)) == 100
+    assert values[42] == uniform(3, 7, 42)
+    assert RandStream(3, 7, counter=42)() == values[42]
+
+
+def test_rand_streams_independent():
+    assert uniform(0, 0, 0) != uniform(0, 1, 0)
+    assert uniform(0, 0, 0) != uniform(1, 0, 0)
+
+
+def test_rand_stream_antithetic():
+    stream = RandStream(5, 1)
+    mirrored = RandStream(5, 1, antithetic=True)
+    for _ in range(50):
+        value, mirror = stream(), mirrored()
+        assert 0 <= mirror < 1
+        assert value + mirror == 1 - 2**-53
+
+
+def test_prefetched_stream():
+    stream = PrefetchedStream(3, 7, [uniform(3, 7, n) for n in range(4)])
+    reference = RandStream(3, 7)
+    assert [stream() for _ in range(10)] == [reference() for _ in range(10)]
+    assert stream.counter == 10
@@ -0,0 +1,32 @@
+import pytest
+
+from superautosim.batch import run_batch
+from superautosim.encoding import encode_team
+from superautosim.pets import Pet
+from superautosim.replay import replay
+from superautosim.teams import Team
+from superautosim.tracing import TraceKind
+
+
+def test_replay_matches_batch(make_pet, mosquito):
+    team_a = Team([make_pet((1, 2), mosquito), Pet(stats=(2, 2))])
+    team_b = Team([Pet(stats=(1, 1)), Pet(stats=(2, 3))])
+    results = run_batch([(team_a, team_b)] * 20, seed=7, first_battle_id=100)
+    encoded_a, encoded_b = encode_team(team_a), encode_team(team_b)
+    for i, result in enumerate(results):
+        battle = replay(7, 100 + i, encoded_a, encoded_b)
+        assert battle.result == result
+        assert battle.trace.dropped == 0
+        assert battle.trace.decode()[0].kind is TraceKind.EVENT
+
+
+def test_replay_is_deterministic(make_pet, mosquito):
+    encoded_a = encode_team(Team([make_pet((1, 2), mosquito)]))
+    encoded_b = encode_team(Team([Pet(stats=(1, 1)), Pet(stats=(1, 1))]))
+    traces = {replay(3, 5, encoded_a, encoded_b).trace.format() for _ in range(3)}
+    assert len(traces) == 1
+
+
+def test_replay_invalid_team():
+    with pytest.raises(ValueError):
+        replay(0, 0, b"invalid", encode_team(Team()))
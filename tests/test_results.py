@@ -0,0 +1,99 @@
+import pytest
+
+from superautosim.montecarlo import ResultRecord, Tally, iter_simulate
+from superautosim.pets import Pet
+from superautosim.results import (
+    HEADER,
+    RECORD,
+    ResultReader,
+    ResultWriter,
+    write_results,
+)
+from superautosim.teams import Team
+
+A, B, C = b"a" * 32, b"b" * 32, b"c" * 32
+RECORDS = [
+    ResultRecord(A, B, 1, 3, 1, 0),
+    ResultRecord(B, C, 1, 0, 0, 4),
+    ResultRecord(A, A, -2, 1, 2, 1),
+]
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_round_trip(tmp_path, use_mmap):
+    path = tmp_path / "results.bin"
+    assert write_results(path, iter(RECORDS), chunk_records=2) == 3
+    assert path.stat().st_size == HEADER.size + 3 * RECORD.size
+    with ResultReader(path, use_mmap) as reader:
+        assert len(reader) == 3
+        assert list(reader) == RECORDS
+        assert list(reader.iter_chunks(1)) == RECORDS
+        assert reader[1] == RECORDS[1] and reader[-1] == RECORDS[2]
+        with pytest.raises(IndexError):
+            reader[3]
+
+
+def test_writer_chunks(tmp_path):
+    path = tmp_path / "results.bin"
+    with ResultWriter(path, chunk_records=2) as writer:
+        writer.write(RECORDS[0])
+        assert path.stat().st_size == HEADER.size
+        writer.write(RECORDS[1])
+        assert path.stat().st_size == HEADER.size + 2 * RECORD.size
+        writer.write(RECORDS[2])
+    assert writer.records == 3
+    assert path.stat().st_size == HEADER.size + 3 * RECORD.size
+
+
+@pytest.mark.parametrize(
+    "record",
+    [ResultRecord(A, B, 1 << 63, 0, 0, 0), ResultRecord(A, B, 0, -1, 0, 0)],
+)
+def test_writer_out_of_range(tmp_path, record):
+    with ResultWriter(tmp_path / "results.bin") as writer:
+        with pytest.raises(ValueError, match="out of range"):
+            writer.write(record)
+        assert writer.records == 0
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "results.bin"
+    write_results(path, [])
+    with ResultReader(path) as reader:
+        assert len(reader) == 0 and list(reader) == []
+        assert reader.aggregate() == Tally()
+
+
+def test_aggregate(tmp_path):
+    path = tmp_path / "results.bin"
+    write_results(path, RECORDS)
+    with ResultReader(path) as reader:
+        assert reader.aggregate() == Tally(4, 3, 5)
+        assert reader.aggregate_by_team() == {
+            A: Tally(4, 3, 1),
+            B: Tally(0, 1, 7),
+            C: Tally(4, 0, 0),
+        }
+        assert reader.aggregate_by_team(mirror=False) == {
+            A: Tally(4, 3, 1),
+            B: Tally(0, 0, 4),
+        }
+
+
+def test_simulate_to_file(tmp_path):
+    path = tmp_path / "results.bin"
+    teams = [Team([Pet(stats=(3, 3))]), Team([Pet(stats=(1, 1))])]
+    write_results(path, iter_simulate([(teams[0], teams[1])] * 3, 4))
+    with ResultReader(path) as reader:
+        assert reader.aggregate() == Tally(wins=12)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"SASX\x01\x00\x50\x00", b"SASR\x02\x00\x50\x00" + b"\x00" * 10],
+)
+def test_invalid_file(tmp_path, data):
+    path = tmp_path / "results.bin"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ResultReader(path)
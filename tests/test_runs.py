@@ -0,0 +1,65 @@
+import pytest
+
+from superautosim.rand import RandStream
+from superautosim.runs import (
+    STARTING_LIVES,
+    TROPHIES_TO_WIN,
+    RunEngine,
+    RunResult,
+    greedy_policy,
+    lives_lost,
+    run_rollouts,
+)
+from superautosim.shop import FoodDefinition, Shop, ShopTables
+
+FOODS = [FoodDefinition("apple", 1, 1, 1)]
+
+
+def idle_policy(shop: Shop):
+    pass
+
+
+def test_lives_lost():
+    assert [lives_lost(turn) for turn in (1, 2, 3, 4, 5, 20)] == [1, 1, 2, 2, 3, 3]
+
+
+def test_run_engine_idle_draws(pet_library):
+    engine = RunEngine(ShopTables(pet_library), idle_policy)
+    result = engine.play(0, max_turns=7)
+    assert result == RunResult(0, 0, STARTING_LIVES, 7)
+    assert not result.won
+
+
+def test_run_engine_deterministic(pet_library):
+    engine = RunEngine(ShopTables(pet_library, FOODS), greedy_policy, seed=3)
+    first = [engine.play(run_id) for run_id in range(5)]
+    # Reusing the engine's shops and pools gives the same runs
+    assert [engine.play(run_id) for run_id in range(5)] == first
+    other = RunEngine(ShopTables(pet_library, FOODS), greedy_policy, seed=3)
+    assert other.play(2) == first[2]
+    for result in first:
+        assert result.won or result.lives == 0 or result.turns == 30
+        assert 0 <= result.trophies <= TROPHIES_TO_WIN
+
+
+def test_greedy_policy_spends_gold(pet_library):
+    shop = Shop(ShopTables(pet_library, FOODS), RandStream(0))
+    shop.start_turn()
+    greedy_policy(shop)
+    # Three pets were bought, some may have merged
+    assert sum(1 + pet.experience for pet in shop.team.pets) == 3
+    assert shop.gold < 3
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_run_rollouts(pet_library, max_workers):
+    report = run_rollouts(
+        pet_library, greedy_policy, 6, seed=1, foods=FOODS, max_workers=max_workers
+    )
+    assert [result.run_id for result in report.results] == list(range(6))
+    engine = RunEngine(ShopTables(pet_library, FOODS), greedy_policy, seed=1)
+    assert report.results == [engine.play(run_id) for run_id in range(6)]
+    assert report.wall_time > 0
+    assert report.seconds_per_thousand == pytest.approx(report.wall_time * 1000 / 6)
+    assert 0 <= report.win_rate <= 1
+    assert report.mean_trophies >= 0
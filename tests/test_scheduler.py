@@ -0,0 +1,132 @@
+from superautosim.abilities import Ability
+from superautosim.actions import Action
+from superautosim.events import EventPool, EventType
+from superautosim.pets import Pet
+from superautosim.scheduler import EventScheduler
+from superautosim.teams import Team
+from superautosim.triggers import TypeTrigger
+
+
+class RecordingAction(Action):
+    def __init__(self, log, follow_up=None):
+        self.log = log
+        self.follow_up = follow_up
+
+    def run(self, level, event, rand, owner=None):
+        self.log.append((owner, event.type))
+        if self.follow_up is not None:
+            event.scheduler.schedule(self.follow_up, owner)
+
+    def to_dict(self):
+        return {}
+
+
+class SnipeAction(Action):
+    def __init__(self, target):
+        self.target = target
+
+    def run(self, level, event, rand, owner=None):
+        self.target.take_damage(self.target.health)
+        event.scheduler.schedule(EventType.FAINT, self.target)
+
+    def to_dict(self):
+        return {}
+
+
+def make_pet(stats, ability):
+    pet = Pet(stats=stats)
+    pet.ability = ability
+    return pet
+
+
+def test_scheduler_priority_order():
+    log = []
+    ability = Ability(TypeTrigger(EventType.START_OF_BATTLE), RecordingAction(log))
+    weak = make_pet((1, 1), ability)
+    strong = make_pet((5, 1), ability)
+    tough = make_pet((1, 5), ability)
+    enemy_tie = make_pet((1, 1), ability)
+    scheduler = EventScheduler(
+        (Team([weak, None, strong]), Team([tough, enemy_tie])), lambda: 0.5
+    )
+    scheduler.schedule(EventType.START_OF_BATTLE)
+
+    assert scheduler.run() == 4
+    assert [owner for owner, _ in log] == [strong, tough, weak, enemy_tie]
+
+
+def test_scheduler_untriggered_and_missing_abilities():
+    log = []
+    ability = Ability(TypeTrigger(EventType.SELL), RecordingAction(log))
+    scheduler = EventScheduler((Team([make_pet((1, 1), ability), Pet()]),), lambda: 0.5)
+    scheduler.schedule(EventType.START_OF_BATTLE)
+
+    assert scheduler.run() == 0
+    assert log == []
+
+
+def test_scheduler_follow_up_batches():
+    log = []
+    starter = RecordingAction(log, follow_up=EventType.HURT)
+    start_ability = Ability(TypeTrigger(EventType.START_OF_BATTLE), starter)
+    hurt_ability = Ability(TypeTrigger(EventType.HURT), RecordingAction(log))
+    first = make_pet((1, 1), start_ability)
+    second = make_pet((2, 2), start_ability)
+    listener = make_pet((9, 9), hurt_ability)
+    pool = EventPool()
+    scheduler = EventScheduler(
+        (Team([first, second, listener]),), lambda: 0.5, pool=pool
+    )
+    scheduler.schedule(EventType.START_OF_BATTLE)
+
+    assert scheduler.run() == 4
+    assert log == [
+        (second, EventType.START_OF_BATTLE),
+        (first, EventType.START_OF_BATTLE),
+        (listener, EventType.HURT),
+        (listener, EventType.HURT),
+    ]
+    assert len(pool) == 2
+
+
+def test_scheduler_skips_sniped_pets():
+    log = []
+    start_log = Ability(TypeTrigger(EventType.START_OF_BATTLE), RecordingAction(log))
+    faint_log = Ability(TypeTrigger(EventType.FAINT), RecordingAction(log))
+    victim = make_pet((1, 1), start_log)
+    removed = make_pet((1, 1), start_log)
+    bystander = make_pet((1, 1), faint_log)
+    enemy_team = Team([victim, removed, bystander])
+    sniper = make_pet(
+        (9, 9), Ability(TypeTrigger(EventType.START_OF_BATTLE), SnipeAction(victim))
+    )
+
+    class RemoveAction(RecordingAction):
+        def run(self, level, event, rand, owner=None):
+            enemy_team.remove_pet(removed)
+
+    remover = make_pet(
+        (8, 8), Ability(TypeTrigger(EventType.START_OF_BATTLE), RemoveAction(log))
+    )
+    scheduler = EventScheduler((Team([sniper, remover]), enemy_team), lambda: 0.5)
+    scheduler.schedule(EventType.START_OF_BATTLE)
+
+    assert scheduler.run() == 3
+    # The victim faints before its turn, the bystander still sees the faint
+    assert log == [(bystander, EventType.FAINT)]
+
+
+def test_scheduler_runs_own_faint_of_fainted_pet():
+    log = []
+    victim = make_pet(
+        (1, 1), Ability(TypeTrigger(EventType.FAINT), RecordingAction(log))
+    )
+    fainted = make_pet(
+        (1, 0), Ability(TypeTrigger(EventType.FAINT), RecordingAction(log))
+    )
+    scheduler = EventScheduler((Team([victim, fainted]),), lambda: 0.5)
+    victim.take_damage(1)
+    scheduler.schedule(EventType.FAINT, victim)
+
+    assert scheduler.run() == 1
+    assert log == [(victim, EventType.FAINT)]
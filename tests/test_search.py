@@ -0,0 +1,62 @@
+import pytest
+
+from superautosim.library import Library
+from superautosim.pets import Pet
+from superautosim.search import FitnessEvaluator, beam_search, build_team
+from superautosim.teams import Team
+
+LIBRARY = Library.from_dict(
+    {
+        "pets": [
+            {"name": "ant", "tier": 1, "attack": 2, "health": 1},
+            {"name": "fish", "tier": 1, "attack": 2, "health": 3},
+            {"name": "giraffe", "tier": 3, "attack": 2, "health": 4},
+        ]
+    }
+)
+
+
+def test_build_team():
+    team = build_team(LIBRARY, ["fish", "ant"])
+    assert [pet.name for pet in team.pets] == ["fish", "ant"]
+    assert team[0].stats == (2, 3, 0, 0)
+
+
+def test_fitness_evaluator_cache():
+    opponents = [Team([Pet(stats=(2, 2))]), Team([Pet(stats=(1, 10))])]
+    evaluator = FitnessEvaluator(opponents, battles=3, max_workers=0)
+    teams = [build_team(LIBRARY, ["fish"]), build_team(LIBRARY, ["ant"])]
+    assert evaluator.evaluate(teams) == [0.5, 0.25]
+    assert (evaluator.hits, evaluator.misses) == (0, 2)
+
+    assert evaluator.evaluate([build_team(LIBRARY, ["fish"])] * 2) == [0.5, 0.5]
+    assert (evaluator.hits, evaluator.misses) == (2, 2)
+    assert len(evaluator) == 2
+
+
+def test_fitness_evaluator_parallel():
+    opponents = [Team([Pet(stats=(2, 2))])]
+    teams = [build_team(LIBRARY, names) for names in (["ant"], ["fish", "ant"])]
+    expected = FitnessEvaluator(opponents, 2, max_workers=0).evaluate(teams)
+    with FitnessEvaluator(opponents, 2, max_workers=2) as evaluator:
+        assert evaluator.evaluate(teams) == expected
+
+
+def test_fitness_evaluator_no_opponents():
+    with pytest.raises(ValueError):
+        FitnessEvaluator([], 1)
+
+
+def test_beam_search():
+    opponents = [Team([Pet(stats=(2, 4))])]
+    evaluator = FitnessEvaluator(opponents, battles=1, max_workers=0)
+    result = beam_search(LIBRARY, evaluator, beam_width=2, max_tier=1, max_pets=3)
+    assert result.fitness == 1.0
+    assert "giraffe" not in result.names
+    assert [pet.name for pet in result.team.pets] == list(result.names)
+    # Smallest winning team is preferred
+    assert len(result.names) == 2
+    assert result.evaluated == len(evaluator)
+
+    with pytest.raises(ValueError):
+        beam_search(LIBRARY, evaluator, max_tier=0)
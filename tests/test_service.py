@@ -0,0 +1,241 @@
+import asyncio
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from superautosim.encoding import encode_team
+from superautosim.montecarlo import simulate
+from superautosim.pets import Pet
+from superautosim.service import (
+    MAX_BATTLES,
+    RESPONSE_HEADER,
+    STATUS_ERROR,
+    MatchupClient,
+    MatchupServer,
+    ServiceError,
+)
+from superautosim.teams import Team
+
+EMPTY = encode_team(Team())
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Thread pool whose work waits until the gate is open"""
+
+    def __init__(self):
+        super().__init__(1)
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def submit(self, fn, /, *args, **kwargs):
+        def gated():
+            self.gate.wait()
+            return fn(*args, **kwargs)
+
+        return super().submit(gated)
+
+
+def serve(test, **kwargs):
+    """Run the async test with a started server and a connected client"""
+
+    async def main():
+        kwargs.setdefault("executor", ThreadPoolExecutor(2))
+        kwargs.setdefault("max_workers", 2)
+        server = MatchupServer(**kwargs)
+        await server.start()
+        host, port = server.address[:2]
+        client = await MatchupClient.connect(host, port)
+        try:
+            await test(server, client)
+        finally:
+            await client.close()
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_service_evaluate(mosquito_team, opponents):
+    async def test(server, client):
+        tally = await client.evaluate(mosquito_team(), opponents[0], 50, seed=2)
+        assert tally == simulate(mosquito_team(), opponents[0], 50, 2)
+        assert await client.evaluate(mosquito_team(), opponents[0], 50, 2) == tally
+        assert (server.hits, server.misses) == (1, 1)
+
+    serve(test)
+
+
+def test_service_negative_seed(mosquito_team, opponents):
+    async def test(server, client):
+        tally = await client.evaluate(mosquito_team(), opponents[0], 20, seed=-7)
+        assert tally == simulate(mosquito_team(), opponents[0], 20, -7)
+        with pytest.raises(ValueError):
+            await client.evaluate(Team(), Team(), 1, seed=1 << 63)
+        with pytest.raises(ValueError):
+            await server.evaluate(EMPTY, EMPTY, 1, seed=-(1 << 63) - 1)
+
+    serve(test)
+
+
+def test_service_returns_copies():
+    async def test(server, client):
+        team = encode_team(Team([Pet()]))
+        first, coalesced = await asyncio.gather(
+            server.evaluate(team, EMPTY, 4), server.evaluate(team, EMPTY, 4)
+        )
+        assert first is not coalesced
+        first.wins = 0
+        cached = await server.evaluate(team, EMPTY, 4)
+        assert cached.wins == coalesced.wins == 4
+        cached.wins = 0
+        assert (await server.evaluate(team, EMPTY, 4)).wins == 4
+
+    serve(test)
+
+
+def test_service_process_pool(mosquito_team, opponents):
+    async def test(server, client):
+        tally = await client.evaluate(mosquito_team(), opponents[1], 20)
+        assert tally == simulate(mosquito_team(), opponents[1], 20)
+
+    serve(test, executor=None, max_workers=1)
+
+
+def test_service_unix_socket(tmp_path):
+    async def main():
+        server = MatchupServer(max_workers=1, executor=ThreadPoolExecutor(1))
+        path = str(tmp_path / "matchups.sock")
+        await server.start(path=path)
+        async with await MatchupClient.connect(path=path) as client:
+            tally = await client.evaluate(Team([Pet()]), Team(), 3)
+        await server.close()
+        return tally
+
+    assert asyncio.run(main()).wins == 3
+
+
+def test_service_single_flight(mosquito_team, opponents):
+    async def test(server, client):
+        team_a, team_b = encode_team(mosquito_team()), encode_team(opponents[0])
+        tallies = await asyncio.gather(
+            *(server.evaluate(team_a, team_b, 30) for _ in range(10))
+        )
+        assert all(tally == tallies[0] for tally in tallies)
+        assert (server.misses, server.coalesced) == (1, 9)
+
+    serve(test)
+
+
+def test_service_errors():
+    async def test(server, client):
+        with pytest.raises(ServiceError):
+            await client.evaluate(b"not a team", encode_team(Team()), 1)
+        # The connection is still usable after a failed request
+        assert (await client.evaluate(Team(), Team(), 2)).draws == 2
+
+        reader, writer = await asyncio.open_connection(*server.address[:2])
+        writer.write(struct.pack("!4sIqII", b"NOPE", 1, 0, 0, 0))
+        response = await reader.readexactly(RESPONSE_HEADER.size)
+        assert RESPONSE_HEADER.unpack(response)[0] == STATUS_ERROR
+        writer.close()
+
+        # Too many battles is an error, but the connection stays usable
+        with pytest.raises(ServiceError, match="battles"):
+            await client.evaluate(Team(), Team(), MAX_BATTLES + 1)
+        assert (await client.evaluate(Team(), Team(), 1)).draws == 1
+
+    serve(test)
+
+
+def distinct_requests(server, count):
+    return [
+        asyncio.create_task(
+            server.evaluate(encode_team(Team([Pet(stats=(i, i))])), EMPTY, 5)
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def test_service_bounded_queue():
+    async def main():
+        executor = GatedExecutor()
+        server = MatchupServer(
+            max_workers=1, max_pending=1, executor=executor, max_batch_size=1
+        )
+        await server.start()
+        executor.gate.clear()
+        tasks = distinct_requests(server, 3)
+        await asyncio.sleep(0.05)
+        # One request is with the blocked worker, one fills the queue and the
+        # last waits for queue space
+        assert server.misses == 3 and server._queue.full()
+        assert not any(task.done() for task in tasks)
+        executor.gate.set()
+        tallies = await asyncio.gather(*tasks)
+        await server.close()
+        return tallies
+
+    assert [tally.wins for tally in asyncio.run(main())] == [5, 5, 5]
+
+
+def test_service_close_fails_pending():
+    async def main():
+        executor = GatedExecutor()
+        server = MatchupServer(max_workers=1, max_pending=1, executor=executor)
+        await server.start()
+        executor.gate.clear()
+        tasks = distinct_requests(server, 2)
+        await asyncio.sleep(0.05)
+        await server.close()
+        executor.gate.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ServiceError) for result in results)
+
+
+def test_service_cancelled_put_fails_coalesced():
+    async def main():
+        executor = GatedExecutor()
+        server = MatchupServer(
+            max_workers=1, max_pending=1, executor=executor, max_batch_size=1
+        )
+        await server.start()
+        executor.gate.clear()
+        distinct_requests(server, 2)
+        await asyncio.sleep(0.05)
+        team = encode_team(Team([Pet(stats=(9, 9))]))
+        first = asyncio.create_task(server.evaluate(team, EMPTY, 5))
+        await asyncio.sleep(0.01)
+        coalesced = asyncio.create_task(server.evaluate(team, EMPTY, 5))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await asyncio.gather(coalesced, return_exceptions=True)
+        executor.gate.set()
+        await server.close()
+        return result[0]
+
+    assert isinstance(asyncio.run(main()), ServiceError)
+
+
+def test_service_micro_batches(opponents):
+    async def test(server, client):
+        requests = [
+            server.evaluate(
+                encode_team(Team([Pet(stats=(i, i))])), encode_team(team), 5
+            )
+            for i in range(1, 21)
+            for team in opponents
+        ]
+        tallies = await asyncio.gather(*requests)
+        assert server.misses == len(requests) == len(tallies)
+        assert server.batches < len(requests)
+
+    serve(test, max_batch_size=8, max_wait=0.05)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_batch_size": 0}, {"max_wait": -1}])
+def test_service_invalid_batching(kwargs):
+    with pytest.raises(ValueError):
+        MatchupServer(**kwargs)
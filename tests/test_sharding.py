@@ -0,0 +1,111 @@
+import socket
+import threading
+
+import pytest
+
+from superautosim.encoding import encode_team
+from superautosim.montecarlo import Tally, simulate
+from superautosim.pets import Pet
+from superautosim.sharding import (
+    Coordinator,
+    LocalCluster,
+    ShardError,
+    matchup_key,
+    recv_frame,
+    send_frame,
+    shard_of,
+)
+from superautosim.teams import Team
+
+
+@pytest.fixture
+def matchups(mosquito_team, opponents):
+    return [
+        (mosquito_team(), opponents[0]),
+        (mosquito_team(2, 1), opponents[1]),
+        *((Team([Pet(stats=(i, i))]), opponents[i % 2]) for i in range(1, 9)),
+    ]
+
+
+@pytest.fixture(scope="module")
+def cluster():
+    with LocalCluster(2) as cluster:
+        yield cluster
+
+
+def expected_tallies(matchups, battles, seed):
+    return [simulate(a, b, battles, seed) for a, b in matchups]
+
+
+def dead_address():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[:2]
+
+
+def flaky_worker():
+    """A worker that accepts one shard and drops the connection"""
+    server = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        with server:
+            conn, _ = server.accept()
+            with conn:
+                recv_frame(conn)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server.getsockname()[:2]
+
+
+def test_shard_of():
+    assert shard_of(0, 4) == 0
+    assert shard_of(2**64 - 1, 4) == 3
+    assert shard_of(2**62, 4) == 1
+    key = matchup_key(b"a", b"bc")
+    assert 0 <= key < 2**64 and key != matchup_key(b"ab", b"c")
+
+
+def test_frames():
+    left, right = socket.socketpair()
+    with left, right:
+        send_frame(left, (1, [b"team", (2, 3)]))
+        assert recv_frame(right) == (1, [b"team", (2, 3)])
+        left.close()
+        with pytest.raises(ConnectionError):
+            recv_frame(right)
+
+
+def test_coordinator(cluster, matchups):
+    coordinator = Coordinator(cluster.addresses)
+    result = coordinator.run(matchups, 20, seed=4, shards=5)
+    assert result.tallies == expected_tallies(matchups, 20, 4)
+    assert result.retries == 0 and result.shards <= 5
+    assert result.total.total == 20 * len(matchups)
+
+
+def test_coordinator_retries_lost_workers(cluster, matchups):
+    workers = [flaky_worker(), dead_address(), *cluster.addresses]
+    result = Coordinator(workers, timeout=5).run(matchups, 10, seed=1)
+    assert result.tallies == expected_tallies(matchups, 10, 1)
+    assert result.retries >= 1
+
+
+def test_coordinator_all_workers_lost(matchups):
+    with pytest.raises(ShardError):
+        Coordinator([dead_address()]).run(matchups, 1)
+    with pytest.raises(ShardError):
+        Coordinator([flaky_worker()], max_retries=0).run(matchups, 1)
+
+
+def test_coordinator_invalid_team(cluster):
+    matchups = [(b"invalid", encode_team(Team()))]
+    with pytest.raises(ShardError):
+        Coordinator(cluster.addresses).run(matchups, 1)
+    assert Coordinator(cluster.addresses).run([], 1).tallies == []
+
+
+def test_local_cluster_kill(matchups):
+    with LocalCluster(2) as cluster:
+        cluster.kill(0)
+        result = Coordinator(cluster.addresses).run(matchups[:3], 5)
+        assert result.tallies == [simulate(a, b, 5) for a, b in matchups[:3]]
+        assert result.total == sum(result.tallies, Tally())
@@ -0,0 +1,158 @@
+from collections import Counter
+
+import pytest
+
+from superautosim.abilities import Ability
+from superautosim.actions import SummonAction
+from superautosim.events import EventType
+from superautosim.pets import Pet, PetPool
+from superautosim.rand import RandStream
+from superautosim.shop import (
+    LEVEL_EXPERIENCE,
+    STARTING_GOLD,
+    AliasTable,
+    FoodDefinition,
+    Shop,
+    ShopTables,
+)
+from superautosim.teams import Team
+from superautosim.triggers import TypeTrigger
+
+FOODS = [FoodDefinition("apple", 1, 1, 1), FoodDefinition("cupcake", 2, 3, 3, True)]
+
+
+@pytest.fixture
+def shop(pet_library):
+    shop = Shop(ShopTables(pet_library, FOODS), RandStream(1))
+    shop.start_turn()
+    return shop
+
+
+def test_alias_table_distribution():
+    table = AliasTable(["a", "b", "c"], [1, 2, 5])
+    stream = RandStream(0)
+    counts = Counter(table.draw(stream()) for _ in range(8000))
+    assert counts["a"] == pytest.approx(1000, rel=0.15)
+    assert counts["b"] == pytest.approx(2000, rel=0.15)
+    assert counts["c"] == pytest.approx(5000, rel=0.15)
+    assert table.draw(1 - 2**-53) in table.items
+
+
+@pytest.mark.parametrize(
+    ["items", "weights"],
+    [([], None), (["a", "b"], [1]), (["a", "b"], [-1, 2]), (["a", "b"], [0, 0])],
+)
+def test_alias_table_invalid(items, weights):
+    with pytest.raises(ValueError):
+        AliasTable(items, weights)
+
+
+def test_shop_tables(pet_library):
+    tables = ShopTables(pet_library, FOODS)
+    assert {pool.prototype.name for pool in tables.pet_tables[1].items} == {
+        "ant",
+        "fish",
+    }
+    assert len(tables.pet_tables[3]) == 3
+    assert [food.name for food in tables.food_tables[1].items] == ["apple"]
+
+
+def test_shop_turns(pet_library):
+    shop = Shop(ShopTables(pet_library, FOODS), RandStream(1))
+    for turn, tier, pet_slots in [(1, 1, 3), (3, 2, 3), (5, 3, 4), (9, 5, 5)]:
+        while shop.turn < turn:
+            shop.end_turn()
+            shop.start_turn()
+        assert (shop.tier, shop.gold) == (tier, STARTING_GOLD)
+        assert len(shop.pets) == pet_slots
+        assert Shop.tier_for_turn(20) == 6
+
+
+def test_shop_roll(shop):
+    before = list(shop.pets)
+    assert shop.roll()
+    assert shop.gold == STARTING_GOLD - 1
+    assert all(pet is not None for pet in shop.pets)
+    # Rolled away pets are reused
+    assert set(map(id, shop.pets)) & set(map(id, before))
+    shop.gold = 0
+    assert not shop.roll()
+
+
+def test_shop_buy_and_sell(shop):
+    pet = shop.pets[0]
+    assert shop.buy_pet(0, 0)
+    assert shop.team[0] is pet and shop.pets[0] is None
+    assert shop.gold == STARTING_GOLD - 3
+    assert not shop.buy_pet(0, 1)
+
+    assert shop.sell(0)
+    assert shop.gold == STARTING_GOLD - 2
+    assert shop.team.pets == []
+    assert not shop.sell(0)
+
+
+def test_shop_merge_levels_up(pet_library):
+    shop = Shop(ShopTables(pet_library), RandStream(0), Team([Pet()]))
+    shop.start_turn()
+    events = []
+    shop._scheduler.schedule = lambda type_, pet=None: events.append(type_)
+    target = shop.team[0]
+    target.name = "ant"
+    for exp in range(1, LEVEL_EXPERIENCE[-1] + 1):
+        shop.pets = [shop.tables.pet_pools["ant"].acquire()]
+        shop._pools = [shop.tables.pet_pools["ant"]]
+        shop.gold = 3
+        assert shop.buy_pet(0, 0)
+        assert target.experience == exp
+    assert target.level == 3 and target.stats[:2] == (6, 6)
+    assert events.count(EventType.LEVEL_UP) == 2
+    shop.pets = [shop.tables.pet_pools["ant"].acquire()]
+    shop.gold = 3
+    assert not shop.buy_pet(0, 0)
+
+
+def test_shop_buy_food(shop):
+    pet = shop.pets[0]
+    shop.buy_pet(0, 0)
+    assert shop.foods[0].name == "apple"
+    assert shop.buy_food(0, 0)
+    assert pet.attack == shop.tables.pet_pools[pet.name].prototype.attack + 1
+    assert not shop.buy_food(0, 0)
+    assert not shop.buy_food(0, 1)
+
+
+@pytest.mark.parametrize("index", [-1, 5, 100])
+def test_shop_invalid_indexes(shop, index):
+    shop.buy_pet(0, 0)
+    team, pets, foods = shop.team.pets, list(shop.pets), list(shop.foods)
+    assert not shop.buy_pet(1, index)
+    assert not shop.buy_pet(index, 1)
+    assert not shop.buy_food(0, index)
+    assert not shop.buy_food(index, 0)
+    assert not shop.sell(index)
+    assert (shop.team.pets, shop.pets, shop.foods) == (team, pets, foods)
+    assert shop.gold == STARTING_GOLD - 3
+
+
+def test_shop_temp_stats_end_with_turn(shop):
+    pet = shop.pets[0]
+    shop.buy_pet(0, 0)
+    pet.add_stats(2, 3, temp_stats=True)
+    stats = pet.stats
+    shop.end_turn()
+    assert pet.stats == (*stats[:2], 0, 0)
+    assert (pet.attack, pet.health) == stats[:2]
+
+
+def test_shop_end_turn_forgets_summons(pet_library):
+    summoner = Pet()
+    summoner.ability = Ability(
+        TypeTrigger(EventType.END_OF_TURN), SummonAction(PetPool(Pet("zombie")))
+    )
+    shop = Shop(ShopTables(pet_library, FOODS), RandStream(1), Team([summoner]))
+    for _ in range(3):
+        shop.start_turn()
+        shop.end_turn()
+        assert shop._scheduler.summons == {}
+    assert [pet.name for pet in shop.team.pets] == ["zombie"] * 3 + [""]
@@ -106,3 +106,32 @@ def test_validate_index(friendly_team: Team):
         friendly_team._validate_index(friendly_team.MAX_TEAM_SIZE)
     for i in range(friendly_team.MAX_TEAM_SIZE):
         friendly_team._validate_index(i)
+
+
+def test_team_version():
+    team = Team([Pet(), None, Pet(), None, Pet()])
+    assert team.version == 0
+    assert team.insert_pet(Pet(), 1)
+    assert team.summon_pet(Pet(), 0)
+    assert team.version == 2
+    assert not team.insert_pet(Pet(), 0)
+    assert team.version == 2
+
+
+def test_team_mutations():
+    team = Team([Pet(), None])
+    mutations = Team.mutations
+    team.insert_pet(Pet(), 1)
+    team.remove_pet(team[0])
+    Team([Pet()]).summon_pet(Pet(), 0)
+    assert Team.mutations == mutations + 3
+
+
+def test_team_remove_pet():
+    pets = [Pet(), Pet(), Pet()]
+    team = Team(pets)
+    assert team.remove_pet(pets[1]) == 1
+    assert team._slots == [pets[0], None, pets[2], None, None]
+    assert team.version == 1
+    with pytest.raises(ValueError):
+        team.remove_pet(pets[1])
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from superautosim.encoding import team_digest
+from superautosim.montecarlo import Tally, simulate
+from superautosim.pets import Pet
+from superautosim.teams import Team
+from superautosim.tournament import iter_tournament_records, tournament, unique_teams
+
+
+@pytest.fixture
+def teams(make_pet, mosquito):
+    return [
+        Team([Pet(stats=(3, 3))]),
+        Team([Pet(stats=(1, 2)), Pet(stats=(1, 1))]),
+        Team([Pet(stats=(3, 3))]),
+        Team([make_pet((1, 1), mosquito)]),
+    ]
+
+
+def test_unique_teams(teams):
+    unique, index_of = unique_teams(teams)
+    assert unique == [teams[0], teams[1], teams[3]]
+    assert index_of == [0, 1, 0, 2]
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_tournament(teams, max_workers):
+    cells = []
+    result = tournament(
+        teams,
+        20,
+        seed=3,
+        max_workers=max_workers,
+        on_result=lambda *cell: cells.append(cell),
+    )
+    assert len(cells) == len(teams) ** 2
+    assert {(i, j) for i, j, _ in cells} == {
+        (i, j) for i in range(len(teams)) for j in range(len(teams))
+    }
+    for i, team_a in enumerate(teams):
+        for j, team_b in enumerate(teams):
+            tally = result.matrix[i][j]
+            assert tally.total == 20
+            assert tally == result.matrix[j][i].mirrored() or i == j
+    assert result.matrix[0][1] == simulate(teams[0], teams[1], 20, seed=3)
+    assert result.matrix[3][1] == simulate(teams[1], teams[3], 20, 3).mirrored()
+    assert result.matrix[0][2] == result.matrix[0][0]
+    assert len(result.scores()) == len(teams)
+
+
+def test_tournament_executor(teams):
+    with ThreadPoolExecutor(2) as executor:
+        result = tournament(teams, 5, executor=executor)
+    assert result.matrix == tournament(teams, 5, max_workers=0).matrix
+    assert result.matrix[1][1] == Tally(draws=5)
+
+
+def test_iter_tournament_records(teams):
+    result = tournament(teams, 20, seed=3, max_workers=0)
+    records = list(iter_tournament_records(teams, 20, seed=3, max_workers=0))
+    assert len(records) == 6
+    digests = [team_digest(team) for team in teams]
+    for record in records:
+        i, j = digests.index(record.team_a), digests.index(record.team_b)
+        assert record.seed == 3
+        assert record.tally == result.matrix[i][j]
@@ -0,0 +1,60 @@
+import pytest
+
+from superautosim.battle import Battle
+from superautosim.events import EventType
+from superautosim.pets import Pet
+from superautosim.teams import Team
+from superautosim.tracing import TraceEntry, TraceKind, TraceRecorder
+
+
+def test_recorder_ring_buffer():
+    trace = TraceRecorder(capacity=3)
+    pet = Pet("ant", (2, 1))
+    for turn in range(5):
+        trace.turn = turn
+        trace.record(TraceKind.TURN, value=turn)
+    assert len(trace) == 3 and trace.dropped == 2
+    assert [entry.value for entry in trace.decode()] == [2, 3, 4]
+
+    trace.record(TraceKind.EVENT, EventType.HURT, pet)
+    pet.take_damage(1)
+    assert trace.decode()[-1] == TraceEntry(
+        TraceKind.EVENT, 4, EventType.HURT, "ant<2-1>", 0
+    )
+    trace.clear()
+    assert len(trace) == 0 and trace.records() == []
+
+
+def test_recorder_invalid_capacity():
+    with pytest.raises(ValueError):
+        TraceRecorder(capacity=0)
+
+
+def test_battle_trace(make_pet, mosquito):
+    pet = make_pet((1, 2), mosquito)
+    pet.name = "mosquito"
+    enemy = Pet("ant", (1, 1))
+    trace = TraceRecorder()
+    battle = Battle(Team([pet]), Team([enemy]), trace=trace)
+    battle.run()
+    assert trace.format().splitlines() == [
+        "turn 0 EVENT START_OF_BATTLE",
+        "turn 0 TRIGGER START_OF_BATTLE mosquito<1-2>",
+        "turn 0 TARGET START_OF_BATTLE ant<1-1>",
+        "turn 0 EVENT FAINT ant<1-0>",
+        "turn 0 REMOVE ant<1-0>",
+    ]
+
+
+def test_battle_trace_does_not_change_result(make_pet, mosquito):
+    team_a = Team([make_pet((1, 2), mosquito), Pet(stats=(2, 2))])
+    team_b = Team([Pet(stats=(1, 1)), Pet(stats=(2, 3))])
+    for battle_id in range(10):
+        trace = TraceRecorder(capacity=8)
+        traced = Battle(team_a, team_b, battle_id=battle_id, trace=trace)
+        untraced = Battle(team_a, team_b, battle_id=battle_id)
+        assert traced.run() == untraced.run()
+        assert traced.turns == untraced.turns
+        # Only the end of the battle is kept, the last fainted pet's removal
+        assert len(trace) == 8 and trace.dropped > 0
+        assert trace.decode()[-1].kind is TraceKind.REMOVE
@@ -741,3 +741,28 @@ class CompoundTriggerTestCase(TestCase):
         self.assertTrue(trigger.is_triggered(event, self.pet2))
         self.assertFalse(trigger.is_triggered(event, self.pet3))
         self.assertFalse(trigger.is_triggered(event, self.pet3))
+
+    def test_counters_shared_trigger(self):
+        """Stateful triggers keep state in the given counters, per owner"""
+        limit = LimitTrigger(AlwaysTrigger(), n=2, reset_event=EventType.START_OF_TURN)
+        count = CountTrigger(AlwaysTrigger(), n=2, reset_event=EventType.START_OF_TURN)
+        counters1, counters2 = {}, {}
+        event = Event(EventType.NONE)
+        reset_event = Event(EventType.START_OF_TURN)
+
+        self.assertFalse(count.is_triggered(event, self.pet1, counters1))
+        self.assertFalse(count.is_triggered(event, self.pet2, counters2))
+        self.assertTrue(count.is_triggered(event, self.pet1, counters1))
+        self.assertEqual({count: 0}, counters1)
+        self.assertEqual({count: 1}, counters2)
+
+        for _ in range(2):
+            self.assertTrue(limit.is_triggered(event, self.pet1, counters1))
+        self.assertFalse(limit.is_triggered(event, self.pet1, counters1))
+        self.assertTrue(limit.is_triggered(event, self.pet2, counters2))
+        self.assertEqual({count: 0, limit: 0}, counters1)
+        self.assertEqual({count: 1, limit: 1}, counters2)
+        self.assertTrue(limit.is_triggered(reset_event, self.pet1, counters1))
+
+        # The triggers' own state is untouched
+        self.assertEqual((2, 0), (limit.remaining_limit, count.count))
@@ -1,8 +1,9 @@
+from enum import Enum
 from itertools import combinations
 
 import pytest
 
-from superautosim.utils import nth_combination
+from superautosim.utils import ClassMapMixin, get_member, nth_combination
 
 
 def test_nth_combination():
@@ -21,3 +22,48 @@ def test_nth_combination_index_error():
         expected = list(combinations(items, r))
         with pytest.raises(IndexError):
             nth_combination(items, r, len(expected))
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class LateMapped(ClassMapMixin[object], Enum):
+    FIRST = 1
+    SECOND = 2
+
+    @classmethod
+    def _get_mapping(cls):
+        return {cls.FIRST: A}
+
+
+class ValueMapped(ClassMapMixin[object], Enum):
+    FIRST = A
+    SECOND = B
+
+
+@pytest.mark.parametrize("enum", [LateMapped, ValueMapped])
+def test_class_map_mixin(enum):
+    assert enum.FIRST.to_class() is A
+    assert enum.from_class(A) is enum.FIRST
+    with pytest.raises(NotImplementedError):
+        enum.from_class(int)
+    # Mappings are built once per enum
+    assert enum._type_mapping() is enum._type_mapping()
+    assert LateMapped._type_mapping() is not ValueMapped._type_mapping()
+
+
+def test_class_map_mixin_unmapped():
+    with pytest.raises(NotImplementedError):
+        LateMapped.SECOND.to_class()
+    assert ValueMapped.SECOND.to_class() is B
+
+
+def test_get_member():
+    assert get_member(LateMapped, "FIRST") is LateMapped.FIRST
+    for name in ["first", "THIRD", None, 1, ["FIRST"]]:
+        assert get_member(LateMapped, name) is None